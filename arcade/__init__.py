@@ -166,6 +166,7 @@ def configure_logging(level: int | None = None):
 from .sprite import load_animated_gif
 from .sprite import AnimatedWalkingSprite
 from .sprite import TextureAnimation
+from .sprite import TextureAnimationScheduler
 from .sprite import TextureKeyframe
 from .sprite import PyMunk
 from .sprite import PymunkMixin
@@ -181,13 +182,19 @@ def configure_logging(level: int | None = None):
 from .sprite_list import check_for_collision
 from .sprite_list import check_for_collision_with_list
 from .sprite_list import check_for_collision_with_lists
+from .sprite_list import check_for_collision_between_lists
 from .sprite_list import get_closest_sprite
 from .sprite_list import get_sprites_at_exact_point
 from .sprite_list import get_sprites_at_point
 from .sprite_list import get_distance_between_sprites
 from .sprite_list import get_sprites_in_rect
+from .sprite_list import sweep_sprite
 
 from .sprite_list import SpatialHash
+from .sprite_list import AABBTree
+from .sprite_list import SpritePool
+from .sprite_list import SpriteStore
+from .sprite_list import SpriteView
 
 from .scene import Scene
 from .scene import SceneKeyError
@@ -206,7 +213,9 @@ def configure_logging(level: int | None = None):
 from .version import VERSION
 
 from .paths import has_line_of_sight
+from .paths import has_line_of_sight_many
 from .paths import AStarBarrierList
+from .paths import FlowField
 from .paths import astar_calculate_path
 
 from .context import ArcadeContext
@@ -256,6 +265,7 @@ def configure_logging(level: int | None = None):
     "AnimatedWalkingSprite",
     "TextureAnimationSprite",
     "TextureAnimation",
+    "TextureAnimationScheduler",
     "TextureKeyframe",
     "ArcadeContext",
     "ControllerManager",
@@ -263,6 +273,7 @@ def configure_logging(level: int | None = None):
     "FACE_LEFT",
     "FACE_RIGHT",
     "FACE_UP",
+    "FlowField",
     "MOUSE_BUTTON_LEFT",
     "MOUSE_BUTTON_MIDDLE",
     "MOUSE_BUTTON_RIGHT",
@@ -306,6 +317,7 @@ def configure_logging(level: int | None = None):
     "check_for_collision",
     "check_for_collision_with_list",
     "check_for_collision_with_lists",
+    "check_for_collision_between_lists",
     "close_window",
     "disable_timings",
     "draw_arc_filled",
@@ -344,6 +356,7 @@ def configure_logging(level: int | None = None):
     "get_display_size",
     "get_distance_between_sprites",
     "get_sprites_in_rect",
+    "sweep_sprite",
     "get_controllers",
     "get_game_controllers",
     "get_image",
@@ -354,12 +367,17 @@ def configure_logging(level: int | None = None):
     "get_sprites_at_exact_point",
     "get_sprites_at_point",
     "SpatialHash",
+    "AABBTree",
+    "SpritePool",
+    "SpriteStore",
+    "SpriteView",
     "get_timings",
     "create_text_sprite",
     "clear_timings",
     "get_window",
     "get_fps",
     "has_line_of_sight",
+    "has_line_of_sight_many",
     "load_animated_gif",
     "load_font",
     "load_sound",
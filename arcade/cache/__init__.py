@@ -4,6 +4,7 @@
 from .hit_box import HitBoxCache
 from .texture import TextureCache
 from .image_data import ImageDataCache
+from .disk import TextureDiskCache
 
 
 def crate_str_from_values(*args, sep: str = "_") -> str:
@@ -46,4 +47,5 @@ def crate_str_from_list(entries: list[Any], sep: str = "_") -> str:
     "crate_str_from_list",
     "crate_str_from_values",
     "ImageDataCache",
+    "TextureDiskCache",
 ]
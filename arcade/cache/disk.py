@@ -0,0 +1,236 @@
+"""
+A persistent cache for information about image files.
+
+Loading a texture means decoding the image, hashing all its pixels
+and calculating a hit box. Only the decoding is needed when the file
+has not changed since the last run. This cache keeps the image hash,
+the image size and the hit box points on disk so the rest can be
+skipped on the next start.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from arcade.types import Point2List
+
+
+class TextureDiskCache:
+    """
+    A cache stored on disk mapping image files to their hash, size and hit boxes.
+
+    Files are identified by their path, size and modification time. If any
+    of these change the cached entry for the file is ignored and replaced.
+    Hit boxes are stored by texture cache name, like in
+    :py:class:`~arcade.cache.HitBoxCache`, so there can be one per hit box
+    algorithm.
+
+    The cache is an SQLite database in the given directory.
+    Entries are written as soon as they are added. The cache can be
+    used from any thread.
+
+    Example::
+
+        cache = TextureDiskCache("~/.cache/my_game")
+        # Hash, width and height of the file, or None if unknown or changed
+        info = cache.get_image_info(path, arcade.texture.ImageData.hash_func)
+
+    Args:
+        path: The directory to store the cache in. It is created if it does not exist.
+    """
+
+    VERSION = 1
+    FILE_NAME = "textures.sqlite"
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path).expanduser()
+        self._path.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by all threads. The lock makes sure
+        # only one of them uses it at a time.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self._path / self.FILE_NAME, isolation_level=None, check_same_thread=False
+        )
+        # Commits do not need to wait for the disk. A crash may
+        # lose the latest entries, which are simply created again.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS images")
+            self._connection.execute("DROP TABLE IF EXISTS hit_boxes")
+            self._connection.execute(f"PRAGMA user_version={self.VERSION}")
+
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS images ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, "
+            "hash_func TEXT, hash TEXT, width INTEGER, height INTEGER)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS hit_boxes (name TEXT PRIMARY KEY, points BLOB)"
+        )
+
+    @property
+    def path(self) -> Path:
+        """The directory the cache is stored in."""
+        return self._path
+
+    def __len__(self) -> int:
+        """Return the number of image files in the cache."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    def get_image_info(
+        self, file_path: Path, hash_func: str, stat: os.stat_result | None = None
+    ) -> tuple[str, int, int] | None:
+        """
+        Get the hash, width and height of an image file.
+
+        Args:
+            file_path:
+                The path to the image file
+            hash_func:
+                The name of the hash function the hash must be created with
+            stat:
+                The result of ``os.stat`` for the file, if already known
+        Returns:
+            The hash, width and height, or ``None`` if the file is not
+            cached or changed since it was cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size, mtime, hash_func, hash, width, height FROM images WHERE path = ?",
+                (str(file_path),),
+            ).fetchone()
+        if row is None or row[2] != hash_func:
+            return None
+
+        if stat is None:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                return None
+        if (stat.st_size, stat.st_mtime_ns) != (row[0], row[1]):
+            return None
+        return row[3], row[4], row[5]
+
+    def put_image_info(
+        self,
+        file_path: Path,
+        hash_func: str,
+        hash: str,
+        width: int,
+        height: int,
+        stat: os.stat_result | None = None,
+    ) -> None:
+        """
+        Store the hash, width and height of an image file.
+
+        The file is identified by the size and modification time in ``stat``.
+        Pass the result of ``os.stat`` from before the file was read, so a
+        file changed while it was being read is not stored as unchanged.
+        Without it the file is checked when storing.
+
+        Args:
+            file_path:
+                The path to the image file
+            hash_func:
+                The name of the hash function the hash was created with
+            hash:
+                The hash of the image
+            width:
+                The width of the image
+            height:
+                The height of the image
+            stat:
+                The result of ``os.stat`` for the file before it was read
+        """
+        self.put_image_infos([(file_path, hash_func, hash, width, height, stat)])
+
+    def put_image_infos(
+        self, infos: Iterable[tuple[Path, str, str, int, int, os.stat_result | None]]
+    ) -> None:
+        """
+        Store the info of several image files at once.
+
+        Args:
+            infos: Tuples of arguments for :py:meth:`put_image_info`
+        """
+        rows = []
+        for file_path, hash_func, hash, width, height, stat in infos:
+            if stat is None:
+                stat = os.stat(file_path)
+            rows.append(
+                (str(file_path), stat.st_size, stat.st_mtime_ns, hash_func, hash, width, height)
+            )
+
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def get_hit_box(self, name: str) -> Point2List | None:
+        """
+        Get the hit box points for a texture cache name.
+
+        Args:
+            name: The cache name of the texture
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT points FROM hit_boxes WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        values = array("d")
+        values.frombytes(row[0])
+        return tuple(zip(values[::2], values[1::2]))
+
+    def put_hit_box(self, name: str, points: Point2List) -> None:
+        """
+        Store the hit box points for a texture cache name.
+
+        Args:
+            name: The cache name of the texture
+            points: The hit box points
+        """
+        self.put_hit_boxes([(name, points)])
+
+    def put_hit_boxes(self, hit_boxes: Iterable[tuple[str, Point2List]]) -> None:
+        """
+        Store several hit boxes at once.
+
+        Args:
+            hit_boxes: Tuples of texture cache name and hit box points
+        """
+        rows = [
+            (name, array("d", [value for point in points for value in point]).tobytes())
+            for name, points in hit_boxes
+        ]
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("INSERT OR REPLACE INTO hit_boxes VALUES (?, ?)", rows)
+
+    def flush(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.execute("DELETE FROM images")
+            self._connection.execute("DELETE FROM hit_boxes")
+
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            self._connection.close()
+
+    def __repr__(self) -> str:
+        return f"TextureDiskCache(path={str(self._path)!r})"
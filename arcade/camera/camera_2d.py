@@ -452,7 +452,8 @@ def aabb(self) -> Rect:
         ux, uy, *_ = up
         rx, ry = uy, -ux  # up x Z'
 
-        l, r, b, t = self.viewport.lrbt
+        # The projection is relative to the camera position and already zoomed
+        l, r, b, t = self.projection.lrbt
         x, y = self.position
 
         x_points = (
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+from math import sqrt
 from sys import maxsize as sys_int_maxsize
 
 from arcade.types import Point2, Point2List
@@ -64,6 +65,79 @@ def are_polygons_intersecting(poly_a: Point2List, poly_b: Point2List) -> bool:
     return True
 
 
+def get_minimum_translation_vector(poly_a: Point2List, poly_b: Point2List) -> Point2 | None:
+    """
+    Find the shortest move which separates two intersecting polygons.
+
+    This uses the same separating axis test as :py:func:`are_polygons_intersecting`.
+    The axis where the polygons overlap the least gives the direction
+    and distance to move ``poly_a``. After the move, the polygons are
+    touching but no longer intersecting.
+
+    The polygons must be convex, like all hit boxes.
+
+    Args:
+        poly_a: List of points that define the polygon to move.
+        poly_b: List of points that define the other polygon.
+
+    Returns:
+        The ``(x, y)`` vector to move ``poly_a`` by, or ``None`` if the
+        polygons don't intersect.
+    """
+    if not poly_a or not poly_b:
+        return None
+
+    best_depth = float("inf")
+    best_axis = (0.0, 0.0)
+    for polygon in (poly_a, poly_b):
+        for i1 in range(len(polygon)):
+            i2 = (i1 + 1) % len(polygon)
+            projection_1 = polygon[i1]
+            projection_2 = polygon[i2]
+
+            normal = (
+                projection_2[1] - projection_1[1],
+                projection_1[0] - projection_2[0],
+            )
+
+            min_a, min_b = (float("inf"),) * 2
+            max_a, max_b = (-float("inf"),) * 2
+
+            for poly in poly_a:
+                projected = normal[0] * poly[0] + normal[1] * poly[1]
+
+                if projected < min_a:
+                    min_a = projected
+                if projected > max_a:
+                    max_a = projected
+
+            for poly in poly_b:
+                projected = normal[0] * poly[0] + normal[1] * poly[1]
+
+                if projected < min_b:
+                    min_b = projected
+                if projected > max_b:
+                    max_b = projected
+
+            if max_a <= min_b or max_b <= min_a:  # type: ignore
+                return None
+
+            # Scale the overlap to pixels, since the normal isn't normalized.
+            # Move poly_a towards whichever side of poly_b is closer.
+            length = sqrt(normal[0] * normal[0] + normal[1] * normal[1])
+            push_back = (max_a - min_b) / length  # type: ignore
+            push_forward = (max_b - min_a) / length  # type: ignore
+            if push_back < push_forward:
+                if push_back < best_depth:
+                    best_depth = push_back
+                    best_axis = (-normal[0] / length, -normal[1] / length)
+            elif push_forward < best_depth:
+                best_depth = push_forward
+                best_axis = (normal[0] / length, normal[1] / length)
+
+    return best_axis[0] * best_depth, best_axis[1] * best_depth
+
+
 def is_point_in_box(p: Point2, q: Point2, r: Point2) -> bool:
     """
     Checks if point ``q`` is inside the box defined by ``p`` and ``r``.
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from math import cos, radians, sin
-from typing import Any
+from typing import Any, Sequence
 
 from PIL.Image import Image
 from typing_extensions import Self
@@ -57,6 +57,29 @@ def calculate(self, image: Image, **kwargs) -> Point2List:
         """
         raise NotImplementedError
 
+    def calculate_regions(
+        self, image: Image, regions: Sequence[tuple[int, int, int, int]], **kwargs
+    ) -> list[Point2List]:
+        """
+        Calculate hit box points for several regions of an image,
+        such as all the cells in a sprite sheet.
+
+        By default each region is cropped and passed to :py:meth:`calculate`.
+        Subclasses can override this to process the whole image at once.
+
+        Args:
+            image:
+                The image containing the regions
+            regions:
+                The regions as ``(x, y, width, height)`` from the upper left corner
+            kwargs:
+                keyword arguments passed to :py:meth:`calculate`
+        """
+        return [
+            self.calculate(image.crop((x, y, x + width, y + height)), **kwargs)
+            for x, y, width, height in regions
+        ]
+
     def __call__(self, *args: Any, **kwds: Any) -> Self:
         """
         Shorthand allowing any instance to be used identically to the base type.
@@ -90,6 +113,27 @@ def create_bounding_box(self, image: Image) -> Point2List:
         )
 
 
+def _is_axis_aligned_box(points: Point2List) -> bool:
+    """
+    Check if points describe a non-empty rectangle with sides parallel to the axes.
+
+    Args:
+        points: The points to check
+    """
+    if len(points) != 4:
+        return False
+
+    x_values = {point[0] for point in points}
+    y_values = {point[1] for point in points}
+    if len(x_values) != 2 or len(y_values) != 2:
+        return False
+
+    # Make sure all four corners are present
+    return {(point[0], point[1]) for point in points} == {
+        (x, y) for x in x_values for y in y_values
+    }
+
+
 class HitBox:
     """
     A basic hit box class supporting scaling.
@@ -123,6 +167,9 @@ def __init__(
         self._adjusted_points: Point2List = EMPTY_POINT_LIST
         self._adjusted_cache_dirty = True
 
+        # Collision checks use a much faster path for boxes
+        self._is_box = _is_axis_aligned_box(points)
+
     @property
     def points(self) -> Point2List:
         """
@@ -133,6 +180,18 @@ def points(self) -> Point2List:
         """
         return self._points
 
+    @property
+    def is_axis_aligned(self) -> bool:
+        """
+        ``True`` if the adjusted points form a rectangle with sides parallel to the axes.
+
+        This is the case for hit boxes from
+        :py:class:`~arcade.hitbox.BoundingHitBoxAlgorithm` and for any other
+        rectangular hit box which isn't rotated. Collision checks between two
+        such hit boxes use a simple interval test instead of the full polygon check.
+        """
+        return self._is_box
+
     @property
     def position(self) -> Point2:
         """
@@ -284,6 +343,17 @@ def angle(self, angle: float):
         self._angle = angle
         self._adjusted_cache_dirty = True
 
+    @property
+    def is_axis_aligned(self) -> bool:
+        """
+        ``True`` if the adjusted points form a rectangle with sides parallel to the axes.
+
+        For rotatable hit boxes this requires the angle to be 0. Other multiples
+        of 90 degrees are excluded since rotating the points introduces tiny
+        floating point errors.
+        """
+        return self._is_box and self._angle == 0
+
     def get_adjusted_points(self) -> Point2List:
         """
         Return the offset, scaled, & rotated points of this hitbox.
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from PIL.Image import Image
 
 from arcade.types import Point, Point2List
@@ -21,50 +23,89 @@ def calculate(self, image: Image, **kwargs) -> Point2List:
         Args:
             image: Image get hit box from.
         """
+        return self.calculate_regions(image, [(0, 0, image.width, image.height)])[0]
+
+    def calculate_regions(
+        self, image: Image, regions: Sequence[tuple[int, int, int, int]], **kwargs
+    ) -> list[Point2List]:
+        """
+        Calculate the hit box points for several regions of an RGBA image,
+        such as all the cells in a sprite sheet.
+
+        The alpha channel of the image is only extracted once,
+        and each row of a region is scanned in a single operation.
+
+        Args:
+            image:
+                The image containing the regions
+            regions:
+                The regions as ``(x, y, width, height)`` from the upper left corner
+        """
         if image.mode != "RGBA":
             raise ValueError("Image mode is not RGBA. image.convert('RGBA') is needed.")
 
         # Convert the image into one channel alpha since we don't care about RGB values
-        image = image.getchannel("A")
-        bbox = image.getbbox()
-        # If there is no bounding box the image is empty
-        if bbox is None:
-            return self.create_bounding_box(image)
-
-        left_border, top_border, right_border, bottom_border = bbox
-        right_border -= 1
-        bottom_border -= 1
-
-        def _check_corner_offset(
-            start_x: int, start_y: int, x_direction: int, y_direction: int
-        ) -> int:
-            bad = False
-            offset = 0
-            while not bad:
-                y = start_y + (offset * y_direction)
-                x = start_x
-                for _ in range(offset + 1):
-                    alpha = image.getpixel((x, y))
-                    # print(f"({x}, {y}) = {my_pixel} | ", end="")
-                    if alpha != 0:
-                        bad = True
-                        break
-                    y -= y_direction
-                    x += x_direction
-                # print(f" - {bad}")
-                if not bad:
-                    offset += 1
-            # print(f"offset: {offset}")
-            return offset
+        alpha = image.getchannel("A").tobytes()
+        return [self._calculate_region(alpha, image.width, region) for region in regions]
+
+    def _calculate_region(
+        self, alpha: bytes, stride: int, region: tuple[int, int, int, int]
+    ) -> Point2List:
+        """
+        Calculate the hit box of a region in the alpha channel of an image.
+
+        Args:
+            alpha:
+                The alpha channel of the image, one byte per pixel
+            stride:
+                The width of the image
+            region:
+                The region as ``(x, y, width, height)``
+        """
+        x, y, w, h = region
+
+        # The first and last opaque pixel of each row with any
+        rows: list[tuple[int, int, int]] = []
+        for row in range(h):
+            start = (y + row) * stride + x
+            data = alpha[start : start + w]
+            first = w - len(data.lstrip(b"\x00"))
+            if first < w:
+                rows.append((row, first, len(data.rstrip(b"\x00")) - 1))
+
+        # If there are no opaque pixels the region is empty
+        if not rows:
+            return (
+                (-w / 2, -h / 2),
+                (w / 2, -h / 2),
+                (w / 2, h / 2),
+                (-w / 2, h / 2),
+            )
+
+        top_border = rows[0][0]
+        bottom_border = rows[-1][0]
+        left_border = min(first for _, first, _ in rows)
+        right_border = max(last for _, _, last in rows)
+
+        # How far each corner can be cut off diagonally. This is the
+        # smallest number of steps right/left plus down/up from the
+        # corner of the bounding box to an opaque pixel.
+        top_left_corner_offset = min(
+            first - left_border + row - top_border for row, first, _ in rows
+        )
+        top_right_corner_offset = min(
+            right_border - last + row - top_border for row, _, last in rows
+        )
+        bottom_left_corner_offset = min(
+            first - left_border + bottom_border - row for row, first, _ in rows
+        )
+        bottom_right_corner_offset = min(
+            right_border - last + bottom_border - row for row, _, last in rows
+        )
 
         def _r(point: tuple[float, float], height: int, width: int) -> Point:
             return point[0] - width / 2, (height - point[1]) - height / 2
 
-        top_left_corner_offset = _check_corner_offset(left_border, top_border, 1, 1)
-        top_right_corner_offset = _check_corner_offset(right_border, top_border, -1, 1)
-        bottom_left_corner_offset = _check_corner_offset(left_border, bottom_border, 1, -1)
-        bottom_right_corner_offset = _check_corner_offset(right_border, bottom_border, -1, -1)
-
         p1 = left_border + top_left_corner_offset, top_border
         p2 = (right_border + 1) - top_right_corner_offset, top_border
         p3 = (right_border + 1), top_border + top_right_corner_offset
@@ -76,9 +117,6 @@ def _r(point: tuple[float, float], height: int, width: int) -> Point:
 
         result = []
 
-        h = image.height
-        w = image.width
-
         result.append(_r(p7, h, w))
         if bottom_left_corner_offset:
             result.append(_r(p6, h, w))
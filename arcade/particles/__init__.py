@@ -6,6 +6,7 @@
     LifetimeParticle,
     FadeParticle,
 )
+from .particle_list import ParticleList
 from .emitter import (
     Emitter,
     EmitController,
@@ -25,6 +26,7 @@
     "EternalParticle",
     "LifetimeParticle",
     "FadeParticle",
+    "ParticleList",
     "Emitter",
     "EmitController",
     "EmitBurst",
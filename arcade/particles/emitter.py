@@ -12,6 +12,7 @@
 from arcade.types import Point, Velocity
 
 from .particle import Particle
+from .particle_list import ParticleList
 
 
 class EmitController:
@@ -129,6 +130,14 @@ class Emitter:
     """
     Emits and manages Particles over their lifetime.
     The foundational class in a particle system.
+
+    By default the particles are kept as sprites in a
+    :py:class:`~arcade.SpriteList`. Pass a
+    :py:class:`~arcade.particles.ParticleList` as ``particle_list`` to
+    store them as columns instead, which is a lot faster for large
+    amounts of particles. The state of each particle returned by the
+    factory is then copied into the list. This doesn't support
+    particles with a ``mutation_callback``.
     """
 
     def __init__(
@@ -139,6 +148,7 @@ def __init__(
         change_xy: Velocity = (0.0, 0.0),
         emit_done_cb: Callable[[Emitter], None] | None = None,
         reap_cb: Callable[[], None] | None = None,
+        particle_list: ParticleList | None = None,
     ):
         self.change_x = change_xy[0]
         self.change_y = change_xy[1]
@@ -151,7 +161,11 @@ def __init__(
         self.particle_factory = particle_factory
         self._emit_done_cb = emit_done_cb
         self._reap_cb = reap_cb
-        self._particles: arcade.SpriteList = arcade.SpriteList(use_spatial_hash=False)
+        self._particles: arcade.SpriteList | ParticleList = (
+            particle_list
+            if particle_list is not None
+            else arcade.SpriteList(use_spatial_hash=False)
+        )
 
     def _emit(self):
         """
@@ -167,7 +181,10 @@ def _emit(self):
 
         p.change_x = vel.x
         p.change_y = vel.y
-        self._particles.append(p)
+        if isinstance(self._particles, ParticleList):
+            self._particles.add_particle(p)
+        else:
+            self._particles.append(p)
 
     def get_count(self) -> int:
         return len(self._particles)
@@ -189,6 +206,9 @@ def update(self, delta_time: float = 1 / 60):
         for _ in range(emit_count):
             self._emit()
         self._particles.update(delta_time)
+        if isinstance(self._particles, ParticleList):
+            # Expired particles are removed by the update
+            return
         particles_to_reap = [p for p in self._particles if cast(Particle, p).can_reap()]
         for dead_particle in particles_to_reap:
             dead_particle.kill()
@@ -0,0 +1,347 @@
+"""
+ParticleList - Stores and draws particles as columns of numbers
+instead of one Sprite per particle.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import chain, compress, repeat
+from typing import TYPE_CHECKING
+
+from arcade import get_window
+from arcade.gl.types import BlendFunction
+from arcade.sprite_list.sprite_buffers import SpriteBuffers
+from arcade.types import RGB, Point, Velocity
+
+from .particle import EternalParticle, FadeParticle, LifetimeParticle, Particle
+
+if TYPE_CHECKING:
+    from arcade import Texture
+    from arcade.texture_atlas import TextureAtlasBase
+
+# The initial number of particles the GPU buffers have room for
+_DEFAULT_CAPACITY = 128
+
+# The particle behavior the columns reproduce. Other implementations
+# of these methods can't be copied into the columns.
+_BUILTIN_UPDATES = (Particle.update, LifetimeParticle.update, FadeParticle.update)
+_BUILTIN_CAN_REAPS = (Particle.can_reap, EternalParticle.can_reap, LifetimeParticle.can_reap)
+
+
+class ParticleList:
+    """
+    A batch of particles stored as columns of numbers.
+
+    Each particle is a row in a set of columns (position, velocity, angle,
+    size, color, alpha and lifetime) instead of a :py:class:`~arcade.Sprite`.
+    Updating moves all particles, fades them and removes the expired ones
+    in a few passes over the columns, avoiding the per sprite property
+    setters and sprite list bookkeeping. The columns are written to the
+    GPU in the same layout as a :py:class:`~arcade.SpriteList` and drawn
+    with the same shader.
+
+    This is a lot faster for large amounts of simple particles, but the
+    particles can't be accessed as sprites. Pass one to an
+    :py:class:`~arcade.particles.Emitter` to use it for the emitted particles::
+
+        emitter = Emitter(
+            center_xy=(400, 300),
+            emit_controller=EmitMaintainCount(10_000),
+            particle_factory=make_particle,
+            particle_list=ParticleList(),
+        )
+
+    Args:
+        atlas:
+            The texture atlas for the particle textures. If no
+            atlas is supplied the default one is used.
+    """
+
+    def __init__(self, atlas: TextureAtlasBase | None = None) -> None:
+        self._atlas: TextureAtlasBase | None = atlas
+        self._initialized = False
+        self._capacity = _DEFAULT_CAPACITY
+
+        # One entry per particle in each column
+        self._x: list[float] = []
+        self._y: list[float] = []
+        self._change_x: list[float] = []
+        self._change_y: list[float] = []
+        self._angle: list[float] = []
+        self._change_angle: list[float] = []
+        self._width: list[float] = []
+        self._height: list[float] = []
+        self._red: list[int] = []
+        self._green: list[int] = []
+        self._blue: list[int] = []
+        self._alpha: list[int] = []
+        self._start_alpha: list[int] = []
+        self._end_alpha: list[int] = []
+        self._lifetime_elapsed: list[float] = []
+        self._lifetime_original: list[float] = []
+        # Textures are only resolved to atlas slots when drawing
+        self._textures: list[Texture] = []
+        self._texture_slots: list[float] = []
+
+        self._buffers: SpriteBuffers | None = None
+
+    def __len__(self) -> int:
+        """Return the number of particles."""
+        return len(self._x)
+
+    @property
+    def positions(self) -> list[tuple[float, float]]:
+        """The position of each particle."""
+        return list(zip(self._x, self._y))
+
+    @property
+    def alphas(self) -> list[int]:
+        """The current alpha value of each particle."""
+        return list(self._alpha)
+
+    def add(
+        self,
+        texture: Texture,
+        center_xy: Point = (0.0, 0.0),
+        change_xy: Velocity = (0.0, 0.0),
+        *,
+        lifetime: float = math.inf,
+        angle: float = 0.0,
+        change_angle: float = 0.0,
+        scale: float = 1.0,
+        color: RGB = (255, 255, 255),
+        start_alpha: int = 255,
+        end_alpha: int | None = None,
+    ) -> None:
+        """
+        Add a particle.
+
+        Args:
+            texture:
+                The texture of the particle
+            center_xy:
+                The position of the particle
+            change_xy:
+                The velocity of the particle in pixels per frame at 60 fps
+            lifetime:
+                How many seconds until the particle is removed.
+                By default particles live forever.
+            angle:
+                The angle of the particle in degrees
+            change_angle:
+                How much the angle changes per frame at 60 fps
+            scale:
+                The scale of the texture
+            color:
+                The color to tint the texture with
+            start_alpha:
+                The alpha value when the particle is added
+            end_alpha:
+                The alpha value when the particle is removed. The alpha is
+                interpolated between the two over the lifetime. Defaults to
+                ``start_alpha``.
+        """
+        if end_alpha is None:
+            end_alpha = start_alpha
+
+        self._x.append(center_xy[0])
+        self._y.append(center_xy[1])
+        self._change_x.append(change_xy[0])
+        self._change_y.append(change_xy[1])
+        self._angle.append(angle)
+        self._change_angle.append(change_angle)
+        self._width.append(texture.width * scale)
+        self._height.append(texture.height * scale)
+        self._red.append(color[0])
+        self._green.append(color[1])
+        self._blue.append(color[2])
+        self._alpha.append(start_alpha)
+        self._start_alpha.append(start_alpha)
+        self._end_alpha.append(end_alpha)
+        self._lifetime_elapsed.append(0.0)
+        self._lifetime_original.append(lifetime)
+        self._textures.append(texture)
+
+    def add_particle(self, particle: Particle) -> None:
+        """
+        Copy the state of a particle sprite into the list.
+
+        :py:class:`~arcade.particles.LifetimeParticle` and
+        :py:class:`~arcade.particles.FadeParticle` keep their lifetime and fading.
+        Other particles live forever.
+
+        Args:
+            particle: The particle to copy
+        Raises:
+            ValueError: If the particle has a mutation callback or overrides
+                ``update`` or ``can_reap``. These need a sprite to run,
+                so they are not supported.
+        """
+        if particle.mutation_callback is not None:
+            raise ValueError("Particles with a mutation_callback are not supported")
+        particle_type = type(particle)
+        if particle_type.update not in _BUILTIN_UPDATES:
+            raise ValueError(f"{particle_type.__name__} overrides update, which is not supported")
+        if particle_type.can_reap not in _BUILTIN_CAN_REAPS:
+            raise ValueError(f"{particle_type.__name__} overrides can_reap, which is not supported")
+
+        alpha = particle.alpha
+        end_alpha = alpha
+        lifetime = math.inf
+        elapsed = 0.0
+        if isinstance(particle, LifetimeParticle):
+            lifetime = particle.lifetime_original
+            elapsed = particle.lifetime_elapsed
+        if isinstance(particle, FadeParticle):
+            alpha = particle.start_alpha
+            end_alpha = particle.end_alpha
+
+        self._x.append(particle.center_x)
+        self._y.append(particle.center_y)
+        self._change_x.append(particle.change_x)
+        self._change_y.append(particle.change_y)
+        self._angle.append(particle.angle)
+        self._change_angle.append(particle.change_angle)
+        self._width.append(particle.width)
+        self._height.append(particle.height)
+        red, green, blue, _ = particle.color
+        self._red.append(red)
+        self._green.append(green)
+        self._blue.append(blue)
+        self._alpha.append(particle.alpha)
+        self._start_alpha.append(alpha)
+        self._end_alpha.append(end_alpha)
+        self._lifetime_elapsed.append(elapsed)
+        self._lifetime_original.append(lifetime)
+        self._textures.append(particle.texture)
+
+    def update(self, delta_time: float = 1 / 60) -> None:
+        """
+        Move and fade all particles, then remove the expired ones.
+
+        This behaves the same as updating the equivalent particle sprites.
+
+        Args:
+            delta_time: Time since last update in seconds
+        """
+        if not self._x:
+            return
+
+        # Velocities are historically in pixels per frame at 60 fps
+        time_step = delta_time * 60
+        self._x = [x + dx * time_step for x, dx in zip(self._x, self._change_x)]
+        self._y = [y + dy * time_step for y, dy in zip(self._y, self._change_y)]
+        self._angle = [a + da * time_step for a, da in zip(self._angle, self._change_angle)]
+
+        elapsed = [e + delta_time for e in self._lifetime_elapsed]
+        self._lifetime_elapsed = elapsed
+        # The same as lerp(start, end, e / lifetime). No clamping is needed,
+        # since particles past their lifetime are removed below. Particles
+        # without a lifetime expire right away and end at the end alpha.
+        self._alpha = [
+            int(start + (end - start) * (e / lifetime)) if lifetime > 0 else end
+            for start, end, e, lifetime in zip(
+                self._start_alpha, self._end_alpha, elapsed, self._lifetime_original
+            )
+        ]
+
+        # Remove the expired particles from every column
+        keep = [e < lifetime for e, lifetime in zip(elapsed, self._lifetime_original)]
+        if not all(keep):
+            self._compress(keep)
+
+    def _compress(self, keep: list[bool]) -> None:
+        """Only keep the particles where ``keep`` is ``True``."""
+        self._x = list(compress(self._x, keep))
+        self._y = list(compress(self._y, keep))
+        self._change_x = list(compress(self._change_x, keep))
+        self._change_y = list(compress(self._change_y, keep))
+        self._angle = list(compress(self._angle, keep))
+        self._change_angle = list(compress(self._change_angle, keep))
+        self._width = list(compress(self._width, keep))
+        self._height = list(compress(self._height, keep))
+        self._red = list(compress(self._red, keep))
+        self._green = list(compress(self._green, keep))
+        self._blue = list(compress(self._blue, keep))
+        self._alpha = list(compress(self._alpha, keep))
+        self._start_alpha = list(compress(self._start_alpha, keep))
+        self._end_alpha = list(compress(self._end_alpha, keep))
+        self._lifetime_elapsed = list(compress(self._lifetime_elapsed, keep))
+        self._lifetime_original = list(compress(self._lifetime_original, keep))
+        self._textures = list(compress(self._textures, keep))
+        self._texture_slots = list(compress(self._texture_slots, keep))
+
+    def clear(self) -> None:
+        """Remove all particles."""
+        self._compress([])
+
+    def _init_deferred(self) -> None:
+        """Create the OpenGL resources once a window exists."""
+        if self._initialized:
+            return
+
+        ctx = get_window().ctx
+        if not self._atlas:
+            self._atlas = ctx.default_atlas
+        self._buffers = SpriteBuffers(ctx, self._capacity)
+        self._initialized = True
+
+    def _write_buffers_to_gpu(self) -> None:
+        """Write the columns to the GPU buffers."""
+        count = len(self._x)
+
+        # Look up the atlas slots for particles added since the last write
+        atlas: TextureAtlasBase = self._atlas  # type: ignore
+        slots = self._texture_slots
+        if len(slots) < count:
+            slot_for_texture: dict[int, float] = {}
+            for texture in self._textures[len(slots) :]:
+                slot = slot_for_texture.get(id(texture))
+                if slot is None:
+                    slot = slot_for_texture[id(texture)] = float(atlas.add(texture)[0])
+                slots.append(slot)
+
+        buffers: SpriteBuffers = self._buffers  # type: ignore
+        if count > self._capacity:
+            while count > self._capacity:
+                self._capacity *= 2
+            buffers.resize(self._capacity)
+
+        buffers.pos.write(array("f", chain.from_iterable(zip(self._x, self._y, repeat(0.0)))))
+        buffers.size.write(array("f", chain.from_iterable(zip(self._width, self._height))))
+        buffers.angle.write(array("f", self._angle))
+        buffers.color.write(
+            array("B", chain.from_iterable(zip(self._red, self._green, self._blue, self._alpha)))
+        )
+        buffers.texture.write(array("f", slots))
+
+    def draw(
+        self,
+        *,
+        pixelated: bool = False,
+        blend_function: BlendFunction | None = None,
+    ) -> None:
+        """
+        Draw all the particles.
+
+        Args:
+            pixelated:
+                ``True`` for pixelated and ``False`` for smooth interpolation.
+            blend_function:
+                Optional blend function to draw the particles with, such as
+                ``ctx.BLEND_ADDITIVE``. Defaults to ``ctx.BLEND_DEFAULT``.
+        """
+        if not self._x:
+            return
+
+        self._init_deferred()
+        self._write_buffers_to_gpu()
+
+        self._buffers.draw(  # type: ignore
+            self._atlas,  # type: ignore
+            len(self._x),
+            pixelated=pixelated,
+            blend_function=blend_function,
+        )
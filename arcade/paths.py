@@ -5,12 +5,22 @@
 from __future__ import annotations
 
 import math
+from heapq import heapify, heappop, heappush
+from typing import Iterable, Sequence
 
-from arcade import Sprite, SpriteList, check_for_collision_with_list, get_sprites_at_point
-from arcade.math import get_distance, lerp_2d
-from arcade.types import Point2
+from arcade import Sprite, SpatialHash, SpriteList, check_for_collision_with_list
+from arcade.geometry import are_lines_intersecting, are_polygons_intersecting, is_point_in_polygon
+from arcade.math import get_distance
+from arcade.types import Point2, Point2List
+from arcade.types.rect import LRBT, Rect
 
-__all__ = ["AStarBarrierList", "astar_calculate_path", "has_line_of_sight"]
+__all__ = [
+    "AStarBarrierList",
+    "FlowField",
+    "astar_calculate_path",
+    "has_line_of_sight",
+    "has_line_of_sight_many",
+]
 
 
 def _spot_is_blocked(position: Point2, moving_sprite: Sprite, blocking_sprites: SpriteList) -> bool:
@@ -32,34 +42,19 @@ def _spot_is_blocked(position: Point2, moving_sprite: Sprite, blocking_sprites:
     return len(hit_list) > 0
 
 
-def _heuristic(start: Point2, goal: Point2) -> float:
-    """
-    Returns a heuristic value for the passed points.
-
-    Args:
-        start (Point2): The 1st point to compare
-        goal (Point2): The 2nd point to compare
-
-    Returns:
-        float: The heuristic of the 2 points
-    """
-    # Use Chebyshev distance heuristic if we can move one square either
-    # adjacent or diagonal
-    d = 1
-    d2 = 1
-    dx = abs(start[0] - goal[0])
-    dy = abs(start[1] - goal[1])
-    return d * (dx + dy) + (d2 - 2 * d) * min(dx, dy)
-
-
 class _AStarGraph(object):
     """
-    A grid which tracks 2 barriers and a moving sprite.
+    A dense grid of blocked cells to run A* searches on.
+
+    The grid is stored as a flat :py:class:`bytearray` with one byte
+    per cell, so it can be reused for any number of searches.
 
     Args:
         barriers:
             Barriers to use in the AStarSearch Algorithm.
-            These are turned into a set.
+            Either an iterable of blocked grid locations or a
+            ``bytearray`` with one byte per cell, row by row from
+            the bottom left.
         left (int):
             Far left side x value
         right (int):
@@ -74,18 +69,27 @@ class _AStarGraph(object):
 
     def __init__(
         self,
-        barriers: list | tuple | set,
+        barriers: list | tuple | set | bytearray,
         left: int,
         right: int,
         bottom: int,
         top: int,
         diagonal_movement: bool,
     ):
-        self.barriers = barriers if barriers is set else set(barriers)
         self.left = left
         self.right = right
         self.top = top
         self.bottom = bottom
+        self.width = right - left + 1
+        self.height = top - bottom + 1
+
+        if isinstance(barriers, bytearray):
+            self.blocked = barriers
+        else:
+            self.blocked = bytearray(max(self.width, 0) * max(self.height, 0))
+            for barrier in barriers:
+                if self.contains(barrier):
+                    self.blocked[self.index(barrier)] = 1
 
         if diagonal_movement:
             self.movement_directions = (  # type: ignore
@@ -101,6 +105,14 @@ def __init__(
         else:
             self.movement_directions = (1, 0), (-1, 0), (0, 1), (0, -1)  # type: ignore
 
+    def contains(self, pos: Point2) -> bool:
+        """Return if a point is inside the grid."""
+        return self.left <= pos[0] <= self.right and self.bottom <= pos[1] <= self.top
+
+    def index(self, pos: Point2) -> int:
+        """Return the index of a point in :py:attr:`blocked`."""
+        return int(pos[1] - self.bottom) * self.width + int(pos[0] - self.left)
+
     def get_vertex_neighbours(self, pos: Point2) -> list[tuple[float, float]]:
         """
         Return neighbors for this point according to ``self.movement_directions``
@@ -136,7 +148,7 @@ def move_cost(self, a: Point2, b: Point2) -> float:
         Returns:
             The move cost of moving between of the 2 points
         """
-        if b in self.barriers:
+        if self.contains(b) and self.blocked[self.index(b)]:
             return float("inf")  # Infinitely high cost to enter barrier squares
 
         elif a[0] == b[0] or a[1] == b[1]:
@@ -145,81 +157,97 @@ def move_cost(self, a: Point2, b: Point2) -> float:
             return 1.42
 
 
-def _AStarSearch(start: Point2, end: Point2, graph: _AStarGraph) -> list[Point2] | None:
+def _AStarSearch(
+    start: Point2, end: Point2, graph: _AStarGraph, max_expansions: int | None = None
+) -> list[Point2] | None:
     """
     Returns a path from start to end using the AStarSearch Algorithm
 
-    Graph is used to check for barriers.
+    Graph is used to check for barriers. The open list is a binary heap
+    and the scores and closed set are flat lists over the grid, so each
+    expansion takes ``O(log n)`` time.
 
     Args:
         start: point to start at
         end: point to end at
         graph: Graph to use
+        max_expansions:
+            Give up after expanding this many grid cells.
+            ``None`` searches until the open list is empty.
     Returns:
         The path from start to end. Returns ``None`` if is path is not found
     """
-    G: dict[Point2, float] = dict()  # Actual movement cost to each position from the start position
-    F: dict[Point2, float] = (
-        dict()
-    )  # Estimated movement cost of start to end going via this position
-
-    # Initialize starting values
-    G[start] = 0
-    F[start] = _heuristic(start, end)
+    if not graph.contains(start) or not graph.contains(end):
+        # Out-of-bounds
+        return None
 
-    closed_vertices = set()
-    open_vertices = {start}  # type: ignore
-    came_from = {}  # type: ignore
+    left, bottom, right, top = graph.left, graph.bottom, graph.right, graph.top
+    width = graph.width
+    blocked = graph.blocked
+    end_x, end_y = int(end[0]), int(end[1])
+    start_x, start_y = int(start[0]), int(start[1])
+    neighbours = [
+        (dx, dy, dy * width + dx, 1 if dx == 0 or dy == 0 else 1.42)
+        for dx, dy in graph.movement_directions
+    ]
+
+    # Actual movement cost to each position from the start position
+    G = [math.inf] * len(blocked)
+    came_from = [-1] * len(blocked)
+    closed_vertices = bytearray(len(blocked))
+
+    start_index = graph.index(start)
+    G[start_index] = 0
+    # Ties on the estimated cost are broken by the lowest position,
+    # so the same path is always returned.
+    open_vertices = [(float(max(abs(start_x - end_x), abs(start_y - end_y))), start_x, start_y)]
 
     count = 0
-    while len(open_vertices) > 0:
+    while open_vertices:
+        _, x, y = heappop(open_vertices)
+        current = (y - bottom) * width + (x - left)
+        if closed_vertices[current]:
+            # Stale entry for a vertex we found a better route to
+            continue
+
         count += 1
-        if count > 500:
+        if max_expansions is not None and count > max_expansions:
             break
-        # Get the vertex in the open list with the lowest F score
-        current = None
-        current_fscore = math.inf
-        for pos in sorted(open_vertices):
-            if current is None or F[pos] < current_fscore:
-                current_fscore = F[pos]
-                current = pos
 
         # Check if we have reached the goal
-        if current == end and current is not None:
+        if x == end_x and y == end_y:
             # Retrace our route backward
-            path = [current]
-            while current in came_from:
+            path: list[Point2] = []
+            while current != -1:
+                path.append((left + current % width, bottom + current // width))
                 current = came_from[current]
-                path.append(current)  # type: ignore
             path.reverse()
-            if F[end] >= 10000:
-                return None
-            else:
-                return path
-            # return path, F[end]  # Done!
+            return path
 
         # Mark the current vertex as closed
-        open_vertices.remove(current)  # type: ignore
-        closed_vertices.add(current)  # type: ignore
+        closed_vertices[current] = 1
+        current_g = G[current]
 
         # Update scores for vertices near the current position
-        for neighbour in sorted(graph.get_vertex_neighbours(current)):  # type: ignore
-            if neighbour in closed_vertices:
-                continue  # We have already processed this node exhaustively
-            candidate_g = G[current] + graph.move_cost(current, neighbour)  # type: ignore
-
-            if neighbour not in open_vertices:
-                open_vertices.add(neighbour)  # Discovered a new vertex
-            elif candidate_g >= G[neighbour]:
+        for dx, dy, offset, cost in neighbours:
+            x2 = x + dx
+            y2 = y + dy
+            if x2 < left or x2 > right or y2 < bottom or y2 > top:
+                continue
+            neighbour = current + offset
+            if closed_vertices[neighbour] or blocked[neighbour]:
+                continue  # Already processed or can never be entered
+
+            candidate_g = current_g + cost
+            if candidate_g >= G[neighbour]:
                 continue  # This G score is worse than previously found
 
             # Adopt this G score
             came_from[neighbour] = current
             G[neighbour] = candidate_g
-            h = _heuristic(neighbour, end)
-            F[neighbour] = G[neighbour] + h
+            h = max(abs(x2 - end_x), abs(y2 - end_y))
+            heappush(open_vertices, (candidate_g + h, x2, y2))
 
-    # Out-of-bounds
     return None
 
 
@@ -233,11 +261,29 @@ def _expand(pos: Point2, grid_size: float) -> tuple[int, int]:
     return int(pos[0] * grid_size), int(pos[1] * grid_size)
 
 
+def _get_local_points(sprite: Sprite) -> Point2List:
+    """
+    Get the points of a sprite's hit box relative to its center.
+
+    Adding a position to these gives exactly the same values as the
+    hit box would have with the sprite at that position.
+    """
+    hit_box = sprite.hit_box.create_rotatable(angle=getattr(sprite.hit_box, "angle", 0.0))
+    hit_box.position = (0.0, 0.0)
+    return hit_box.get_adjusted_points()
+
+
 class AStarBarrierList:
     """
     Class that manages a list of barriers that can be encountered during
     A* path finding.
 
+    A grid location is blocked if the moving sprite would hit a blocking
+    sprite when placed there. This is worked out by rasterizing the
+    bounding box of each blocking sprite, grown by the size of the moving
+    sprite, into a grid. Exact hit box checks are only needed for
+    rotated or non-rectangular hit boxes.
+
     Args:
         moving_sprite:
             Sprite that will be moving
@@ -253,9 +299,6 @@ class AStarBarrierList:
             Bottom of playing field
         top (int):
             Top of playing field
-        barrier_list:
-            SpriteList of barriers to use in _AStarSearch,
-            ``None`` if not recalculated
 
     Attributes:
         grid_size:
@@ -272,9 +315,9 @@ class AStarBarrierList:
             Sprite that will be moving
         blocking_sprites:
             Sprites that can block movement
-        barrier_list:
-            SpriteList of barriers to use in _AStarSearch,
-            ``None`` if not recalculated
+        blocked_cells:
+            One byte per grid location, row by row from the bottom left.
+            ``1`` if the location is blocked, ``0`` otherwise.
     """
 
     def __init__(
@@ -294,37 +337,175 @@ def __init__(
         self.right = int(right // grid_size)
         self.moving_sprite = moving_sprite
         self.blocking_sprites = blocking_sprites
-        self.barrier_list = None
+        self.blocked_cells = bytearray()
+        self._barrier_list: list[tuple[int, int]] | None = None
+        # Graphs for searches with and without diagonal movement
+        self._graphs: dict[bool, _AStarGraph] = {}
 
         self.recalculate()
 
+    @property
+    def barrier_list(self) -> list[tuple[int, int]]:
+        """A sorted list of the blocked grid locations."""
+        if self._barrier_list is None:
+            width = self.right - self.left + 1
+            self._barrier_list = sorted(
+                (self.left + index % width, self.bottom + index // width)
+                for index, blocked in enumerate(self.blocked_cells)
+                if blocked
+            )
+        return self._barrier_list
+
+    def _get_graph(self, diagonal_movement: bool = True) -> _AStarGraph:
+        """
+        Get the grid graph used for path finding.
+
+        The graph is built the first time it's needed after a
+        :py:meth:`recalculate` and reused for every search after that.
+
+        Args:
+            diagonal_movement:
+                Whether of not to use diagonals in the AStarSearch Algorithm
+        """
+        graph = self._graphs.get(diagonal_movement)
+        if graph is None:
+            graph = _AStarGraph(
+                self.blocked_cells,
+                self.left,
+                self.right,
+                self.bottom,
+                self.top,
+                diagonal_movement,
+            )
+            self._graphs[diagonal_movement] = graph
+        return graph
+
     def recalculate(self):
         """Recalculate blocking sprites."""
-        # --- Iterate through the blocking sprites and find where we are blocked
-
-        # Save original location
-        original_pos = self.moving_sprite.position
-        # Create a set of barriers
-        self.barrier_list = set()
-        # Loop through the grid
-        for cx in range(self.left, self.right + 1):
-            for cy in range(self.bottom, self.top + 1):
-                # Grid location
-                cpos = cx, cy
-                # Pixel location
-                pos = _expand(cpos, self.grid_size)
-
-                # See if we'll have a collision if our sprite is at this location
-                self.moving_sprite.position = pos
-                if (
-                    len(check_for_collision_with_list(self.moving_sprite, self.blocking_sprites))
-                    > 0
-                ):
-                    self.barrier_list.add(cpos)
-
-        # Restore original location
-        self.moving_sprite.position = original_pos
-        self.barrier_list = sorted(self.barrier_list)
+        width = max(self.right - self.left + 1, 0)
+        height = max(self.top - self.bottom + 1, 0)
+        self.blocked_cells = bytearray(width * height)
+        self._barrier_list = None
+        self._graphs.clear()
+
+        self._rasterize(self.left, self.right, self.bottom, self.top)
+
+    def update_region(self, rect: Rect) -> None:
+        """
+        Recalculate the grid locations affected by an area.
+
+        This is much faster than :py:meth:`recalculate` when only a few
+        blocking sprites changed. When a blocking sprite moves, pass the
+        area it covered before and after the move. When one is removed,
+        pass the area it covered.
+
+        Args:
+            rect: The area which changed, in pixels
+        """
+        grid_size = self.grid_size
+        x_points, y_points = zip(*_get_local_points(self.moving_sprite))
+        # Every location where the moving sprite could touch the area
+        left = max(self.left, math.floor((rect.left - max(x_points)) / grid_size) - 1)
+        right = min(self.right, math.ceil((rect.right - min(x_points)) / grid_size) + 1)
+        bottom = max(self.bottom, math.floor((rect.bottom - max(y_points)) / grid_size) - 1)
+        top = min(self.top, math.ceil((rect.top - min(y_points)) / grid_size) + 1)
+        if left > right or bottom > top:
+            return
+
+        width = self.right - self.left + 1
+        empty = bytes(right - left + 1)
+        for cy in range(bottom, top + 1):
+            row = (cy - self.bottom) * width - self.left
+            self.blocked_cells[row + left : row + right + 1] = empty
+        self._barrier_list = None
+
+        self._rasterize(left, right, bottom, top)
+
+    def _rasterize(self, left: int, right: int, bottom: int, top: int) -> None:
+        """Mark the blocked grid locations inside a range of grid locations."""
+        if left > right or bottom > top:
+            return
+
+        grid_size = self.grid_size
+        width = self.right - self.left + 1
+        blocked_cells = self.blocked_cells
+
+        mover_points = _get_local_points(self.moving_sprite)
+        x_points, y_points = zip(*mover_points)
+        mover_left, mover_right = min(x_points), max(x_points)
+        mover_bottom, mover_top = min(y_points), max(y_points)
+        # Empty hit boxes never collide with anything
+        if mover_left >= mover_right or mover_bottom >= mover_top:
+            return
+        mover_is_box = self.moving_sprite.hit_box.is_axis_aligned
+
+        blockers: Iterable[Sprite]
+        if self.blocking_sprites.spatial_hash is not None:
+            blockers = self.blocking_sprites.spatial_hash.get_sprites_near_rect(
+                LRBT(
+                    int(left * grid_size) + mover_left,
+                    int(right * grid_size) + mover_right,
+                    int(bottom * grid_size) + mover_bottom,
+                    int(top * grid_size) + mover_top,
+                )
+            )
+        else:
+            blockers = self.blocking_sprites
+
+        for blocker in blockers:
+            if blocker is self.moving_sprite:
+                continue
+
+            hit_box = blocker.hit_box
+            points = hit_box.get_adjusted_points()
+            blocker_x_points, blocker_y_points = zip(*points)
+            blocker_left, blocker_right = min(blocker_x_points), max(blocker_x_points)
+            blocker_bottom, blocker_top = min(blocker_y_points), max(blocker_y_points)
+            if blocker_left >= blocker_right or blocker_bottom >= blocker_top:
+                continue
+
+            # Grid locations where the bounding boxes overlap on each axis.
+            # Touching edges don't count as a collision.
+            columns = [
+                cx
+                for cx in range(
+                    max(left, math.floor((blocker_left - mover_right) / grid_size)),
+                    min(right, math.ceil((blocker_right - mover_left) / grid_size)) + 1,
+                )
+                if int(cx * grid_size) + mover_left < blocker_right
+                and blocker_left < int(cx * grid_size) + mover_right
+            ]
+            rows = [
+                cy
+                for cy in range(
+                    max(bottom, math.floor((blocker_bottom - mover_top) / grid_size)),
+                    min(top, math.ceil((blocker_top - mover_bottom) / grid_size)) + 1,
+                )
+                if int(cy * grid_size) + mover_bottom < blocker_top
+                and blocker_bottom < int(cy * grid_size) + mover_top
+            ]
+            if not columns or not rows:
+                continue
+
+            if mover_is_box and hit_box.is_axis_aligned:
+                # The bounding boxes are the hit boxes, so every location is blocked
+                first, last = columns[0], columns[-1]
+                filled = b"\x01" * (last - first + 1)
+                for cy in rows:
+                    row = (cy - self.bottom) * width - self.left
+                    blocked_cells[row + first : row + last + 1] = filled
+                continue
+
+            for cy in rows:
+                row = (cy - self.bottom) * width - self.left
+                py = int(cy * grid_size)
+                for cx in columns:
+                    if blocked_cells[row + cx]:
+                        continue
+                    px = int(cx * grid_size)
+                    moved_points = [(x + px, y + py) for x, y in mover_points]
+                    if are_polygons_intersecting(moved_points, points):
+                        blocked_cells[row + cx] = 1
 
 
 def astar_calculate_path(
@@ -332,10 +513,14 @@ def astar_calculate_path(
     end_point: Point2,
     astar_barrier_list: AStarBarrierList,
     diagonal_movement: bool = True,
+    max_expansions: int | None = None,
 ) -> list[Point2] | None:
     """
     Calculates the path using AStarSearch Algorithm and returns the path
 
+    The grid graph is cached on the barrier list, so many paths can be
+    calculated with the same barrier list cheaply.
+
     Args:
         start_point:
             Where it starts
@@ -345,6 +530,10 @@ def astar_calculate_path(
             AStarBarrierList with the boundaries to use in the AStarSearch Algorithm
         diagonal_movement:
             Whether of not to use diagonals in the AStarSearch Algorithm
+        max_expansions:
+            Give up after checking this many grid cells. This limits
+            the time spent on paths which don't exist in huge grids.
+            ``None`` means no limit.
 
     Returns:
         List of points (the path), or ``None`` if no path is found
@@ -354,16 +543,8 @@ def astar_calculate_path(
     mod_start = _collapse(start_point, grid_size)
     mod_end = _collapse(end_point, grid_size)
 
-    left = astar_barrier_list.left
-    right = astar_barrier_list.right
-
-    bottom = astar_barrier_list.bottom
-    top = astar_barrier_list.top
-
-    barrier_list = astar_barrier_list.barrier_list
-
-    graph = _AStarGraph(barrier_list, left, right, bottom, top, diagonal_movement)  # type: ignore
-    result = _AStarSearch(mod_start, mod_end, graph)
+    graph = astar_barrier_list._get_graph(diagonal_movement)
+    result = _AStarSearch(mod_start, mod_end, graph, max_expansions)
 
     if result is None:
         return None
@@ -374,6 +555,329 @@ def astar_calculate_path(
     return revised_result
 
 
+class FlowField:
+    """
+    Directions towards a single goal from every location of a grid.
+
+    When many sprites chase the same target, running
+    :py:func:`astar_calculate_path` for each of them repeats most of the
+    work. A flow field does one search outwards from the goal instead.
+    It stores the distance to the goal for every grid location
+    (the integration field) and which neighbor to move to next
+    (the direction field). Each sprite can then look up its next step
+    in constant time.
+
+    Moving the goal with :py:meth:`set_goal` reuses the current field.
+    Only the grid locations which get closer to the new goal are
+    searched again. How much this saves depends on the map, since the
+    locations on the side the goal moved towards all get closer.
+
+    The field must be recalculated with :py:meth:`recalculate` after
+    :py:meth:`AStarBarrierList.update_region` is used. It's recalculated
+    automatically after :py:meth:`AStarBarrierList.recalculate`.
+
+    Example::
+
+        flow_field = arcade.FlowField(barrier_list, player.position)
+        for enemy in enemies:
+            next_step = flow_field.get_next_step(enemy.position)
+
+    Args:
+        barrier_list:
+            AStarBarrierList with the grid and barriers to use
+        goal:
+            The position to move towards, in pixels
+        diagonal_movement:
+            Whether of not to allow moving diagonally
+    """
+
+    def __init__(
+        self,
+        barrier_list: AStarBarrierList,
+        goal: Point2,
+        diagonal_movement: bool = True,
+    ):
+        self.barrier_list = barrier_list
+        self.diagonal_movement = diagonal_movement
+        self._goal = _collapse(goal, barrier_list.grid_size)
+        self._graph = barrier_list._get_graph(diagonal_movement)
+        # The distance to the goal for each grid location, in grid steps
+        self._distances: list[float] = []
+        # The index of the next grid location towards the goal, or -1
+        self._next_cells: list[int] = []
+
+        self.recalculate()
+
+    @property
+    def goal(self) -> Point2:
+        """The grid location of the goal, in pixels."""
+        return _expand(self._goal, self.barrier_list.grid_size)
+
+    def set_goal(self, goal: Point2) -> None:
+        """
+        Move the goal, updating the field.
+
+        Args:
+            goal: The new position to move towards, in pixels
+        """
+        new_goal = _collapse(goal, self.barrier_list.grid_size)
+        if new_goal == self._goal:
+            return
+
+        old_goal = self._goal
+        self._goal = new_goal
+        graph = self._graph
+        if (
+            graph is not self.barrier_list._get_graph(self.diagonal_movement)
+            or not graph.contains(old_goal)
+            or not graph.contains(new_goal)
+            or self._distances[graph.index(new_goal)] == math.inf
+        ):
+            self.recalculate()
+            return
+
+        # Every location can still reach the new goal through the old one,
+        # so the old distances plus the distance between the goals are an
+        # upper bound. The search only continues where it finds a shorter way.
+        next_cells = self._next_cells
+        old_distances = self._distances
+        moved = old_distances[graph.index(new_goal)]
+        self._distances = distances = [distance + moved for distance in old_distances]
+
+        # Reverse the path between the goals, so the old goal leads to the new one
+        open_cells = []
+        index = graph.index(new_goal)
+        previous = -1
+        while index != -1:
+            following = next_cells[index]
+            distances[index] = moved - old_distances[index]
+            next_cells[index] = previous
+            open_cells.append((distances[index], index))
+            previous = index
+            index = following
+
+        heapify(open_cells)
+        self._search(open_cells)
+
+    def recalculate(self) -> None:
+        """Recalculate the whole field."""
+        graph = self._graph = self.barrier_list._get_graph(self.diagonal_movement)
+        self._distances = [math.inf] * len(graph.blocked)
+        self._next_cells = [-1] * len(graph.blocked)
+
+        if not graph.contains(self._goal):
+            return
+        index = graph.index(self._goal)
+        if graph.blocked[index]:
+            return
+
+        self._distances[index] = 0.0
+        self._search([(0.0, index)])
+
+    def get_distance(self, position: Point2) -> float:
+        """
+        Get the distance to the goal from a position.
+
+        Args:
+            position: The position to check, in pixels
+        Returns:
+            The length of the shortest path in grid steps, or
+            ``math.inf`` if the goal can't be reached.
+        """
+        cell = _collapse(position, self.barrier_list.grid_size)
+        if not self._graph.contains(cell):
+            return math.inf
+        return self._distances[self._graph.index(cell)]
+
+    def get_direction(self, position: Point2) -> tuple[int, int]:
+        """
+        Get the direction to move in from a position.
+
+        Args:
+            position: The position to check, in pixels
+        Returns:
+            The grid step to take, such as ``(1, 0)`` or ``(-1, 1)``.
+            ``(0, 0)`` at the goal or if the goal can't be reached.
+        """
+        cell = _collapse(position, self.barrier_list.grid_size)
+        next_cell = self._get_next_cell(cell)
+        if next_cell is None:
+            return 0, 0
+        return next_cell[0] - cell[0], next_cell[1] - cell[1]
+
+    def get_next_step(self, position: Point2) -> Point2 | None:
+        """
+        Get the next grid location to move to from a position.
+
+        Args:
+            position: The position to check, in pixels
+        Returns:
+            The next grid location towards the goal in pixels, the goal
+            itself once it's reached, or ``None`` if the goal can't be reached.
+        """
+        grid_size = self.barrier_list.grid_size
+        cell = _collapse(position, grid_size)
+        if cell == self._goal:
+            return self.goal if self.get_distance(position) == 0 else None
+        next_cell = self._get_next_cell(cell)
+        if next_cell is None:
+            return None
+        return _expand(next_cell, grid_size)
+
+    def _get_next_cell(self, cell: tuple[int, int]) -> tuple[int, int] | None:
+        graph = self._graph
+        if not graph.contains(cell):
+            return None
+        next_index = self._next_cells[graph.index(cell)]
+        if next_index == -1:
+            return None
+        return graph.left + next_index % graph.width, graph.bottom + next_index // graph.width
+
+    def _search(self, open_cells: list[tuple[float, int]]) -> None:
+        """Run Dijkstra's algorithm outwards from the cells in a heap."""
+        graph = self._graph
+        width, height = graph.width, graph.height
+        blocked = graph.blocked
+        distances = self._distances
+        next_cells = self._next_cells
+        neighbours = [
+            (dx, dy, dy * width + dx, 1 if dx == 0 or dy == 0 else 1.42)
+            for dx, dy in graph.movement_directions
+        ]
+
+        while open_cells:
+            distance, current = heappop(open_cells)
+            if distance > distances[current]:
+                # Stale entry for a location we found a shorter way to
+                continue
+
+            x = current % width
+            y = current // width
+            for dx, dy, offset, cost in neighbours:
+                x2 = x + dx
+                y2 = y + dy
+                if x2 < 0 or x2 >= width or y2 < 0 or y2 >= height:
+                    continue
+                neighbour = current + offset
+                if blocked[neighbour]:
+                    continue
+
+                candidate = distance + cost
+                if candidate < distances[neighbour]:
+                    distances[neighbour] = candidate
+                    next_cells[neighbour] = current
+                    heappush(open_cells, (candidate, neighbour))
+
+
+class _LineOfSightWalls:
+    """
+    Candidate lookup and cached shapes for line of sight checks against walls.
+
+    Args:
+        walls: List of all blocking sprites
+    """
+
+    def __init__(self, walls: SpriteList):
+        self.walls = walls
+        spatial_hash = walls.spatial_hash
+        self.spatial_hash = spatial_hash if isinstance(spatial_hash, SpatialHash) else None
+        # Bounding box and points for each wall checked so far
+        self.shapes: dict[Sprite, tuple[float, float, float, float, Point2List]] = {}
+
+    def get_candidates(self, start: Point2, end: Point2) -> Iterable[Sprite]:
+        """Get the walls which might be crossed by a segment."""
+        if self.spatial_hash is not None:
+            return self._traverse_cells(start, end)
+        if self.walls.spatial_hash is not None:
+            return self.walls.spatial_hash.get_sprites_near_rect(
+                LRBT(
+                    min(start[0], end[0]),
+                    max(start[0], end[0]),
+                    min(start[1], end[1]),
+                    max(start[1], end[1]),
+                )
+            )
+        return self.walls
+
+    def _traverse_cells(self, start: Point2, end: Point2) -> set[Sprite]:
+        """
+        Collect the walls in every spatial hash cell a segment passes through.
+
+        This is the grid traversal from Amanatides and Woo's
+        "A Fast Voxel Traversal Algorithm for Ray Tracing".
+        """
+        spatial_hash: SpatialHash = self.spatial_hash  # type: ignore
+        contents = spatial_hash.contents
+        cell_size = spatial_hash.cell_size
+        x1, y1 = start[0], start[1]
+        x2, y2 = end[0], end[1]
+
+        cx, cy = math.floor(x1 / cell_size), math.floor(y1 / cell_size)
+        end_cx, end_cy = math.floor(x2 / cell_size), math.floor(y2 / cell_size)
+        dx, dy = x2 - x1, y2 - y1
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Distance along the segment to the next cell border on each axis,
+        # and between cell borders.
+        if dx:
+            t_max_x = ((cx + (dx > 0)) * cell_size - x1) / dx
+            t_delta_x = cell_size / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy:
+            t_max_y = ((cy + (dy > 0)) * cell_size - y1) / dy
+            t_delta_y = cell_size / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        candidates: set[Sprite] = set()
+        for _ in range(abs(end_cx - cx) + abs(end_cy - cy) + 1):
+            # The spatial hash truncates towards zero before dividing, so the
+            # cells left of or below zero overlap the next cell by a pixel.
+            for hash_x in (cx,) if cx >= 0 else (cx, cx + 1):
+                for hash_y in (cy,) if cy >= 0 else (cy, cy + 1):
+                    bucket = contents.get((hash_x, hash_y))
+                    if bucket:
+                        candidates.update(bucket)
+
+            if cx == end_cx:
+                cy += step_y
+            elif cy == end_cy or t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+
+        return candidates
+
+    def is_blocked(self, start: Point2, end: Point2) -> bool:
+        """Check if a segment touches any of the walls."""
+        shapes = self.shapes
+        seg_left, seg_right = (start[0], end[0]) if start[0] < end[0] else (end[0], start[0])
+        seg_bottom, seg_top = (start[1], end[1]) if start[1] < end[1] else (end[1], start[1])
+
+        for wall in self.get_candidates(start, end):
+            shape = shapes.get(wall)
+            if shape is None:
+                points = wall.hit_box.get_adjusted_points()
+                x_points, y_points = zip(*points)
+                shape = min(x_points), max(x_points), min(y_points), max(y_points), points
+                shapes[wall] = shape
+
+            left, right, bottom, top, points = shape
+            if right < seg_left or left > seg_right or top < seg_bottom or bottom > seg_top:
+                continue
+
+            if is_point_in_polygon(start[0], start[1], points):
+                return True
+            for i in range(len(points)):
+                if are_lines_intersecting(points[i - 1], points[i], start, end):
+                    return True
+
+        return False
+
+
 def has_line_of_sight(
     observer: Point2,
     target: Point2,
@@ -384,6 +888,10 @@ def has_line_of_sight(
     """
     Determine if we have line of sight between two points.
 
+    The line between the points is checked against the hit boxes of
+    the walls exactly. Only the walls in the spatial hash cells the line
+    passes through are checked.
+
     .. warning:: Try to make sure spatial hashing is enabled on ``walls``!
 
         If spatial hashing is not enabled, this function may run
@@ -399,8 +907,7 @@ def has_line_of_sight(
         max_distance:
             Max distance point 1 can see
         check_resolution:
-            Check every x pixels for a sprite.
-            Trade-off between accuracy and speed.
+            Not used. The check is exact, so there's no resolution to set.
 
     Returns:
         Whether or not observer to target is blocked by any wall in walls
@@ -413,18 +920,65 @@ def has_line_of_sight(
     distance = get_distance(observer[0], observer[1], target[0], target[1])
     if distance == 0:
         return True
+    if distance > max_distance:
+        return False
+
+    return not _LineOfSightWalls(walls).is_blocked(observer, target)
 
-    steps = int(distance // check_resolution)
-    for step in range(steps + 1):
-        step_distance = step * check_resolution
-        u = step_distance / distance
-        midpoint = lerp_2d(observer, target, u)
-        if step_distance > max_distance:
-            return False
-        sprite_list = get_sprites_at_point(midpoint, walls)
-        if len(sprite_list) > 0:
-            return False
-    return True
+
+def has_line_of_sight_many(
+    observers: Sequence[Point2],
+    targets: Sequence[Point2],
+    walls: SpriteList,
+    max_distance: float = float("inf"),
+) -> list[list[bool]]:
+    """
+    Determine if there is line of sight between each observer and each target.
+
+    This gives the same results as calling :py:func:`has_line_of_sight`
+    for every pair, but the shapes of the walls are only worked out once.
+
+    Example::
+
+        visible = arcade.has_line_of_sight_many(
+            [enemy.position for enemy in enemies],
+            [player.position],
+            walls,
+            max_distance=400,
+        )
+        for enemy, (can_see_player,) in zip(enemies, visible):
+            ...
+
+    Args:
+        observers:
+            Start positions
+        targets:
+            End positions
+        walls:
+            List of all blocking sprites
+        max_distance:
+            Max distance the observers can see
+
+    Returns:
+        A list for each observer with a ``bool`` for each target
+    """
+    if max_distance <= 0:
+        raise ValueError("max_distance must be greater than zero")
+
+    line_of_sight_walls = _LineOfSightWalls(walls)
+    results = []
+    for observer in observers:
+        row = []
+        for target in targets:
+            distance = get_distance(observer[0], observer[1], target[0], target[1])
+            if distance == 0:
+                row.append(True)
+            elif distance > max_distance:
+                row.append(False)
+            else:
+                row.append(not line_of_sight_walls.is_blocked(observer, target))
+        results.append(row)
+    return results
 
 
 # NOTE: Rewrite this
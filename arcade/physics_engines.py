@@ -15,16 +15,68 @@
     check_for_collision,
     check_for_collision_with_lists,
 )
+from arcade.geometry import get_minimum_translation_vector
 from arcade.math import get_distance
+from arcade.types import Point2List
+from arcade.sprite_list.collision import _sweep_sprite
 
 __all__ = ["PhysicsEngineSimple", "PhysicsEnginePlatformer"]
 
 from arcade.utils import Chain, copy_dunders_unimplemented
 
 
+def _push_until_free(
+    colliding: Sprite, walls: Iterable[SpriteList], hit_list: list, max_iterations: int = 4
+) -> None:
+    """Move a colliding sprite out of the walls it overlaps.
+
+    Each iteration adds up the minimum translation vectors out of the
+    walls hit and moves the sprite once. This usually frees the sprite in a
+    single step. If the walls keep pushing the sprite into each other,
+    :py:func:`_wiggle_until_free` is used instead.
+
+    Args:
+        colliding:
+            A sprite to move out of the given list of SpriteLists.
+        walls:
+            A list of walls to move out of.
+        hit_list:
+            The walls the sprite currently collides with.
+        max_iterations:
+            How many times to move the sprite before falling back
+            to the search.
+    """
+    o_x, o_y = colliding.position
+
+    for _ in range(max_iterations):
+        points = colliding.hit_box.get_adjusted_points()
+        dx = dy = 0.0
+        for wall in hit_list:
+            # Push out of each wall from where the previous walls left it
+            moved_points: Point2List
+            if dx or dy:
+                moved_points = tuple((x + dx, y + dy) for x, y in points)
+            else:
+                moved_points = points
+            mtv = get_minimum_translation_vector(moved_points, wall.hit_box.get_adjusted_points())
+            if mtv is not None:
+                dx += mtv[0]
+                dy += mtv[1]
+
+        colliding.position = colliding.center_x + dx, colliding.center_y + dy
+        hit_list = check_for_collision_with_lists(colliding, walls)
+        if len(hit_list) == 0:
+            return
+
+    colliding.position = o_x, o_y
+    _wiggle_until_free(colliding, walls)
+
+
 def _wiggle_until_free(colliding: Sprite, walls: Iterable[SpriteList]) -> None:
     """Kludge to 'guess' a colliding sprite out of a collision.
 
+    This is the fallback for :py:func:`_push_until_free`.
+
     It works by iterating over increasing wiggle sizes of 8 points
     around the ``colliding`` sprite's original center position. Each
     time it fails to find a free position. Although the wiggle distance
@@ -81,6 +133,33 @@ def _wiggle_until_free(colliding: Sprite, walls: Iterable[SpriteList]) -> None:
         wiggle_distance *= 2
 
 
+def _move_to_contact(moving_sprite: Sprite, dx: float, dy: float, touching: list) -> None:
+    """Move a sprite up to the contact point found by a sweep.
+
+    Floating point rounding can leave the hit boxes overlapping by a tiny
+    amount. If so, the sprite is nudged back towards its start position.
+
+    Args:
+        moving_sprite:
+            The sprite to move.
+        dx:
+            The x distance to the contact point.
+        dy:
+            The y distance to the contact point.
+        touching:
+            The sprites touched at the contact point.
+    """
+    start_x, start_y = moving_sprite.position
+    x, y = start_x + dx, start_y + dy
+    moving_sprite.position = x, y
+    for _ in range(4):
+        if not any(check_for_collision(moving_sprite, other) for other in touching):
+            return
+        x = math.nextafter(x, start_x)
+        y = math.nextafter(y, start_y)
+        moving_sprite.position = x, y
+
+
 def _move_sprite(
     moving_sprite: Sprite, can_collide: Iterable[SpriteList[SpriteType]], ramp_up: bool
 ) -> list[SpriteType]:
@@ -92,6 +171,13 @@ def _move_sprite(
     #. Move in the y direction
     #. Move in the x direction
 
+    Each move first sweeps the sprite's hit box along the whole path. If the
+    sprite and everything in its path have unrotated box hit boxes, the
+    sweep gives the exact contact point with a single query and fast sprites
+    can't pass through thin walls. When ramping up, the sprite then tries to
+    climb from the contact point. Otherwise the sprite is moved and checked
+    for collisions step by step.
+
     Args:
         moving_sprite:
             The sprite to move.
@@ -106,8 +192,9 @@ def _move_sprite(
         collided with.
     """
     # See if we are starting this turn with a sprite already colliding with us.
-    if len(check_for_collision_with_lists(moving_sprite, can_collide)) > 0:
-        _wiggle_until_free(moving_sprite, can_collide)
+    starting_hit_list = check_for_collision_with_lists(moving_sprite, can_collide)
+    if len(starting_hit_list) > 0:
+        _push_until_free(moving_sprite, can_collide, starting_hit_list)
 
     original_x, original_y = moving_sprite.position
     original_angle = moving_sprite.angle
@@ -126,8 +213,8 @@ def _move_sprite(
 
             max_distance = (moving_sprite.width + moving_sprite.height) / 2
 
-            # Resolve any collisions by this weird kludge
-            _wiggle_until_free(moving_sprite, can_collide)
+            # Resolve any collisions
+            _push_until_free(moving_sprite, can_collide, rotating_hit_list)
             if (
                 get_distance(original_x, original_y, moving_sprite.center_x, moving_sprite.center_y)
                 > max_distance
@@ -137,12 +224,137 @@ def _move_sprite(
                 moving_sprite.angle = original_angle
 
     # --- Move in the y direction
+    change_y = moving_sprite.change_y
+    _, hit_list_y, _, contact_delta, exact = _sweep_sprite(
+        moving_sprite, (0.0, change_y), can_collide
+    )
+    if exact:
+        complete_hit_list = hit_list_y
+        if len(hit_list_y) > 0:
+            _move_to_contact(moving_sprite, 0.0, contact_delta[1], hit_list_y)
+            if change_y < 0:
+                for item in hit_list_y:
+                    # NOTE: Not all sprites have velocity
+                    if getattr(item, "change_x", 0.0) != 0:
+                        moving_sprite.center_x += item.change_x  # type: ignore
+            moving_sprite.change_y = min(0.0, getattr(hit_list_y[0], "change_y", 0.0))
+        else:
+            moving_sprite.center_y += change_y
+    else:
+        complete_hit_list = _move_sprite_y_steps(moving_sprite, can_collide)
+
+    # end_time = time.time()
+    # print(f"Move 1 - {end_time - start_time:7.4f}")
+    # start_time = time.time()
+
+    # --- Move in the x direction
+    if moving_sprite.change_x:
+        moving_sprite.center_x = original_x
+        _, hit_list_x, _, contact_delta, exact = _sweep_sprite(
+            moving_sprite, (moving_sprite.change_x, 0.0), can_collide
+        )
+        if exact:
+            if len(hit_list_x) > 0:
+                _move_to_contact(moving_sprite, contact_delta[0], 0.0, hit_list_x)
+                for sprite in hit_list_x:
+                    if sprite not in complete_hit_list:
+                        complete_hit_list.append(sprite)
+                if ramp_up:
+                    _climb_from_contact(
+                        moving_sprite,
+                        can_collide,
+                        moving_sprite.change_x - contact_delta[0],
+                        complete_hit_list,
+                    )
+            else:
+                moving_sprite.center_x += moving_sprite.change_x
+        else:
+            _move_sprite_x_steps(
+                moving_sprite, can_collide, ramp_up, original_x, original_y, complete_hit_list
+            )
+
+    # Add in rotating hit list
+    for sprite in rotating_hit_list:
+        if sprite not in complete_hit_list:
+            complete_hit_list.append(sprite)
+
+    return complete_hit_list
+
+
+def _climb_from_contact(
+    moving_sprite: Sprite,
+    can_collide: Iterable[SpriteList[SpriteType]],
+    remaining_x: float,
+    complete_hit_list: list[SpriteType],
+) -> None:
+    """Try to climb onto whatever stopped a sprite moving in the x direction.
+
+    Like the step by step ramp checks, the sprite is lifted by up to the
+    distance it has left to move. It is then swept forward and dropped back
+    down. The climb is only kept if the sprite comes to rest on something
+    higher than where it started, so it can't hop over thin walls.
+
+    Args:
+        moving_sprite:
+            The sprite to move. It must be at the contact point.
+        can_collide:
+            An iterable source of SpriteList objects which can be
+            collided with.
+        remaining_x:
+            The x distance left to move after the contact point.
+        complete_hit_list:
+            The list to add sprites hit to.
+    """
+    start_x, start_y = moving_sprite.position
+    climb = abs(remaining_x)
+    if climb == 0:
+        return
+
+    moving_sprite.center_y = start_y + climb
+    if len(check_for_collision_with_lists(moving_sprite, can_collide)) == 0:
+        _, hit_list, _, contact_delta, exact = _sweep_sprite(
+            moving_sprite, (remaining_x, 0.0), can_collide
+        )
+        if exact:
+            if len(hit_list) > 0:
+                _move_to_contact(moving_sprite, contact_delta[0], 0.0, hit_list)
+            else:
+                moving_sprite.center_x += remaining_x
+
+            _, below, _, contact_delta, exact = _sweep_sprite(
+                moving_sprite, (0.0, -climb), can_collide
+            )
+            # Landing at the starting height (within rounding) means
+            # the sprite went over something instead of onto it
+            if exact and len(below) > 0 and climb + contact_delta[1] > 1e-6:
+                _move_to_contact(moving_sprite, 0.0, contact_delta[1], below)
+                for sprite in hit_list:
+                    if sprite not in complete_hit_list:
+                        complete_hit_list.append(sprite)
+                return
+
+    moving_sprite.position = start_x, start_y
+
+
+def _move_sprite_y_steps(
+    moving_sprite: Sprite, can_collide: Iterable[SpriteList[SpriteType]]
+) -> list[SpriteType]:
+    """Move a sprite in the y direction by moving it and backing out of collisions.
+
+    Args:
+        moving_sprite:
+            The sprite to move.
+        can_collide:
+            An iterable source of SpriteList objects which can be
+            collided with.
+    Returns:
+        A list of sprites hit.
+    """
     moving_sprite.center_y += moving_sprite.change_y
 
     # Check for wall hit
     hit_list_x = check_for_collision_with_lists(moving_sprite, can_collide)
     # print(f"Post-y move {hit_list_x}")
-    complete_hit_list = hit_list_x
 
     # If we hit a wall, move so the edges are at the same point
     if len(hit_list_x) > 0:
@@ -178,104 +390,115 @@ def _move_sprite(
     # print(f"Spot D ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
     moving_sprite.center_y = round(moving_sprite.center_y, 2)
     # print(f"Spot Q ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
+    return hit_list_x
 
-    # end_time = time.time()
-    # print(f"Move 1 - {end_time - start_time:7.4f}")
-    # start_time = time.time()
-
-    loop_count = 0
-    # --- Move in the x direction
-    if moving_sprite.change_x:
-        # Keep track of our current y, used in ramping up
-        almost_original_y = moving_sprite.center_y
-
-        # Strip off sign so we only have to write one version of this for
-        # both directions
-        direction = math.copysign(1, moving_sprite.change_x)
-        cur_x_change = abs(moving_sprite.change_x)
-        upper_bound = cur_x_change
-        lower_bound: float = 0
-        cur_y_change: float = 0
-
-        exit_loop = False
-        while not exit_loop:
-
-            loop_count += 1
-            # print(f"{cur_x_change=}, {upper_bound=}, {lower_bound=}, {loop_count=}")
 
-            # Move sprite and check for collisions
-            moving_sprite.center_x = original_x + cur_x_change * direction
-            collision_check = check_for_collision_with_lists(moving_sprite, can_collide)
-
-            # Update collision list
-            for sprite in collision_check:
-                if sprite not in complete_hit_list:
-                    complete_hit_list.append(sprite)
-
-            # Did we collide?
-            if len(collision_check) > 0:
-                # We did collide. Can we ramp up and not collide?
-                if ramp_up:
-                    cur_y_change = cur_x_change
-                    moving_sprite.center_y = original_y + cur_y_change
-
-                    collision_check = check_for_collision_with_lists(moving_sprite, can_collide)
-                    if len(collision_check) > 0:
-                        cur_y_change -= cur_x_change
-                    else:
-                        while (len(collision_check) == 0) and cur_y_change > 0:
-                            # print("Ramp up check")
-                            cur_y_change -= 1
-                            moving_sprite.center_y = almost_original_y + cur_y_change
-                            collision_check = check_for_collision_with_lists(
-                                moving_sprite, can_collide
-                            )
-                        cur_y_change += 1
-                        collision_check = []
+def _move_sprite_x_steps(
+    moving_sprite: Sprite,
+    can_collide: Iterable[SpriteList[SpriteType]],
+    ramp_up: bool,
+    original_x: float,
+    original_y: float,
+    complete_hit_list: list[SpriteType],
+) -> None:
+    """Move a sprite in the x direction with a binary search for a free position.
 
+    Args:
+        moving_sprite:
+            The sprite to move.
+        can_collide:
+            An iterable source of SpriteList objects which can be
+            collided with.
+        ramp_up:
+            Whether to enable platformer-like ramp support.
+        original_x:
+            The x position before moving.
+        original_y:
+            The y position before moving in the y direction.
+        complete_hit_list:
+            The list to add sprites hit to.
+    """
+    loop_count = 0
+    # Keep track of our current y, used in ramping up
+    almost_original_y = moving_sprite.center_y
+
+    # Strip off sign so we only have to write one version of this for
+    # both directions
+    direction = math.copysign(1, moving_sprite.change_x)
+    cur_x_change = abs(moving_sprite.change_x)
+    upper_bound = cur_x_change
+    lower_bound: float = 0
+    cur_y_change: float = 0
+
+    exit_loop = False
+    while not exit_loop:
+
+        loop_count += 1
+        # print(f"{cur_x_change=}, {upper_bound=}, {lower_bound=}, {loop_count=}")
+
+        # Move sprite and check for collisions
+        moving_sprite.center_x = original_x + cur_x_change * direction
+        collision_check = check_for_collision_with_lists(moving_sprite, can_collide)
+
+        # Update collision list
+        for sprite in collision_check:
+            if sprite not in complete_hit_list:
+                complete_hit_list.append(sprite)
+
+        # Did we collide?
+        if len(collision_check) > 0:
+            # We did collide. Can we ramp up and not collide?
+            if ramp_up:
+                cur_y_change = cur_x_change
+                moving_sprite.center_y = original_y + cur_y_change
+
+                collision_check = check_for_collision_with_lists(moving_sprite, can_collide)
                 if len(collision_check) > 0:
-                    # print(f"Yes @ {cur_x_change}")
-                    upper_bound = cur_x_change - 1
-                    if upper_bound - lower_bound <= 0:
-                        cur_x_change = lower_bound
-                        exit_loop = True
-                        # print(f"Exit 2 @ {cur_x_change}")
-                    else:
-                        cur_x_change = (upper_bound + lower_bound) // 2
+                    cur_y_change -= cur_x_change
                 else:
-                    exit_loop = True
-                    # print(f"Exit 1 @ {cur_x_change}")
+                    while (len(collision_check) == 0) and cur_y_change > 0:
+                        # print("Ramp up check")
+                        cur_y_change -= 1
+                        moving_sprite.center_y = almost_original_y + cur_y_change
+                        collision_check = check_for_collision_with_lists(
+                            moving_sprite, can_collide
+                        )
+                    cur_y_change += 1
+                    collision_check = []
 
-            else:
-                # No collision. Keep this new position and exit
-                lower_bound = cur_x_change
+            if len(collision_check) > 0:
+                # print(f"Yes @ {cur_x_change}")
+                upper_bound = cur_x_change - 1
                 if upper_bound - lower_bound <= 0:
-                    # print(f"Exit 3 @ {cur_x_change}")
+                    cur_x_change = lower_bound
                     exit_loop = True
+                    # print(f"Exit 2 @ {cur_x_change}")
                 else:
-                    # print(f"No @ {cur_x_change}")
-                    cur_x_change = (upper_bound + lower_bound) // 2 + (
-                        upper_bound + lower_bound
-                    ) % 2
-
-        # print(cur_x_change * direction, cur_y_change)
-        moved_x = original_x + cur_x_change * direction
-        moved_y = almost_original_y + cur_y_change
-        moving_sprite.position = moved_x, moved_y
-        # print(
-        #     f"({moving_sprite.center_x}, {moving_sprite.center_y}) "
-        #     f"{cur_x_change * direction}, {cur_y_change}"
-        # )
-
-    # Add in rotating hit list
-    for sprite in rotating_hit_list:
-        if sprite not in complete_hit_list:
-            complete_hit_list.append(sprite)
-
-    # end_time = time.time()
-    # print(f"Move 2 - {end_time - start_time:7.4f} {loop_count}")
+                    cur_x_change = (upper_bound + lower_bound) // 2
+            else:
+                exit_loop = True
+                # print(f"Exit 1 @ {cur_x_change}")
 
-    return complete_hit_list
+        else:
+            # No collision. Keep this new position and exit
+            lower_bound = cur_x_change
+            if upper_bound - lower_bound <= 0:
+                # print(f"Exit 3 @ {cur_x_change}")
+                exit_loop = True
+            else:
+                # print(f"No @ {cur_x_change}")
+                cur_x_change = (upper_bound + lower_bound) // 2 + (
+                    upper_bound + lower_bound
+                ) % 2
+
+    # print(cur_x_change * direction, cur_y_change)
+    moved_x = original_x + cur_x_change * direction
+    moved_y = almost_original_y + cur_y_change
+    moving_sprite.position = moved_x, moved_y
+    # print(
+    #     f"({moving_sprite.center_x}, {moving_sprite.center_y}) "
+    #     f"{cur_x_change * direction}, {cur_y_change}"
+    # )
 
 
 def _add_to_list(dest: list[SpriteList], source: SpriteList | Iterable[SpriteList] | None) -> None:
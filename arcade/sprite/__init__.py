@@ -12,6 +12,7 @@
 from .animated import (
     TextureAnimationSprite,
     TextureAnimation,
+    TextureAnimationScheduler,
     TextureKeyframe,
     AnimatedWalkingSprite,
 )
@@ -76,6 +77,7 @@ def load_animated_gif(resource_name: str | Path) -> TextureAnimationSprite:
     "PyMunk",
     "TextureAnimationSprite",
     "TextureAnimation",
+    "TextureAnimationScheduler",
     "TextureKeyframe",
     "AnimatedWalkingSprite",
     "load_animated_gif",
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import bisect
+import heapq
+import itertools
 import logging
 import math
+from typing import Iterable, Iterator
 
 from arcade import Texture
 from arcade.types import Point2
@@ -158,22 +161,37 @@ def __init__(
             center_x=center_x,
             center_y=center_y,
         )
+        # When the sprite is in a scheduler this is the time relative
+        # to the time of the scheduler. See the time property.
         self._time = 0.0
         self._animation: TextureAnimation | None = None
+        self._current_keyframe_index = 0
+        # The time span of the current keyframe in milliseconds. The keyframe
+        # is only looked up again when the time moves outside of it.
+        self._keyframe_start_ms = 0
+        self._keyframe_end_ms = 0
+        # The scheduler updating this sprite and the id of its entry
+        self._scheduler: TextureAnimationScheduler | None = None
+        self._schedule_id = -1
         if animation:
             self.animation = animation
-        self._current_keyframe_index = 0
 
     @property
     def time(self) -> float:
         """
         Get or set the current time of the animation in seconds.
         """
+        if self._scheduler is not None:
+            return self._time + self._scheduler._time
         return self._time
 
     @time.setter
     def time(self, value: float) -> None:
-        self._time = value
+        if self._scheduler is not None:
+            self._time = value - self._scheduler._time
+            self._scheduler._schedule(self)
+        else:
+            self._time = value
 
     @property
     def animation(self) -> TextureAnimation:
@@ -194,8 +212,13 @@ def animation(self, value: TextureAnimation) -> None:
         """
         self._animation = value
         # TODO: Forcing the first frame here might not be the best idea.
+        self._current_keyframe_index = 0
+        self._keyframe_start_ms = 0
+        self._keyframe_end_ms = 0
         self.texture = value._keyframes[0].texture
         self.sync_hit_box_to_texture()
+        if self._scheduler is not None:
+            self._scheduler._schedule(self)
 
     def update_animation(self, delta_time: float = 1 / 60, **kwargs) -> None:
         """
@@ -208,10 +231,197 @@ def update_animation(self, delta_time: float = 1 / 60, **kwargs) -> None:
             raise RuntimeError("No animation set for this sprite.")
 
         self.time += delta_time
-        index, keyframe = self._animation.get_keyframe(self.time)
+        self._update_keyframe()
+
+    def _update_keyframe(self) -> None:
+        """
+        Show the keyframe for the current time of the looping animation.
+
+        The timeline is only searched when the time is outside the
+        span of the current keyframe.
+        """
+        time_ms = int(self.time * 1000)
+        if self._keyframe_start_ms <= time_ms < self._keyframe_end_ms:
+            return
+
+        animation = self._animation
+        if animation is None:
+            raise RuntimeError("No animation set for this sprite.")
+
+        timeline = animation._timeline
+        duration_ms = animation._duration_ms
+        loop_start_ms = time_ms // duration_ms * duration_ms
+        index = bisect.bisect_right(timeline, time_ms - loop_start_ms) - 1
+        self._keyframe_start_ms = loop_start_ms + timeline[index]
+        if index + 1 < len(timeline):
+            self._keyframe_end_ms = loop_start_ms + timeline[index + 1]
+        else:
+            self._keyframe_end_ms = loop_start_ms + duration_ms
+
         if index != self._current_keyframe_index:
             self._current_keyframe_index = index
-            self.texture = keyframe.texture
+            self.texture = animation._keyframes[index].texture
+
+
+class TextureAnimationScheduler:
+    """
+    Updates many :py:class:`TextureAnimationSprite` instances, only
+    touching the sprites whose keyframe changes.
+
+    Calling :py:meth:`~arcade.SpriteList.update_animation` looks up the
+    current keyframe of every sprite in the list each frame. For large
+    maps with animated tiles most of them show the same keyframe for
+    many frames in a row. The scheduler keeps the sprites in a heap sorted
+    by the time their keyframe ends, so an update only costs time for
+    the sprites that actually change texture.
+
+    Example::
+
+        self.water_animation = arcade.TextureAnimationScheduler(
+            self.tile_map.sprite_lists["Water"]
+        )
+
+        def on_update(self, delta_time):
+            self.water_animation.update_animation(delta_time)
+
+    The time of a sprite in the scheduler still reads and writes as
+    usual. The scheduler only moves forward in time, and animations
+    always loop. Sprites are kept until they are removed from the
+    scheduler, so remember to remove sprites that are killed. Subclasses
+    overriding :py:meth:`TextureAnimationSprite.update_animation` should
+    not be added as the method is not called by the scheduler.
+
+    Args:
+        sprites: Sprites to add to the scheduler.
+    """
+
+    def __init__(self, sprites: Iterable[TextureAnimationSprite] = ()) -> None:
+        # The time in seconds the scheduler has advanced
+        self._time = 0.0
+        self._sprites: set[TextureAnimationSprite] = set()
+        # Entries of (time in milliseconds, id, sprite). An entry is only
+        # valid if the id is still the schedule id of the sprite.
+        self._heap: list[tuple[int, int, TextureAnimationSprite]] = []
+        self._ids = itertools.count()
+        for sprite in sprites:
+            self.add(sprite)
+
+    def __len__(self) -> int:
+        """Return the number of sprites in the scheduler."""
+        return len(self._sprites)
+
+    def __contains__(self, sprite: TextureAnimationSprite) -> bool:
+        """Return if the sprite is in the scheduler."""
+        return sprite in self._sprites
+
+    def __iter__(self) -> Iterator[TextureAnimationSprite]:
+        """Return an iterator over the sprites in the scheduler."""
+        return iter(self._sprites)
+
+    @property
+    def time(self) -> float:
+        """The time in seconds the scheduler has advanced."""
+        return self._time
+
+    def add(self, sprite: TextureAnimationSprite) -> None:
+        """
+        Add a sprite to the scheduler.
+
+        The sprite keeps its current time.
+
+        Args:
+            sprite: The sprite to add
+        """
+        if sprite._scheduler is self:
+            return
+        if sprite._scheduler is not None:
+            raise ValueError("Sprite is already in another TextureAnimationScheduler")
+        if sprite._animation is None:
+            raise RuntimeError("No animation set for this sprite.")
+
+        sprite._time -= self._time
+        sprite._scheduler = self
+        self._sprites.add(sprite)
+        self._schedule(sprite)
+
+    def extend(self, sprites: Iterable[TextureAnimationSprite]) -> None:
+        """
+        Add several sprites to the scheduler.
+
+        Args:
+            sprites: The sprites to add
+        """
+        for sprite in sprites:
+            self.add(sprite)
+
+    def remove(self, sprite: TextureAnimationSprite) -> None:
+        """
+        Remove a sprite from the scheduler.
+
+        The sprite keeps its current time.
+
+        Args:
+            sprite: The sprite to remove
+        """
+        if sprite._scheduler is not self:
+            raise ValueError("Sprite is not in this TextureAnimationScheduler")
+
+        sprite._time += self._time
+        sprite._scheduler = None
+        sprite._schedule_id = -1
+        self._sprites.remove(sprite)
+
+    def clear(self) -> None:
+        """Remove all sprites from the scheduler."""
+        for sprite in list(self._sprites):
+            self.remove(sprite)
+        self._heap = []
+
+    def update_animation(self, delta_time: float = 1 / 60) -> None:
+        """
+        Move time forward and update the sprites whose keyframe changed.
+
+        Args:
+            delta_time: Time since last update in seconds. Must not be negative.
+        """
+        if delta_time < 0:
+            raise ValueError("delta_time must not be negative")
+
+        self._time += delta_time
+        # Truncated to milliseconds like the keyframe lookup of the sprites
+        time_ms = int(self._time * 1000)
+        heap = self._heap
+
+        # Collect the sprites first. A sprite due before its keyframe
+        # changes because of rounding is checked again in the next update.
+        due = []
+        while heap and heap[0][0] <= time_ms:
+            _, schedule_id, sprite = heapq.heappop(heap)
+            if sprite._schedule_id == schedule_id and sprite._scheduler is self:
+                due.append(sprite)
+
+        for sprite in due:
+            self._schedule(sprite)
+
+    def _schedule(self, sprite: TextureAnimationSprite) -> None:
+        """Update the keyframe of a sprite and schedule the next change."""
+        sprite._update_keyframe()
+        schedule_id = next(self._ids)
+        sprite._schedule_id = schedule_id
+        # The scheduler time in milliseconds when the time of the sprite
+        # reaches the end of the keyframe. Rounded down so the sprite is
+        # never updated late.
+        end_ms = math.floor(sprite._keyframe_end_ms - sprite._time * 1000)
+        heapq.heappush(self._heap, (end_ms, schedule_id, sprite))
+
+        # Drop outdated entries left by sprites that changed time or were removed
+        if len(self._heap) > 2 * len(self._sprites) + 64:
+            self._heap = [
+                entry
+                for entry in self._heap
+                if entry[2]._schedule_id == entry[1] and entry[2]._scheduler is self
+            ]
+            heapq.heapify(self._heap)
 
 
 class AnimatedWalkingSprite(Sprite):
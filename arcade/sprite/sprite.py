@@ -53,7 +53,7 @@ class Sprite(BasicSprite, PymunkMixin):
 
     __slots__ = (
         "_velocity",
-        "change_angle",
+        "_change_angle",
         "_properties",
         "boundary_left",
         "boundary_right",
@@ -100,8 +100,7 @@ def __init__(
         self._angle = angle
         # Movement
         self._velocity = 0.0, 0.0
-        self.change_angle: float = 0.0
-        """Change in angle per 1/60th of a second."""
+        self._change_angle = 0.0
 
         # Custom sprite properties
         self._properties: dict[str, Any] | None = None
@@ -207,6 +206,8 @@ def velocity(self) -> Point2:
     @velocity.setter
     def velocity(self, new_value: Point2) -> None:
         self._velocity = new_value
+        for sprite_list in self.sprite_lists:
+            sprite_list._update_velocity(self)
 
     @property
     def change_x(self) -> float:
@@ -215,7 +216,7 @@ def change_x(self) -> float:
 
     @change_x.setter
     def change_x(self, new_value: float) -> None:
-        self._velocity = new_value, self._velocity[1]
+        self.velocity = new_value, self._velocity[1]
 
     @property
     def change_y(self) -> float:
@@ -224,7 +225,18 @@ def change_y(self) -> float:
 
     @change_y.setter
     def change_y(self, new_value: float) -> None:
-        self._velocity = self._velocity[0], new_value
+        self.velocity = self._velocity[0], new_value
+
+    @property
+    def change_angle(self) -> float:
+        """Get or set the change in angle per 1/60th of a second."""
+        return self._change_angle
+
+    @change_angle.setter
+    def change_angle(self, new_value: float) -> None:
+        self._change_angle = new_value
+        for sprite_list in self.sprite_lists:
+            sprite_list._update_velocity(self)
 
     @property
     def hit_box(self) -> HitBox:
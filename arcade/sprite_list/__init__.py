@@ -1,28 +1,41 @@
 from __future__ import annotations
 
 from .sprite_list import SpriteList
+from .sprite_pool import SpritePool
+from .sprite_store import SpriteStore, SpriteView
+from .broad_phase import BroadPhase
 from .spatial_hash import SpatialHash
+from .aabb_tree import AABBTree
 from .collision import (
     get_distance_between_sprites,
     get_closest_sprite,
     check_for_collision,
     check_for_collision_with_list,
     check_for_collision_with_lists,
+    check_for_collision_between_lists,
     get_sprites_at_point,
     get_sprites_at_exact_point,
     get_sprites_in_rect,
+    sweep_sprite,
 )
 
 
 __all__ = [
     "SpriteList",
+    "SpritePool",
+    "SpriteStore",
+    "SpriteView",
+    "BroadPhase",
     "SpatialHash",
+    "AABBTree",
     "get_distance_between_sprites",
     "get_closest_sprite",
     "check_for_collision",
     "check_for_collision_with_list",
     "check_for_collision_with_lists",
+    "check_for_collision_between_lists",
     "get_sprites_at_point",
     "get_sprites_at_exact_point",
     "get_sprites_in_rect",
+    "sweep_sprite",
 ]
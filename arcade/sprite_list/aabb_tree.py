@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+from typing import Generic
+
+from arcade.sprite import SpriteType
+from arcade.sprite.base import BasicSprite
+from arcade.types import Point
+from arcade.types.rect import Rect
+
+from .broad_phase import BroadPhase
+
+
+class _Node(Generic[SpriteType]):
+    """A node in the AABB tree. Leaf nodes hold a sprite."""
+
+    __slots__ = (
+        "left",
+        "bottom",
+        "right",
+        "top",
+        "parent",
+        "child1",
+        "child2",
+        "height",
+        "sprite",
+    )
+
+    def __init__(self) -> None:
+        self.left = 0.0
+        self.bottom = 0.0
+        self.right = 0.0
+        self.top = 0.0
+        self.parent: _Node[SpriteType] | None = None
+        self.child1: _Node[SpriteType] | None = None
+        self.child2: _Node[SpriteType] | None = None
+        # Leaves have height 0
+        self.height = 0
+        self.sprite: SpriteType | None = None
+
+    def fit(self, a: _Node, b: _Node) -> None:
+        """Set the box of this node to the union of two other nodes."""
+        self.left = a.left if a.left < b.left else b.left
+        self.bottom = a.bottom if a.bottom < b.bottom else b.bottom
+        self.right = a.right if a.right > b.right else b.right
+        self.top = a.top if a.top > b.top else b.top
+
+
+def _get_bounds(sprite: BasicSprite) -> tuple[float, float, float, float]:
+    """Get the tight (left, bottom, right, top) box around a sprite's hit box."""
+    x_points, y_points = zip(*sprite.hit_box.get_adjusted_points())
+    return min(x_points), min(y_points), max(x_points), max(y_points)
+
+
+class AABBTree(BroadPhase[SpriteType]):
+    """A dynamic bounding volume hierarchy for collision checks with moving sprites.
+
+    Each sprite is stored as a leaf holding an axis-aligned bounding box (AABB)
+    around its hit box. The leaves are organized into a balanced binary tree
+    where every node's box contains the boxes of its children. Queries only
+    descend into the nodes overlapping the area checked.
+
+    Unlike :py:class:`~arcade.sprite_list.spatial_hash.SpatialHash`, there
+    is no cell size to tune. Huge sprites only take a single leaf and tiny
+    sprites are not grouped with unrelated neighbors, so this works well for
+    lists with sprites of very different sizes.
+
+    The box stored for each sprite is enlarged by :py:attr:`margin` on every
+    side. Moving a sprite is free as long as its hit box stays inside this
+    enlarged box. This makes the tree a good fit for lists where most sprites
+    move a little every frame.
+
+    Example::
+
+        enemies = arcade.SpriteList(broad_phase=arcade.AABBTree(margin=16))
+
+    Args:
+        margin:
+            How many pixels to enlarge the stored box of each sprite by.
+            Larger values make moves cheaper, but queries return more
+            candidates.
+    """
+
+    def __init__(self, margin: float = 8.0) -> None:
+        if margin < 0:
+            raise ValueError("margin must be greater than or equal to 0")
+
+        self.margin: float = margin
+        """How many pixels each stored box is enlarged by on every side."""
+        self.root: _Node[SpriteType] | None = None
+        # The leaf node each sprite is stored in
+        self.leaf_for_sprite: dict[SpriteType, _Node[SpriteType]] = {}
+
+    def reset(self) -> None:
+        """Clear all the sprites from the tree."""
+        self.root = None
+        self.leaf_for_sprite.clear()
+
+    def add(self, sprite: SpriteType) -> None:
+        """
+        Add a sprite to the tree.
+
+        Adding a sprite already in the tree will update its location.
+
+        Args:
+            sprite: The sprite to add
+        """
+        if sprite in self.leaf_for_sprite:
+            self.remove(sprite)
+
+        leaf: _Node[SpriteType] = _Node()
+        leaf.sprite = sprite
+        self._set_fat_bounds(leaf, _get_bounds(sprite))
+        self._insert_leaf(leaf)
+        self.leaf_for_sprite[sprite] = leaf
+
+    def move(self, sprite: SpriteType) -> None:
+        """
+        Update the location of a sprite already in the tree.
+
+        This does nothing if the sprite's hit box is still inside its
+        enlarged box. Otherwise the sprite is re-inserted.
+
+        Args:
+            sprite: The sprite to move
+        """
+        leaf = self.leaf_for_sprite[sprite]
+        bounds = _get_bounds(sprite)
+        left, bottom, right, top = bounds
+        if (
+            leaf.left <= left
+            and leaf.bottom <= bottom
+            and right <= leaf.right
+            and top <= leaf.top
+        ):
+            return
+
+        self._remove_leaf(leaf)
+        self._set_fat_bounds(leaf, bounds)
+        self._insert_leaf(leaf)
+
+    def remove(self, sprite: SpriteType) -> None:
+        """
+        Remove a sprite from the tree.
+
+        Args:
+            sprite: The sprite to remove
+        """
+        leaf = self.leaf_for_sprite.pop(sprite)
+        self._remove_leaf(leaf)
+
+    def get_sprites_near_sprite(self, sprite: BasicSprite) -> set[SpriteType]:
+        """
+        Get all the sprites with a stored box overlapping the given sprite.
+
+        Args:
+            sprite: The sprite to check
+        """
+        return self._query(*_get_bounds(sprite))
+
+    def get_sprites_near_point(self, point: Point) -> set[SpriteType]:
+        """
+        Get all the sprites with a stored box containing the given point.
+
+        Args:
+            point: The point to check
+        """
+        x, y = point[0], point[1]
+        return self._query(x, y, x, y)
+
+    def get_sprites_near_rect(self, rect: Rect) -> set[SpriteType]:
+        """
+        Get all the sprites with a stored box overlapping the given rectangle.
+
+        Args:
+            rect: The rectangle to check
+        """
+        left, right, bottom, top = rect.lrbt
+        return self._query(left, bottom, right, top)
+
+    @property
+    def count(self) -> int:
+        """Return the number of sprites in the tree"""
+        return len(self.leaf_for_sprite)
+
+    @property
+    def height(self) -> int:
+        """The height of the tree. An empty tree or a single leaf has height 0."""
+        return self.root.height if self.root is not None else 0
+
+    def _set_fat_bounds(
+        self, leaf: _Node[SpriteType], bounds: tuple[float, float, float, float]
+    ) -> None:
+        margin = self.margin
+        leaf.left = bounds[0] - margin
+        leaf.bottom = bounds[1] - margin
+        leaf.right = bounds[2] + margin
+        leaf.top = bounds[3] + margin
+
+    def _query(self, left: float, bottom: float, right: float, top: float) -> set[SpriteType]:
+        """Collect the sprites in all leaves overlapping a box."""
+        result: set[SpriteType] = set()
+        if self.root is None:
+            return result
+
+        stack = [self.root]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if node.right < left or node.left > right or node.top < bottom or node.bottom > top:
+                continue
+            if node.sprite is not None:
+                result.add(node.sprite)
+            else:
+                push(node.child1)  # type: ignore
+                push(node.child2)  # type: ignore
+
+        return result
+
+    def _insert_leaf(self, leaf: _Node[SpriteType]) -> None:
+        if self.root is None:
+            self.root = leaf
+            leaf.parent = None
+            return
+
+        # Find the best sibling for the new leaf by walking down the tree
+        # and picking the child where the perimeter grows the least.
+        # This is the same heuristic as the dynamic tree in Box2D.
+        leaf_left, leaf_bottom, leaf_right, leaf_top = leaf.left, leaf.bottom, leaf.right, leaf.top
+        node = self.root
+        while node.sprite is None:
+            child1: _Node = node.child1  # type: ignore
+            child2: _Node = node.child2  # type: ignore
+
+            perimeter = node.right - node.left + node.top - node.bottom
+            combined = (
+                max(node.right, leaf_right)
+                - min(node.left, leaf_left)
+                + max(node.top, leaf_top)
+                - min(node.bottom, leaf_bottom)
+            )
+            # Cost of creating a new parent for this node and the new leaf
+            cost = 2.0 * combined
+            # Minimum cost of pushing the leaf further down the tree
+            inheritance_cost = 2.0 * (combined - perimeter)
+
+            cost1 = self._descend_cost(child1, leaf) + inheritance_cost
+            cost2 = self._descend_cost(child2, leaf) + inheritance_cost
+
+            if cost < cost1 and cost < cost2:
+                break
+
+            node = child1 if cost1 < cost2 else child2
+
+        sibling = node
+
+        # Create a new parent for the sibling and the leaf
+        old_parent = sibling.parent
+        new_parent: _Node[SpriteType] = _Node()
+        new_parent.parent = old_parent
+        new_parent.fit(leaf, sibling)
+        new_parent.height = sibling.height + 1
+
+        if old_parent is not None:
+            if old_parent.child1 is sibling:
+                old_parent.child1 = new_parent
+            else:
+                old_parent.child2 = new_parent
+        else:
+            self.root = new_parent
+
+        new_parent.child1 = sibling
+        new_parent.child2 = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+
+        # Walk back up the tree fixing heights and boxes
+        self._refit(leaf.parent)
+
+    @staticmethod
+    def _descend_cost(child: _Node, leaf: _Node) -> float:
+        combined = (
+            max(child.right, leaf.right)
+            - min(child.left, leaf.left)
+            + max(child.top, leaf.top)
+            - min(child.bottom, leaf.bottom)
+        )
+        if child.sprite is not None:
+            return 2.0 * combined
+        return 2.0 * (combined - (child.right - child.left + child.top - child.bottom))
+
+    def _remove_leaf(self, leaf: _Node[SpriteType]) -> None:
+        if leaf is self.root:
+            self.root = None
+            return
+
+        parent: _Node = leaf.parent  # type: ignore
+        grand_parent = parent.parent
+        sibling: _Node = parent.child2 if parent.child1 is leaf else parent.child1  # type: ignore
+
+        if grand_parent is not None:
+            # Replace the parent with the sibling and refit the ancestors
+            if grand_parent.child1 is parent:
+                grand_parent.child1 = sibling
+            else:
+                grand_parent.child2 = sibling
+            sibling.parent = grand_parent
+            self._refit(grand_parent)
+        else:
+            self.root = sibling
+            sibling.parent = None
+
+        leaf.parent = None
+
+    def _refit(self, node: _Node[SpriteType] | None) -> None:
+        """Balance and recompute the boxes of a node and all its ancestors."""
+        while node is not None:
+            node = self._balance(node)
+            child1: _Node = node.child1  # type: ignore
+            child2: _Node = node.child2  # type: ignore
+            node.height = 1 + (child1.height if child1.height > child2.height else child2.height)
+            node.fit(child1, child2)
+            node = node.parent
+
+    def _balance(self, a: _Node[SpriteType]) -> _Node[SpriteType]:
+        """
+        Perform a left or right rotation if node ``a`` is imbalanced.
+
+        Returns:
+            The new root of the rotated subtree.
+        """
+        if a.sprite is not None or a.height < 2:
+            return a
+
+        b: _Node = a.child1  # type: ignore
+        c: _Node = a.child2  # type: ignore
+        balance = c.height - b.height
+
+        if balance > 1:
+            # Rotate c up
+            f: _Node = c.child1  # type: ignore
+            g: _Node = c.child2  # type: ignore
+            self._swap_parent(a, c)
+
+            if f.height > g.height:
+                c.child2 = f
+                a.child2 = g
+                g.parent = a
+                a.fit(b, g)
+                c.fit(a, f)
+                a.height = 1 + max(b.height, g.height)
+                c.height = 1 + max(a.height, f.height)
+            else:
+                c.child2 = g
+                a.child2 = f
+                f.parent = a
+                a.fit(b, f)
+                c.fit(a, g)
+                a.height = 1 + max(b.height, f.height)
+                c.height = 1 + max(a.height, g.height)
+            return c
+
+        if balance < -1:
+            # Rotate b up
+            d: _Node = b.child1  # type: ignore
+            e: _Node = b.child2  # type: ignore
+            self._swap_parent(a, b)
+
+            if d.height > e.height:
+                b.child2 = d
+                a.child1 = e
+                e.parent = a
+                a.fit(c, e)
+                b.fit(a, d)
+                a.height = 1 + max(c.height, e.height)
+                b.height = 1 + max(a.height, d.height)
+            else:
+                b.child2 = e
+                a.child1 = d
+                d.parent = a
+                a.fit(c, d)
+                b.fit(a, e)
+                a.height = 1 + max(c.height, d.height)
+                b.height = 1 + max(a.height, e.height)
+            return b
+
+        return a
+
+    def _swap_parent(self, a: _Node[SpriteType], child: _Node[SpriteType]) -> None:
+        """Move ``child`` into the place of its parent ``a``, making ``a`` its first child."""
+        child.child1 = a
+        child.parent = a.parent
+        a.parent = child
+
+        if child.parent is not None:
+            if child.parent.child1 is a:
+                child.parent.child1 = child
+            else:
+                child.parent.child2 = child
+        else:
+            self.root = child
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import abc
+from typing import Generic, Iterable
+
+from arcade.sprite import SpriteType
+from arcade.sprite.base import BasicSprite
+from arcade.types import Point
+from arcade.types.rect import Rect
+
+
+class BroadPhase(abc.ABC, Generic[SpriteType]):
+    """
+    The base class for collision broad phases used by :py:class:`~arcade.SpriteList`.
+
+    A broad phase is a data structure which can quickly find the sprites
+    which *might* overlap a sprite, point or rectangle. The sprites returned
+    from the query methods are only candidates. The collision functions
+    will run exact hit box checks on them afterwards.
+
+    A sprite list keeps its broad phase up to date when sprites are added,
+    removed or moved. The default implementation is the uniform grid in
+    :py:class:`~arcade.sprite_list.spatial_hash.SpatialHash`. See
+    :py:class:`~arcade.sprite_list.aabb_tree.AABBTree` for an alternative
+    better suited for sprites of very different sizes or lists where
+    most sprites move.
+    """
+
+    @abc.abstractmethod
+    def reset(self) -> None:
+        """Clear all the sprites from the broad phase."""
+        ...
+
+    @abc.abstractmethod
+    def add(self, sprite: SpriteType) -> None:
+        """
+        Add a sprite to the broad phase.
+
+        Args:
+            sprite: The sprite to add
+        """
+        ...
+
+    def add_many(self, sprites: Iterable[SpriteType]) -> None:
+        """
+        Add several sprites to the broad phase.
+
+        Subclasses can override this with a faster bulk version.
+
+        Args:
+            sprites: The sprites to add
+        """
+        for sprite in sprites:
+            self.add(sprite)
+
+    @abc.abstractmethod
+    def move(self, sprite: SpriteType) -> None:
+        """
+        Update the location of a sprite already in the broad phase.
+
+        This is called every time a sprite's position, size or hit box changes.
+
+        Args:
+            sprite: The sprite to move
+        """
+        ...
+
+    @abc.abstractmethod
+    def remove(self, sprite: SpriteType) -> None:
+        """
+        Remove a sprite from the broad phase.
+
+        Args:
+            sprite: The sprite to remove
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_sprites_near_sprite(self, sprite: BasicSprite) -> set[SpriteType]:
+        """
+        Get all the sprites that might overlap the given sprite.
+
+        Args:
+            sprite: The sprite to check
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_sprites_near_point(self, point: Point) -> set[SpriteType]:
+        """
+        Get all the sprites that might overlap the given point.
+
+        Args:
+            point: The point to check
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_sprites_near_rect(self, rect: Rect) -> set[SpriteType]:
+        """
+        Get all the sprites that might overlap the given rectangle.
+
+        Args:
+            rect: The rectangle to check
+        """
+        ...
+
+    @property
+    @abc.abstractmethod
+    def count(self) -> int:
+        """Return the number of sprites in the broad phase"""
+        ...
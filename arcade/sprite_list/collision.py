@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import struct
+from math import copysign
 from typing import (
     Iterable,
     List,
@@ -14,10 +15,11 @@
     are_polygons_intersecting,
     is_point_in_polygon,
 )
+from arcade.hitbox import HitBox
 from arcade.math import get_distance
 from arcade.sprite import BasicSprite, SpriteType
-from arcade.types import Point
-from arcade.types.rect import Rect
+from arcade.types import Point, Point2
+from arcade.types.rect import LRBT, Rect
 
 from .sprite_list import SpriteList
 
@@ -129,11 +131,144 @@ def _check_for_collision(sprite1: BasicSprite, sprite2: BasicSprite) -> bool:
     if distance > radius_sum_sq:
         return False
 
-    return are_polygons_intersecting(
-        sprite1.hit_box.get_adjusted_points(), sprite2.hit_box.get_adjusted_points()
+    return _are_hit_boxes_intersecting(sprite1.hit_box, sprite2.hit_box)
+
+
+def _are_hit_boxes_intersecting(hit_box1: HitBox, hit_box2: HitBox) -> bool:
+    """
+    Check if two hit boxes overlap.
+
+    Axis-aligned rectangles are resolved with a simple interval test.
+    Everything else falls back to :py:func:`~arcade.geometry.are_polygons_intersecting`.
+
+    Args:
+        hit_box1: Hit box 1
+        hit_box2: Hit box 2
+    Returns:
+        ``True`` if hit boxes overlap.
+    """
+    points1 = hit_box1.get_adjusted_points()
+    points2 = hit_box2.get_adjusted_points()
+    if not (hit_box1.is_axis_aligned and hit_box2.is_axis_aligned):
+        return are_polygons_intersecting(points1, points2)
+
+    x_points1, y_points1 = zip(*points1)
+    x_points2, y_points2 = zip(*points2)
+    return _are_boxes_intersecting(
+        min(x_points1),
+        max(x_points1),
+        min(y_points1),
+        max(y_points1),
+        min(x_points2),
+        max(x_points2),
+        min(y_points2),
+        max(y_points2),
+    )
+
+
+def _are_boxes_intersecting(
+    left1: float,
+    right1: float,
+    bottom1: float,
+    top1: float,
+    left2: float,
+    right2: float,
+    bottom2: float,
+    top2: float,
+) -> bool:
+    """
+    Interval test for two axis-aligned boxes.
+
+    Boxes only touching at their edges don't overlap, and empty boxes
+    never overlap anything. This matches the results of
+    :py:func:`~arcade.geometry.are_polygons_intersecting`.
+    """
+    return (
+        left1 < right2
+        and left2 < right1
+        and bottom1 < top2
+        and bottom2 < top1
+        and left1 < right1
+        and bottom1 < top1
+        and left2 < right2
+        and bottom2 < top2
     )
 
 
+def _check_for_collision_many(
+    sprite: BasicSprite, sprites_to_check: Iterable[SpriteType]
+) -> List[SpriteType]:
+    """
+    Check for collision between one sprite and many others.
+
+    This is the same check as :py:func:`_check_for_collision`, but everything
+    depending only on ``sprite`` is computed once instead of for every pair.
+    This duplicates code, but reduces call overhead and attribute lookups.
+
+    Args:
+        sprite: Sprite to check
+        sprites_to_check: Sprites to check against
+    Returns:
+        The sprites overlapping ``sprite``, excluding ``sprite`` itself.
+    """
+    x, y = sprite._position
+    width = sprite._width
+    height = sprite._height
+    radius = width if width > height else height
+
+    hit_box = sprite.hit_box
+    points = hit_box.get_adjusted_points()
+    is_box = hit_box.is_axis_aligned
+    if is_box:
+        x_points, y_points = zip(*points)
+        left, right = min(x_points), max(x_points)
+        bottom, top = min(y_points), max(y_points)
+        is_box = left < right and bottom < top
+
+    result: List[SpriteType] = []
+    for other in sprites_to_check:
+        if other is sprite:
+            continue
+
+        # Same estimate of distance as _check_for_collision
+        other_width = other._width
+        other_height = other._height
+        radius_sum = (radius + (other_width if other_width > other_height else other_height)) * 0.71
+        radius_sum_sq = radius_sum * radius_sum
+
+        other_position = other._position
+        diff_x = x - other_position[0]
+        diff_x_sq = diff_x * diff_x
+        if diff_x_sq > radius_sum_sq:
+            continue
+        diff_y = y - other_position[1]
+        diff_y_sq = diff_y * diff_y
+        if diff_y_sq > radius_sum_sq:
+            continue
+        if diff_x_sq + diff_y_sq > radius_sum_sq:
+            continue
+
+        other_hit_box = other.hit_box
+        other_points = other_hit_box.get_adjusted_points()
+        if is_box and other_hit_box.is_axis_aligned:
+            other_x_points, other_y_points = zip(*other_points)
+            other_left, other_right = min(other_x_points), max(other_x_points)
+            other_bottom, other_top = min(other_y_points), max(other_y_points)
+            if (
+                left < other_right
+                and other_left < right
+                and bottom < other_top
+                and other_bottom < top
+                and other_left < other_right
+                and other_bottom < other_top
+            ):
+                result.append(other)
+        elif are_polygons_intersecting(points, other_points):
+            result.append(other)
+
+    return result
+
+
 def _get_nearby_sprites(
     sprite: BasicSprite, sprite_list: SpriteList[SpriteType]
 ) -> List[SpriteType]:
@@ -180,9 +315,15 @@ def _get_nearby_sprites(
     # print("bytes", data)
     # print("data", struct.unpack(f'{emit_count}i', data))
 
-    # .. otherwise build and return a list of the sprites selected by the transform
+    # .. otherwise build and return a list of the sprites selected by the transform.
+    # The emitted values are positions in the index buffer, which can be in a
+    # different order than the list (sort_key), so they are mapped to buffer
+    # slots first and then to the sprite in each slot.
+    index_data = sprite_list._sprite_index_data
+    sprite_by_slot = {slot: sprite for sprite, slot in sprite_list.sprite_slot.items()}
     return [
-        sprite_list[i] for i in struct.unpack(f"{emit_count}i", buffer.read(size=emit_count * 4))
+        sprite_by_slot[index_data[i]]
+        for i in struct.unpack(f"{emit_count}i", buffer.read(size=emit_count * 4))
     ]
 
 
@@ -203,7 +344,7 @@ def check_for_collision_with_list(
             Collision check method. Defaults to 0.
 
             - 0: auto-select. (spatial if available, GPU if 1500+ sprites, else simple)
-            - 1: Spatial Hashing if available,
+            - 1: Spatial Hashing (or another broad phase) if available,
             - 2: GPU based
             - 3: Simple check-everything.
 
@@ -233,11 +374,7 @@ def check_for_collision_with_list(
         # GPU transform
         sprites_to_check = _get_nearby_sprites(sprite, sprite_list)
 
-    return [
-        sprite2
-        for sprite2 in sprites_to_check
-        if sprite is not sprite2 and _check_for_collision(sprite, sprite2)
-    ]
+    return _check_for_collision_many(sprite, sprites_to_check)
 
     # collision_list = []
     # for sprite2 in sprite_list_to_check:
@@ -285,13 +422,319 @@ def check_for_collision_with_lists(
             # GPU transform
             sprites_to_check = _get_nearby_sprites(sprite, sprite_list)
 
-        for sprite2 in sprites_to_check:
-            if sprite is not sprite2 and _check_for_collision(sprite, sprite2):
-                sprites.append(sprite2)
+        sprites.extend(_check_for_collision_many(sprite, sprites_to_check))
 
     return sprites
 
 
+def _get_sweep_bounds(
+    sprite_list: SpriteList[SpriteType],
+) -> List[Tuple[float, float, float, float, SpriteType]]:
+    """
+    Get conservative bounds for every sprite in a list sorted by their left edge.
+
+    The bounds are read directly from the position and size data of the
+    sprite list. They are squares large enough to contain the sprite at any
+    rotation, using the same estimate as :py:func:`_check_for_collision`.
+
+    Returns:
+        A list of (left, right, bottom, top, sprite) tuples
+    """
+    pos_data = sprite_list._sprite_pos_data
+    size_data = sprite_list._sprite_size_data
+    bounds = []
+    for sprite, slot in sprite_list.sprite_slot.items():
+        x = pos_data[slot * 3]
+        y = pos_data[slot * 3 + 1]
+        width = abs(size_data[slot * 2])
+        height = abs(size_data[slot * 2 + 1])
+        # Half of the theoretical max diagonal length
+        radius = (width if width > height else height) * 0.71
+        bounds.append((x - radius, x + radius, y - radius, y + radius, sprite))
+
+    bounds.sort(key=lambda item: item[0])
+    return bounds
+
+
+def check_for_collision_between_lists(
+    sprite_list_1: SpriteList[SpriteType],
+    sprite_list_2: SpriteList[SpriteType],
+) -> List[Tuple[SpriteType, SpriteType]]:
+    """
+    Find all the colliding pairs of sprites between two sprite lists.
+
+    This is a lot faster than calling :py:func:`check_for_collision_with_list`
+    for every sprite in a list, such as checking all bullets against all enemies.
+    A single sweep over both lists finds the pairs of sprites close to each other,
+    and only those pairs are checked with their hit boxes.
+
+    If the same list is passed twice, each colliding pair inside the list is
+    returned once. A sprite is never reported as colliding with itself.
+
+    Example::
+
+        for bullet, enemy in arcade.check_for_collision_between_lists(bullets, enemies):
+            bullet.remove_from_sprite_lists()
+            enemy.remove_from_sprite_lists()
+
+    Args:
+        sprite_list_1:
+            First SpriteList
+        sprite_list_2:
+            Second SpriteList
+
+    Returns:
+        A list of ``(sprite_1, sprite_2)`` tuples where ``sprite_1`` is from the
+        first list and ``sprite_2`` from the second list.
+    """
+    if __debug__:
+        if not isinstance(sprite_list_1, SpriteList):
+            raise TypeError(
+                f"Parameter 1 is a {type(sprite_list_1)} instead of expected SpriteList."
+            )
+        if not isinstance(sprite_list_2, SpriteList):
+            raise TypeError(
+                f"Parameter 2 is a {type(sprite_list_2)} instead of expected SpriteList."
+            )
+
+    pairs: List[Tuple[SpriteType, SpriteType]] = []
+    if len(sprite_list_1) == 0 or len(sprite_list_2) == 0:
+        return pairs
+
+    bounds_1 = _get_sweep_bounds(sprite_list_1)
+
+    if sprite_list_1 is sprite_list_2:
+        # Sweep a single list checking each sprite against the sprites before it
+        active: List[Tuple[float, float, float, float, SpriteType]] = []
+        for item in bounds_1:
+            left, _, bottom, top, sprite = item
+            active = [other for other in active if other[1] >= left]
+            for _, _, other_bottom, other_top, other in active:
+                if other_bottom <= top and other_top >= bottom:
+                    if _are_hit_boxes_intersecting(other.hit_box, sprite.hit_box):
+                        pairs.append((other, sprite))
+            active.append(item)
+        return pairs
+
+    bounds_2 = _get_sweep_bounds(sprite_list_2)
+
+    # Merge the two sorted lists by left edge. Each sprite is checked
+    # against the sprites from the other list still overlapping on x.
+    active_1: List[Tuple[float, float, float, float, SpriteType]] = []
+    active_2: List[Tuple[float, float, float, float, SpriteType]] = []
+    i, j = 0, 0
+    count_1, count_2 = len(bounds_1), len(bounds_2)
+    while i < count_1 or j < count_2:
+        if j >= count_2 or (i < count_1 and bounds_1[i][0] <= bounds_2[j][0]):
+            item = bounds_1[i]
+            i += 1
+            left, _, bottom, top, sprite = item
+            active_2 = [other for other in active_2 if other[1] >= left]
+            for _, _, other_bottom, other_top, other in active_2:
+                if other_bottom <= top and other_top >= bottom and sprite is not other:
+                    if _are_hit_boxes_intersecting(sprite.hit_box, other.hit_box):
+                        pairs.append((sprite, other))
+            active_1.append(item)
+        else:
+            item = bounds_2[j]
+            j += 1
+            left, _, bottom, top, sprite = item
+            active_1 = [other for other in active_1 if other[1] >= left]
+            for _, _, other_bottom, other_top, other in active_1:
+                if other_bottom <= top and other_top >= bottom and sprite is not other:
+                    if _are_hit_boxes_intersecting(other.hit_box, sprite.hit_box):
+                        pairs.append((other, sprite))
+            active_2.append(item)
+
+    return pairs
+
+
+def sweep_sprite(
+    sprite: BasicSprite,
+    delta: Point2,
+    sprite_lists: SpriteList[SpriteType] | Iterable[SpriteList[SpriteType]],
+) -> Tuple[float, SpriteType | None, Point2]:
+    """
+    Find the first sprite hit when moving a sprite by ``delta``.
+
+    Unlike moving the sprite and checking for collisions at the new
+    location, this checks the whole path. Fast sprites can't tunnel
+    through thin walls. The sprite itself is not moved.
+
+    The check uses the axis-aligned bounding boxes of the hit boxes.
+    This is exact for unrotated box-shaped hit boxes, such as those from
+    :py:class:`~arcade.hitbox.BoundingHitBoxAlgorithm`. For other hit boxes
+    the time of impact is conservative: the sprite is never moved
+    into a wall, but may stop a little short of it.
+
+    Lists with spatial hashing (or another broad phase) only check the
+    sprites close to the path.
+
+    Example::
+
+        t, wall, normal = arcade.sweep_sprite(bullet, bullet.velocity, walls)
+        if wall is not None:
+            # Move up to the wall and bounce off it
+            bullet.position = (
+                bullet.center_x + bullet.change_x * t,
+                bullet.center_y + bullet.change_y * t,
+            )
+            if normal[0]:
+                bullet.change_x *= -1
+            if normal[1]:
+                bullet.change_y *= -1
+
+    Args:
+        sprite:
+            Sprite to move
+        delta:
+            The x and y distance to move the sprite
+        sprite_lists:
+            A SpriteList or iterable of SpriteLists to check against
+
+    Returns:
+        A tuple of ``(t, hit_sprite, normal)``. ``t`` is the fraction
+        of ``delta`` the sprite can move before touching ``hit_sprite``.
+        ``normal`` is the unit normal of the surface hit, pointing away
+        from ``hit_sprite``. If nothing is hit, ``(1.0, None, (0.0, 0.0))``
+        is returned. If the sprite already overlaps another sprite,
+        ``t`` is ``0.0`` and the normal is ``(0.0, 0.0)``.
+    """
+    if __debug__:
+        if not isinstance(sprite, BasicSprite):
+            raise TypeError(
+                f"Parameter 1 is not an instance of the BasicSprite class, "
+                f"it is an instance of {type(sprite)}."
+            )
+
+    t, hits, normal, _, _ = _sweep_sprite(sprite, delta, sprite_lists)
+    return t, hits[0] if hits else None, normal
+
+
+def _sweep_sprite(
+    sprite: BasicSprite,
+    delta: Point2,
+    sprite_lists: SpriteList[SpriteType] | Iterable[SpriteList[SpriteType]],
+) -> Tuple[float, List[SpriteType], Point2, Point2, bool]:
+    """
+    Swept AABB query used by :py:func:`sweep_sprite` and the physics engines.
+
+    Returns:
+        A tuple of ``(t, hits, normal, contact_delta, exact)``. ``hits`` contains
+        all the sprites touched at ``t``. ``contact_delta`` is ``delta * t``
+        computed from the box edges directly to avoid rounding errors.
+        ``exact`` is ``True`` if the result is the same as it would be for
+        the real hit boxes.
+    """
+    dx, dy = delta
+    x_points, y_points = zip(*sprite.hit_box.get_adjusted_points())
+    left, right = min(x_points), max(x_points)
+    bottom, top = min(y_points), max(y_points)
+
+    best_t = 1.0
+    hits: List[SpriteType] = []
+    normal: Point2 = (0.0, 0.0)
+    contact_delta: Point2 = (dx, dy)
+    # Earliest time of impact with a hit box which isn't a box
+    inexact_t = float("inf")
+
+    # Empty hit boxes never collide with anything
+    if left >= right or bottom >= top:
+        return best_t, hits, normal, contact_delta, True
+
+    # The area covered by the sprite along the whole move
+    swept_left = left + dx if dx < 0 else left
+    swept_right = right + dx if dx > 0 else right
+    swept_bottom = bottom + dy if dy < 0 else bottom
+    swept_top = top + dy if dy > 0 else top
+
+    if isinstance(sprite_lists, SpriteList):
+        sprite_lists = (sprite_lists,)
+
+    sprites_to_check: Iterable[SpriteType]
+    for sprite_list in sprite_lists:
+        if sprite_list.spatial_hash is not None:
+            sprites_to_check = sprite_list.spatial_hash.get_sprites_near_rect(
+                LRBT(swept_left, swept_right, swept_bottom, swept_top)
+            )
+        else:
+            sprites_to_check = sprite_list
+
+        for other in sprites_to_check:
+            if other is sprite:
+                continue
+
+            other_hit_box = other.hit_box
+            other_x_points, other_y_points = zip(*other_hit_box.get_adjusted_points())
+            other_left, other_right = min(other_x_points), max(other_x_points)
+            other_bottom, other_top = min(other_y_points), max(other_y_points)
+
+            # Skip anything outside the swept area. Touching is not a collision.
+            if (
+                other_right <= swept_left
+                or other_left >= swept_right
+                or other_top <= swept_bottom
+                or other_bottom >= swept_top
+                or other_left >= other_right
+                or other_bottom >= other_top
+            ):
+                continue
+
+            # Times the boxes start and stop overlapping on each axis
+            if dx > 0:
+                x_entry = (other_left - right) / dx
+                x_exit = (other_right - left) / dx
+            elif dx < 0:
+                x_entry = (other_right - left) / dx
+                x_exit = (other_left - right) / dx
+            else:
+                x_entry, x_exit = float("-inf"), float("inf")
+
+            if dy > 0:
+                y_entry = (other_bottom - top) / dy
+                y_exit = (other_top - bottom) / dy
+            elif dy < 0:
+                y_entry = (other_top - bottom) / dy
+                y_exit = (other_bottom - top) / dy
+            else:
+                y_entry, y_exit = float("-inf"), float("inf")
+
+            entry = x_entry if x_entry > y_entry else y_entry
+            exit = x_exit if x_exit < y_exit else y_exit
+            if entry >= exit or entry >= 1.0 or exit <= 0.0:
+                continue
+
+            t = entry if entry > 0.0 else 0.0
+            if not other_hit_box.is_axis_aligned:
+                if t < inexact_t:
+                    inexact_t = t
+
+            if t < best_t or not hits:
+                best_t = t
+                hits = [other]
+                if entry < 0.0:
+                    # Already overlapping
+                    normal = (0.0, 0.0)
+                    contact_delta = (0.0, 0.0)
+                elif x_entry >= y_entry:
+                    normal = (-copysign(1.0, dx), 0.0)
+                    contact_delta = (
+                        (other_left - right) if dx > 0 else (other_right - left),
+                        dy * t,
+                    )
+                else:
+                    normal = (0.0, -copysign(1.0, dy))
+                    contact_delta = (
+                        dx * t,
+                        (other_bottom - top) if dy > 0 else (other_top - bottom),
+                    )
+            elif t == best_t:
+                hits.append(other)
+
+    exact = sprite.hit_box.is_axis_aligned and inexact_t > best_t
+    return best_t, hits, normal, contact_delta, exact
+
+
 def get_sprites_at_point(point: Point, sprite_list: SpriteList[SpriteType]) -> List[SpriteType]:
     """
     Get a list of sprites at a particular point. This function sees if any sprite overlaps
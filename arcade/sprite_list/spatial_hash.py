@@ -1,21 +1,24 @@
 from __future__ import annotations
 
 from math import trunc
-from typing import Generic
+from typing import Iterable
 
 from arcade.sprite import SpriteType
 from arcade.sprite.base import BasicSprite
 from arcade.types import IPoint, Point
 from arcade.types.rect import Rect
 
+from .broad_phase import BroadPhase
 
-class SpatialHash(Generic[SpriteType]):
+
+class SpatialHash(BroadPhase[SpriteType]):
     """A data structure best for collision checks with non-moving sprites.
 
     It subdivides space into a grid of squares, each with sides of length
-    :py:attr:`cell_size`. Moving a sprite from one place to another is the
-    same as removing and adding it. Although moving a few can be okay, it
-    can quickly add up and slow down a game.
+    :py:attr:`cell_size`. The range of cells each sprite covers is cached,
+    so moving a sprite only touches the cells it entered or left. Moves that
+    stay within the same cells are almost free, but sprites constantly
+    crossing cell borders can still add up and slow down a game.
 
     Args:
         cell_size:
@@ -42,6 +45,9 @@ def __init__(self, cell_size: int) -> None:
         # All the buckets a sprite is in.
         # This is used to remove a sprite from the spatial hash.
         self.buckets_for_sprite: dict[SpriteType, list[set[SpriteType]]] = {}
+        # The cell range (min_x, min_y, max_x, max_y) each sprite covers.
+        # This is used to skip or diff updates when a sprite is moved.
+        self.cell_range_for_sprite: dict[SpriteType, tuple[int, int, int, int]] = {}
 
     def hash(self, point: IPoint) -> IPoint:
         """Convert world coordinates to cell coordinates"""
@@ -54,6 +60,27 @@ def reset(self):
         """Clear all the sprites from the spatial hash."""
         self.contents.clear()
         self.buckets_for_sprite.clear()
+        self.cell_range_for_sprite.clear()
+
+    def _get_cell_range(self, sprite: BasicSprite) -> tuple[int, int, int, int]:
+        """
+        Get the range of cells covered by a sprite's hit box.
+
+        Args:
+            sprite: The sprite to get the cell range for
+        Returns:
+            A tuple of (min_x, min_y, max_x, max_y) in cell coordinates (inclusive)
+        """
+        # NOTE: Reading the adjusted points once is a lot cheaper
+        #       than calling left, right, bottom and top separately.
+        x_points, y_points = zip(*sprite.hit_box.get_adjusted_points())
+        cell_size = self.cell_size
+        return (
+            trunc(min(x_points)) // cell_size,
+            trunc(min(y_points)) // cell_size,
+            trunc(max(x_points)) // cell_size,
+            trunc(max(y_points)) // cell_size,
+        )
 
     def add(self, sprite: SpriteType) -> None:
         """
@@ -62,34 +89,88 @@ def add(self, sprite: SpriteType) -> None:
         Args:
             sprite: The sprite to add
         """
-        min_point = trunc(sprite.left), trunc(sprite.bottom)
-        max_point = trunc(sprite.right), trunc(sprite.top)
+        self._add_to_cells(sprite, self._get_cell_range(sprite))
 
-        # hash the minimum and maximum points
-        min_point, max_point = self.hash(min_point), self.hash(max_point)
+    def add_many(self, sprites: Iterable[SpriteType]) -> None:
+        """
+        Add several sprites to the spatial hash.
+
+        Args:
+            sprites: The sprites to add
+        """
+        add_to_cells = self._add_to_cells
+        get_cell_range = self._get_cell_range
+        for sprite in sprites:
+            add_to_cells(sprite, get_cell_range(sprite))
+
+    def _add_to_cells(self, sprite: SpriteType, cell_range: tuple[int, int, int, int]) -> None:
+        """
+        Add a sprite to every cell in a range of cells.
+
+        Args:
+            sprite: The sprite to add
+            cell_range: The cells covered by the sprite, see :py:meth:`_get_cell_range`
+        """
+        min_x, min_y, max_x, max_y = cell_range
+        contents = self.contents
         buckets: list[set[SpriteType]] = []
 
         # Iterate over the rectangular region adding the sprite to each cell
-        for i in range(min_point[0], max_point[0] + 1):
-            for j in range(min_point[1], max_point[1] + 1):
+        for i in range(min_x, max_x + 1):
+            for j in range(min_y, max_y + 1):
                 # Add sprite to the bucket
-                bucket = self.contents.setdefault((i, j), set())
+                bucket = contents.get((i, j))
+                if bucket is None:
+                    bucket = contents[(i, j)] = set()
                 bucket.add(sprite)
                 # Collect all the buckets we added to
                 buckets.append(bucket)
 
         # Keep track of which buckets the sprite is in
         self.buckets_for_sprite[sprite] = buckets
+        self.cell_range_for_sprite[sprite] = cell_range
 
     def move(self, sprite: SpriteType) -> None:
         """
-        Shortcut to remove and re-add a sprite.
+        Update the location of a sprite already in the spatial hash.
+
+        This does nothing if the sprite still covers the same cells.
+        Otherwise only the cells the sprite left or entered are updated.
 
         Args:
             sprite: The sprite to move
         """
-        self.remove(sprite)
-        self.add(sprite)
+        old_range = self.cell_range_for_sprite[sprite]
+        new_range = self._get_cell_range(sprite)
+        if new_range == old_range:
+            return
+
+        old_min_x, old_min_y, old_max_x, old_max_y = old_range
+        new_min_x, new_min_y, new_max_x, new_max_y = new_range
+        contents = self.contents
+
+        # Remove the sprite from the cells it no longer covers
+        for i in range(old_min_x, old_max_x + 1):
+            inside_x = new_min_x <= i <= new_max_x
+            for j in range(old_min_y, old_max_y + 1):
+                if inside_x and new_min_y <= j <= new_max_y:
+                    continue
+                contents[(i, j)].remove(sprite)
+
+        # Add the sprite to the cells it now covers and rebuild the bucket list
+        buckets: list[set[SpriteType]] = []
+        for i in range(new_min_x, new_max_x + 1):
+            inside_x = old_min_x <= i <= old_max_x
+            for j in range(new_min_y, new_max_y + 1):
+                if inside_x and old_min_y <= j <= old_max_y:
+                    bucket = contents[(i, j)]
+                else:
+                    bucket = contents.setdefault((i, j), set())
+                    bucket.add(sprite)
+                buckets.append(bucket)
+
+        self.buckets_for_sprite[sprite] = buckets
+        self.cell_range_for_sprite[sprite] = new_range
 
     def remove(self, sprite: SpriteType) -> None:
         """
@@ -102,8 +183,9 @@ def remove(self, sprite: SpriteType) -> None:
         for bucket in self.buckets_for_sprite[sprite]:
             bucket.remove(sprite)
 
-        # Delete the sprite from the bucket tracker
+        # Delete the sprite from the bucket and range trackers
         del self.buckets_for_sprite[sprite]
+        del self.cell_range_for_sprite[sprite]
 
     def get_sprites_near_sprite(self, sprite: BasicSprite) -> set[SpriteType]:
         """
@@ -0,0 +1,114 @@
+"""
+GPU buffers for drawing sprites stored as columns of numbers.
+
+Used by :py:class:`~arcade.SpriteStore` and
+:py:class:`~arcade.particles.ParticleList`. Both keep the sprite
+data in columns with the same layout as the :py:class:`~arcade.SpriteList`
+buffers and draw them with the same shader.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from arcade import gl
+from arcade.gl.types import BlendFunction
+
+if TYPE_CHECKING:
+    from arcade import ArcadeContext
+    from arcade.texture_atlas import TextureAtlasBase
+
+
+class SpriteBuffers:
+    """
+    The buffers and geometry for drawing sprites from columns of numbers.
+
+    Args:
+        ctx:
+            The context to create the buffers in
+        capacity:
+            The number of sprites the buffers have room for
+        indexed:
+            Create an index buffer for the draw order. Without one the
+            sprites are drawn in the order of the columns.
+    """
+
+    def __init__(self, ctx: ArcadeContext, capacity: int, indexed: bool = False) -> None:
+        self.ctx = ctx
+        self.program = ctx.sprite_list_program_cull
+        self.capacity = capacity
+
+        self.pos = ctx.buffer(reserve=capacity * 12)
+        self.size = ctx.buffer(reserve=capacity * 8)
+        self.angle = ctx.buffer(reserve=capacity * 4)
+        self.color = ctx.buffer(reserve=capacity * 4)
+        self.texture = ctx.buffer(reserve=capacity * 4)
+        self.index = ctx.buffer(reserve=capacity * 4) if indexed else None
+        self.geometry = ctx.geometry(
+            [
+                gl.BufferDescription(self.pos, "3f", ["in_pos"]),
+                gl.BufferDescription(self.size, "2f", ["in_size"]),
+                gl.BufferDescription(self.angle, "1f", ["in_angle"]),
+                gl.BufferDescription(self.texture, "1f", ["in_texture"]),
+                gl.BufferDescription(self.color, "4f1", ["in_color"]),
+            ],
+            index_buffer=self.index,
+            index_element_size=4,
+        )
+
+    def resize(self, capacity: int) -> None:
+        """
+        Resize the per sprite buffers to hold ``capacity`` sprites.
+
+        The contents are lost and must be written again.
+        The index buffer is not resized.
+        """
+        self.pos.orphan(size=capacity * 12)
+        self.size.orphan(size=capacity * 8)
+        self.angle.orphan(size=capacity * 4)
+        self.color.orphan(size=capacity * 4)
+        self.texture.orphan(size=capacity * 4)
+        self.capacity = capacity
+
+    def draw(
+        self,
+        atlas: TextureAtlasBase,
+        count: int,
+        *,
+        pixelated: bool = False,
+        blend_function: BlendFunction | None = None,
+    ) -> None:
+        """
+        Draw the first ``count`` sprites.
+
+        Args:
+            atlas:
+                The texture atlas the texture column refers to
+            count:
+                The number of sprites to draw
+            pixelated:
+                ``True`` for pixelated and ``False`` for smooth interpolation.
+            blend_function:
+                Optional blend function to draw the sprites with.
+                Defaults to ``ctx.BLEND_DEFAULT``.
+        """
+        ctx = self.ctx
+        program = self.program
+        prev_blend_func = ctx.blend_func
+        ctx.enable(ctx.BLEND)
+        ctx.blend_func = blend_function or ctx.BLEND_DEFAULT
+
+        if pixelated:
+            atlas.texture.filter = ctx.NEAREST, ctx.NEAREST
+            program.set_uniform_safe("uv_offset_bias", 0.0)
+        else:
+            atlas.texture.filter = ctx.LINEAR, ctx.LINEAR
+            program.set_uniform_safe("uv_offset_bias", 1.0)
+        program["spritelist_color"] = 1.0, 1.0, 1.0, 1.0
+
+        atlas.texture.use(0)
+        atlas.use_uv_texture(1)
+        self.geometry.render(program, mode=ctx.POINTS, vertices=count)
+
+        ctx.disable(ctx.BLEND)
+        ctx.blend_func = prev_blend_func
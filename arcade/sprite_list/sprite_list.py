@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 # import logging
+import math
 import random
 from array import array
 from collections import deque
@@ -20,6 +21,8 @@
     Generic,
     Iterable,
     Iterator,
+    Literal,
+    Sequence,
     Sized,
     cast,
 )
@@ -34,13 +37,16 @@
 from arcade.gl.buffer import Buffer
 from arcade.gl.types import BlendFunction, OpenGlFilter, PyGLenum
 from arcade.gl.vertex_array import Geometry
-from arcade.types import RGBA255, Color, RGBANormalized, RGBOrANormalized
+from arcade.types import LBWH, RGBA255, Color, Point2, Rect, RGBANormalized, RGBOrANormalized
 from arcade.utils import copy_dunders_unimplemented
 
 if TYPE_CHECKING:
     from arcade import DefaultTextureAtlas, Texture
     from arcade.texture_atlas import TextureAtlasBase
 
+    from .broad_phase import BroadPhase
+    from .sprite_pool import SpritePool
+
 # LOG = logging.getLogger(__name__)
 
 # The slot index that makes a sprite invisible.
@@ -51,6 +57,36 @@
 # The default capacity from spritelists
 _DEFAULT_CAPACITY = 100
 
+# Dirty slots closer than this are written to the GPU in one range
+_DIRTY_SLOT_GAP = 16
+# Write the whole buffer instead if there are more ranges than this
+_MAX_DIRTY_RANGES = 32
+
+
+def _get_dirty_ranges(dirty_slots: set[int], slot_count: int) -> list[list[int]] | None:
+    """
+    Group changed sprite buffer slots into ranges to write.
+
+    Args:
+        dirty_slots: The slots that changed
+        slot_count: The number of slots in use
+    Returns:
+        A list of ``[start, end)`` slot ranges, or ``None`` if writing
+        the whole buffer is likely faster.
+    """
+    if len(dirty_slots) * 2 > slot_count:
+        return None
+
+    ranges: list[list[int]] = []
+    for slot in sorted(dirty_slots):
+        if ranges and slot - ranges[-1][1] <= _DIRTY_SLOT_GAP:
+            ranges[-1][1] = slot + 1
+        elif len(ranges) == _MAX_DIRTY_RANGES:
+            return None
+        else:
+            ranges.append([slot, slot + 1])
+    return ranges
+
 
 @copy_dunders_unimplemented  # Temp fixes https://github.com/pythonarcade/arcade/issues/2074
 class SpriteList(Generic[SpriteType]):
@@ -84,6 +120,11 @@ class SpriteList(Generic[SpriteType]):
             with static walls/platforms in large maps.
         spatial_hash_cell_size:
             The cell size of the spatial hash (default: 128)
+        broad_phase:
+            (Advanced) A custom :py:class:`~arcade.sprite_list.broad_phase.BroadPhase`
+            to use for collision checks instead of the default spatial hash,
+            such as an :py:class:`~arcade.sprite_list.aabb_tree.AABBTree`.
+            This overrides ``use_spatial_hash``.
         atlas:
             (Advanced) The texture atlas for this sprite list. If no
             atlas is supplied the global/default one will be used.
@@ -91,6 +132,7 @@ class SpriteList(Generic[SpriteType]):
             (Advanced) The initial capacity of the internal buffer.
             It's a suggestion for the maximum amount of sprites this list
             can hold. Can normally be left with default value.
+            See :py:meth:`~SpriteList.reserve` to increase it later.
         lazy:
             (Advanced) ``True`` delays creating OpenGL resources
             for the sprite list until either its :py:meth:`~SpriteList.draw`
@@ -99,6 +141,14 @@ class SpriteList(Generic[SpriteType]):
         visible:
             Setting this to False will cause the SpriteList to not
             be drawn. When draw is called, the method will just return without drawing.
+        sort_key:
+            Keep the draw order sorted by ``"y"`` or ``"depth"``.
+            See :py:attr:`~SpriteList.sort_key`.
+        pool:
+            (Advanced) Share the sprite buffers with other sprite lists
+            using the same :py:class:`~arcade.sprite_list.sprite_pool.SpritePool`.
+            The list only keeps its own index buffer. The ``atlas`` of the
+            pool is used.
     """
 
     #: The default texture filter used when no other filter is specified.
@@ -121,6 +171,9 @@ def __init__(
         capacity: int = 100,
         lazy: bool = False,
         visible: bool = True,
+        broad_phase: BroadPhase[SpriteType] | None = None,
+        sort_key: Literal["y", "depth"] | None = None,
+        pool: SpritePool[SpriteType] | None = None,
     ) -> None:
         self.program: Program | None = None
         self._atlas: TextureAtlasBase | None = atlas
@@ -141,8 +194,12 @@ def __init__(
         # List of free slots in the sprite buffers. These are filled when sprites are removed.
         self._sprite_buffer_free_slots: Deque[int] = deque()
 
-        # List of sprites in the sprite list
-        self.sprite_list: list[SpriteType] = []
+        # List of sprites in the sprite list. Can contain removed sprites
+        # until the list is compacted. Use the sprite_list property instead.
+        self._sprite_list: list[SpriteType] = []
+        # Sprites and buffer slots removed since the last compaction
+        self._removed_sprites: set[SpriteType] = set()
+        self._removed_slots: set[int] = set()
         # Buffer slots for the sprites (excluding index buffer)
         # This has nothing to do with the index in the spritelist itself
         self.sprite_slot: dict[SpriteType, int] = dict()
@@ -168,6 +225,24 @@ def __init__(
 
         self._geometry: Geometry | None = None
 
+        # Velocity columns (see enable_velocity_columns). change_x and
+        # change_y, and change_angle for each buffer slot. None if disabled.
+        self._sprite_velocity_data: array | None = None
+        self._sprite_change_angle_data: array | None = None
+        # The sprites are behind the buffer data after moving the columns
+        self._sprite_positions_stale = False
+        self._sprite_angles_stale = False
+
+        # Chunked culling (see enable_chunked_culling).
+        # The size of each chunk or None if disabled
+        self._chunk_size: int | None = None
+        # (left, bottom, right, top, first, count) for each chunk or None if
+        # the chunks need to be rebuilt. first and count is the range
+        # of the chunk in the chunk index buffer.
+        self._chunks: list[tuple[float, float, float, float, int, int]] | None = None
+        self._chunk_index_buf: Buffer | None = None
+        self._chunk_geometry: Geometry | None = None
+
         # Flags for signaling if a buffer needs to be written to the OpenGL buffer
         self._sprite_pos_changed: bool = False
         self._sprite_size_changed: bool = False
@@ -175,13 +250,45 @@ def __init__(
         self._sprite_color_changed: bool = False
         self._sprite_texture_changed: bool = False
         self._sprite_index_changed: bool = False
+        # Slots changed since the last write. Only these are written
+        # unless the flags above request writing the whole buffer.
+        self._sprite_pos_dirty: set[int] = set()
+        self._sprite_size_dirty: set[int] = set()
+        self._sprite_angle_dirty: set[int] = set()
+        self._sprite_color_dirty: set[int] = set()
+        self._sprite_texture_dirty: set[int] = set()
+
+        # Lists in a pool share the sprite data and dirty slots of the pool storage.
+        # The arrays are only ever extended in place, so they can be shared.
+        self._pool = pool
+        # The pool version seen at the last write (see SpritePool)
+        self._pool_version = -1
+        if pool is not None:
+            storage = pool._storage
+            self._sprite_pos_data = storage._sprite_pos_data
+            self._sprite_size_data = storage._sprite_size_data
+            self._sprite_angle_data = storage._sprite_angle_data
+            self._sprite_color_data = storage._sprite_color_data
+            self._sprite_texture_data = storage._sprite_texture_data
+            self._sprite_pos_dirty = storage._sprite_pos_dirty
+            self._sprite_size_dirty = storage._sprite_size_dirty
+            self._sprite_angle_dirty = storage._sprite_angle_dirty
+            self._sprite_color_dirty = storage._sprite_color_dirty
+            self._sprite_texture_dirty = storage._sprite_texture_dirty
+
+        # The key the draw order is sorted by (see the sort_key property)
+        self._sort_key: Literal["y", "depth"] | None = None
+        self.sort_key = sort_key
 
         # Used in collision detection optimization
         from .spatial_hash import SpatialHash
 
         self._spatial_hash_cell_size = spatial_hash_cell_size
-        self.spatial_hash: SpatialHash[SpriteType] | None = None
-        if use_spatial_hash:
+        # NOTE: This can be any BroadPhase. The name is kept for compatibility.
+        self.spatial_hash: BroadPhase[SpriteType] | None = None
+        if broad_phase is not None:
+            self.spatial_hash = broad_phase
+        elif use_spatial_hash:
             self.spatial_hash = SpatialHash(cell_size=self._spatial_hash_cell_size)
 
         self.properties: dict[str, Any] | None = None
@@ -212,15 +319,39 @@ def _init_deferred(self) -> None:
 
         self.ctx = get_window().ctx
         self.program = self.ctx.sprite_list_program_cull
-        if not self._atlas:
-            self._atlas = self.ctx.default_atlas
-
-        # Buffers for each sprite attribute (read by shader) with initial capacity
-        self._sprite_pos_buf = self.ctx.buffer(reserve=self._buf_capacity * 12)  # 3 x 32 bit floats
-        self._sprite_size_buf = self.ctx.buffer(reserve=self._buf_capacity * 8)  # 2 x 32 bit floats
-        self._sprite_angle_buf = self.ctx.buffer(reserve=self._buf_capacity * 4)  # 32 bit float
-        self._sprite_color_buf = self.ctx.buffer(reserve=self._buf_capacity * 4)  # 4 x bytes colors
-        self._sprite_texture_buf = self.ctx.buffer(reserve=self._buf_capacity * 4)  # 32 bit int
+
+        if self._pool is not None:
+            # Use the sprite buffers of the pool
+            self._pool._init_deferred()
+            storage = self._pool._storage
+            # The buffers and atlas of the pool are created by now
+            assert storage._atlas is not None
+            assert storage._sprite_pos_buf is not None
+            assert storage._sprite_size_buf is not None
+            assert storage._sprite_angle_buf is not None
+            assert storage._sprite_color_buf is not None
+            assert storage._sprite_texture_buf is not None
+            self._atlas = storage._atlas
+            self._sprite_pos_buf = storage._sprite_pos_buf
+            self._sprite_size_buf = storage._sprite_size_buf
+            self._sprite_angle_buf = storage._sprite_angle_buf
+            self._sprite_color_buf = storage._sprite_color_buf
+            self._sprite_texture_buf = storage._sprite_texture_buf
+        else:
+            if not self._atlas:
+                self._atlas = self.ctx.default_atlas
+
+            # Buffers for each sprite attribute (read by shader) with initial capacity
+            # 3 x 32 bit floats
+            self._sprite_pos_buf = self.ctx.buffer(reserve=self._buf_capacity * 12)
+            # 2 x 32 bit floats
+            self._sprite_size_buf = self.ctx.buffer(reserve=self._buf_capacity * 8)
+            # 32 bit float
+            self._sprite_angle_buf = self.ctx.buffer(reserve=self._buf_capacity * 4)
+            # 4 x bytes colors
+            self._sprite_color_buf = self.ctx.buffer(reserve=self._buf_capacity * 4)
+            # 32 bit int
+            self._sprite_texture_buf = self.ctx.buffer(reserve=self._buf_capacity * 4)
         # Index buffer
         self._sprite_index_buf = self.ctx.buffer(
             reserve=self._idx_capacity * 4
@@ -263,9 +394,61 @@ def _init_deferred(self) -> None:
         self._sprite_texture_changed = True
         self._sprite_index_changed = True
 
+    @classmethod
+    def from_arrays(
+        cls,
+        textures: Texture | Sequence[Texture],
+        positions: Sequence[Point2],
+        *,
+        scales: Sequence[float] | None = None,
+        angles: Sequence[float] | None = None,
+        **kwargs: Any,
+    ) -> SpriteList[Sprite]:
+        """
+        Create a sprite list with a sprite for each position.
+
+        This is useful when loading large amounts of sprites like tiles
+        or particles. The buffers are allocated once with the exact capacity
+        and the sprites are added in bulk. Example::
+
+            positions = [(x * 16, y * 16) for x in range(100) for y in range(100)]
+            tiles = arcade.SpriteList.from_arrays(grass_texture, positions)
+
+        Args:
+            textures:
+                A texture shared by all sprites, or a texture per sprite
+            positions:
+                The position of each sprite
+            scales:
+                Optional scale of each sprite
+            angles:
+                Optional angle of each sprite in degrees
+            **kwargs:
+                Arguments passed to the :py:class:`SpriteList` constructor
+        """
+        count = len(positions)
+        if isinstance(textures, Sequence):
+            texture_list = textures
+        else:
+            texture_list = [textures] * count
+        scale_list = scales if scales is not None else [1.0] * count
+        angle_list = angles if angles is not None else [0.0] * count
+        if not len(texture_list) == len(scale_list) == len(angle_list) == count:
+            raise ValueError("All arrays must have the same length as positions")
+
+        kwargs.setdefault("capacity", count)
+        sprite_list = cast(SpriteList[Sprite], cls(**kwargs))
+        sprite_list.extend(
+            Sprite(texture, scale, position[0], position[1], angle)
+            for texture, position, scale, angle in zip(
+                texture_list, positions, scale_list, angle_list
+            )
+        )
+        return sprite_list
+
     def __len__(self) -> int:
         """Return the length of the sprite list."""
-        return len(self.sprite_list)
+        return len(self.sprite_slot)
 
     def __contains__(self, sprite: Sprite) -> bool:
         """Return if the sprite list contains the given sprite"""
@@ -291,9 +474,9 @@ def __setitem__(self, index: int, sprite: SpriteType) -> None:
             pass
 
         sprite_to_be_removed = self.sprite_list[index]
-        sprite_to_be_removed.sprite_lists.remove(self)
+        self._unregister_sprite(sprite_to_be_removed)
         self.sprite_list[index] = sprite  # Replace sprite
-        sprite.register_sprite_list(self)
+        self._register_sprite(sprite)
 
         if self.spatial_hash is not None:
             self.spatial_hash.remove(sprite_to_be_removed)
@@ -302,11 +485,34 @@ def __setitem__(self, index: int, sprite: SpriteType) -> None:
         # Steal the slot from the old sprite
         slot = self.sprite_slot[sprite_to_be_removed]
         del self.sprite_slot[sprite_to_be_removed]
+        if self._pool is not None:
+            # Sprites have their own slot in the pool
+            old_slot = slot
+            slot = self._pool._acquire(sprite)
+            self._pool._release(sprite_to_be_removed)
+            index_data = self._sprite_index_data
+            index_data[index_data.index(old_slot)] = slot
+            self._sprite_index_changed = True
         self.sprite_slot[sprite] = slot
 
         # Update the internal sprite buffer data
         self._update_all(sprite)
 
+    @property
+    def sprite_list(self) -> list[SpriteType]:
+        """
+        The python list of sprites in this sprite list.
+
+        Removing sprites is deferred, so this compacts the list
+        first if sprites were removed since the last access.
+        With velocity columns the sprites are also synced first.
+        """
+        if self._sprite_positions_stale or self._sprite_angles_stale:
+            self.sync_sprites()
+        if self._removed_slots:
+            self._normalize_index_buffer()
+        return self._sprite_list
+
     @property
     def visible(self) -> bool:
         """
@@ -320,6 +526,39 @@ def visible(self) -> bool:
     def visible(self, value: bool) -> None:
         self._visible = value
 
+    @property
+    def sort_key(self) -> Literal["y", "depth"] | None:
+        """
+        Keep the draw order of the sprites sorted by their position.
+
+        * ``"y"``: Sprites with a higher y position are drawn first so sprites
+          closer to the bottom of the screen are drawn on top. This is the
+          usual order for top-down games.
+        * ``"depth"``: Sprites with a lower :py:attr:`~arcade.BasicSprite.depth`
+          are drawn first.
+        * ``None``: Sprites are drawn in list order (default).
+
+        The order is updated right before drawing and only if sprites were
+        added, removed or moved since the last draw. Sprites with the same
+        key keep their previous order. This replaces calling :py:meth:`sort`
+        every frame. Only the draw order is affected. Iterating and indexing
+        the list still uses the order the sprites were added in.
+        """
+        return self._sort_key
+
+    @sort_key.setter
+    def sort_key(self, value: Literal["y", "depth"] | None) -> None:
+        if value not in (None, "y", "depth"):
+            raise ValueError(f"sort_key must be 'y', 'depth' or None, not {value!r}")
+
+        self._sort_key = value
+        if value is None:
+            # Go back to list order
+            self._normalize_index_buffer()
+            for i, sprite in enumerate(self._sprite_list):
+                self._sprite_index_data[i] = self.sprite_slot[sprite]
+        self._sprite_index_changed = True
+
     @property
     def blend(self) -> bool:
         """Enable or disable alpha blending for the spritelist."""
@@ -584,19 +823,28 @@ def clear(self, deep: bool = True) -> None:
         Args:
             deep: Wether to do a deep clear or not. Default is ``True``.
         """
-        from .spatial_hash import SpatialHash
+        # The sprites keep their latest position
+        if self._sprite_positions_stale or self._sprite_angles_stale:
+            self.sync_sprites()
 
-        # Manually remove the spritelist from all sprites
-        if deep:
+        # Manually remove the spritelist from all sprites.
+        # The pool also keeps track of the sprites, so it is always told.
+        if deep or self._pool is not None:
             for sprite in self.sprite_list:
-                sprite.sprite_lists.remove(self)
+                self._unregister_sprite(sprite)
+
+        if self._pool is not None:
+            self._pool._release_many(self.sprite_slot)
+            self._pool._release_many(self._removed_sprites)
 
-        self.sprite_list = []
+        self._sprite_list = []
         self.sprite_slot = dict()
+        self._removed_sprites = set()
+        self._removed_slots = set()
 
-        # Reset SpatialHash
+        # Reset the spatial hash or other broad phase
         if self.spatial_hash is not None:
-            self.spatial_hash = SpatialHash(cell_size=self._spatial_hash_cell_size)
+            self.spatial_hash.reset()
 
         # Clear the slot_idx and slot info and other states
         self._buf_capacity = _DEFAULT_CAPACITY
@@ -606,15 +854,28 @@ def clear(self, deep: bool = True) -> None:
         self._sprite_buffer_free_slots = deque()
 
         # Reset buffers
-        # Python representation of buffer data
-        self._sprite_pos_data = array("f", [0] * self._buf_capacity * 3)
-        self._sprite_size_data = array("f", [0] * self._buf_capacity * 2)
-        self._sprite_angle_data = array("f", [0] * self._buf_capacity)
-        self._sprite_color_data = array("B", [0] * self._buf_capacity * 4)
-        self._sprite_texture_data = array("f", [0] * self._buf_capacity)
+        # Python representation of buffer data. The data of a pool is kept.
+        if self._pool is None:
+            self._sprite_pos_data = array("f", [0] * self._buf_capacity * 3)
+            self._sprite_size_data = array("f", [0] * self._buf_capacity * 2)
+            self._sprite_angle_data = array("f", [0] * self._buf_capacity)
+            self._sprite_color_data = array("B", [0] * self._buf_capacity * 4)
+            self._sprite_texture_data = array("f", [0] * self._buf_capacity)
+            if self._sprite_velocity_data is not None:
+                self._sprite_velocity_data = array("f", [0] * self._buf_capacity * 2)
+                self._sprite_change_angle_data = array("f", [0] * self._buf_capacity)
+            self._sprite_pos_dirty.clear()
+            self._sprite_size_dirty.clear()
+            self._sprite_angle_dirty.clear()
+            self._sprite_color_dirty.clear()
+            self._sprite_texture_dirty.clear()
         # Index buffer
         self._sprite_index_data = array("I", [0] * self._idx_capacity)
 
+        self._chunks = None
+        self._chunk_index_buf = None
+        self._chunk_geometry = None
+
         if self._initialized:
             self._initialized = False
             self._init_deferred()
@@ -633,7 +894,7 @@ def pop(self, index: int = -1) -> SpriteType:
             index:
                 Index of sprite to remove (defaults to ``-1`` for the last item)
         """
-        if len(self.sprite_list) == 0:
+        if len(self.sprite_slot) == 0:
             raise IndexError("pop from empty list")
 
         sprite = self.sprite_list[index]
@@ -650,11 +911,14 @@ def append(self, sprite: SpriteType) -> None:
         # print(f"{id(self)} : {id(sprite)} append")
         if sprite in self.sprite_slot:
             raise ValueError("Sprite already in SpriteList")
+        # A sprite removed and added again must not be in the list twice
+        if sprite in self._removed_sprites:
+            self._normalize_index_buffer()
 
-        slot = self._next_slot()
+        slot = self._pool._acquire(sprite) if self._pool is not None else self._next_slot()
         self.sprite_slot[sprite] = slot
-        self.sprite_list.append(sprite)
-        sprite.register_sprite_list(self)
+        self._sprite_list.append(sprite)
+        self._register_sprite(sprite)
 
         self._update_all(sprite)
 
@@ -714,36 +978,200 @@ def remove(self, sprite: SpriteType) -> None:
         except KeyError:
             raise ValueError("Sprite is not in the SpriteList")
 
-        self.sprite_list.remove(sprite)
-        sprite.sprite_lists.remove(self)
-        del self.sprite_slot[sprite]
-
-        self._sprite_buffer_free_slots.append(slot)
+        # The sprite keeps its latest position
+        if self._sprite_positions_stale or self._sprite_angles_stale:
+            self.sync_sprites()
 
-        # NOTE: Optimize this by deferring removal?
-        #       Defer removal
-        # Set the sprite as invisible in the index buffer
-        # idx_slot = self._sprite_index_data.index(slot)
-        # self._sprite_index_data[idx_slot] = _SPRITE_SLOT_INVISIBLE
+        self._unregister_sprite(sprite)
+        del self.sprite_slot[sprite]
 
-        # Brutal resize for now. Optimize later
-        self._sprite_index_data.remove(slot)
-        self._sprite_index_data.append(0)
-        self._sprite_index_slots -= 1
-        self._sprite_index_changed = True
+        # Removing the sprite from the python list and the index buffer is
+        # deferred until the next draw or access to the list. The buffer
+        # slot can't be reused until then, since the index buffer still
+        # points to it.
+        self._removed_sprites.add(sprite)
+        self._removed_slots.add(slot)
 
         if self.spatial_hash is not None:
             self.spatial_hash.remove(sprite)
 
+    def remove_many(self, sprites: Iterable[SpriteType]) -> None:
+        """
+        Remove several sprites from the list.
+
+        The list is only compacted once, so this is much faster than
+        calling :py:meth:`remove` for each sprite and drawing in between.
+
+        Args:
+            sprites: The sprites to remove
+        """
+        for sprite in sprites:
+            self.remove(sprite)
+
+    def kill_where(self, predicate: Callable[[SpriteType], bool]) -> list[SpriteType]:
+        """
+        Remove all sprites matching a condition from every sprite list they are in.
+
+        This is like calling :py:meth:`~arcade.BasicSprite.kill` on the sprites
+        for which ``predicate`` returns ``True``. Example::
+
+            # Remove all bullets that left the screen
+            bullets.kill_where(lambda bullet: bullet.bottom > window.height)
+
+        Args:
+            predicate: A function taking a sprite, returning ``True`` to kill it
+        Returns:
+            The sprites that were killed
+        """
+        killed = [sprite for sprite in self.sprite_list if predicate(sprite)]
+        for sprite in killed:
+            sprite.remove_from_sprite_lists()
+        return killed
+
     def extend(self, sprites: Iterable[SpriteType] | SpriteList[SpriteType]) -> None:
         """
         Extends the current list with the given iterable
 
+        This is a lot faster than appending the sprites one by one.
+        The buffers are only resized once, the sprite data is written
+        in bulk and each unique texture is only added to the atlas once.
+
         Args:
             sprites: Iterable of Sprites to add to the list
         """
+        sprites = list(sprites)
+        count = len(sprites)
+        if count == 0:
+            return
+
+        sprite_slot = self.sprite_slot
+        if len({id(sprite) for sprite in sprites}) != count or any(
+            sprite in sprite_slot for sprite in sprites
+        ):
+            raise ValueError("Sprite already in SpriteList")
+        # Sprites removed and added again must not be in the list twice
+        if self._removed_sprites and not self._removed_sprites.isdisjoint(sprites):
+            self._normalize_index_buffer()
+
+        # Look up the texture slots before touching any state
+        # so a missing texture leaves the list unchanged.
+        tex_slots: list[int] | None = None
+        if self._initialized:
+            tex_slots = self._add_textures(sprites)
+
+        # Reuse free slots first and allocate the rest at the end of the buffers
+        start = end = self._sprite_buffer_slots
+        if self._pool is not None:
+            # Slots in a pool are not consecutive, so they are all written one by one
+            slots = [self._pool._acquire(sprite) for sprite in sprites]
+            reused = count
+        else:
+            free_slots = self._sprite_buffer_free_slots
+            reused = min(len(free_slots), count)
+            slots = [free_slots.popleft() for _ in range(reused)]
+            end = start + count - reused
+            slots.extend(range(start, end))
+            self._sprite_buffer_slots = end
+            self._grow_sprite_buffers()
+
+        sprite_slot.update(zip(sprites, slots))
+        self._sprite_list.extend(sprites)
+        for sprite in sprites:
+            self._register_sprite(sprite)
+
+        # Sprites in reused slots are written one by one
+        for sprite in sprites[:reused]:
+            self._update_all(sprite)
+
+        # The rest have consecutive slots and are written with slice assignment
+        new_sprites = sprites[reused:]
+        if new_sprites:
+            self._sprite_pos_data[start * 3 : end * 3] = array(
+                "f",
+                [
+                    value
+                    for sprite in new_sprites
+                    for value in (sprite._position[0], sprite._position[1], sprite._depth)
+                ],
+            )
+            self._sprite_size_data[start * 2 : end * 2] = array(
+                "f", [value for sprite in new_sprites for value in (sprite._width, sprite._height)]
+            )
+            self._sprite_angle_data[start:end] = array(
+                "f", [sprite._angle for sprite in new_sprites]
+            )
+            self._sprite_color_data[start * 4 : end * 4] = array(
+                "B", [value for sprite in new_sprites for value in sprite._color]
+            )
+            if tex_slots is not None:
+                self._sprite_texture_data[start:end] = array("f", tex_slots[reused:])
+
+            if self._sprite_velocity_data is not None:
+                for sprite in new_sprites:
+                    self._update_velocity(sprite)
+
+            new_slots = range(start, end)
+            self._sprite_pos_dirty.update(new_slots)
+            self._sprite_size_dirty.update(new_slots)
+            self._sprite_angle_dirty.update(new_slots)
+            self._sprite_color_dirty.update(new_slots)
+            self._sprite_texture_dirty.update(new_slots)
+
+        # Add the sprites to the end of the index buffer
+        idx_start = self._sprite_index_slots
+        self._sprite_index_slots += count
+        self._grow_index_buffer()
+        self._sprite_index_data[idx_start : idx_start + count] = array(
+            self._sprite_index_data.typecode, slots
+        )
+        self._sprite_index_changed = True
+
+        if self.spatial_hash is not None:
+            self.spatial_hash.add_many(sprites)
+
+    def _add_textures(self, sprites: list[SpriteType]) -> list[int]:
+        """
+        Add the textures of the sprites to the atlas.
+
+        Each unique texture is only added once.
+
+        Args:
+            sprites: The sprites to add textures for
+        Returns:
+            The texture slot of each sprite
+        """
+        atlas: TextureAtlasBase = self._atlas  # type: ignore
+        textures: dict[int, Texture] = {}
         for sprite in sprites:
-            self.append(sprite)
+            texture = sprite._texture
+            if texture is None:
+                raise ValueError("Sprite must have a texture when added to a SpriteList")
+            textures[id(texture)] = texture
+
+        # Add the unique textures together so new images are written in batches
+        slots_by_texture = {
+            key: tex_slot
+            for key, (tex_slot, _) in zip(textures, atlas.add_textures(textures.values()))
+        }
+        return [slots_by_texture[id(sprite._texture)] for sprite in sprites]
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Make room for at least ``capacity`` sprites.
+
+        The buffers normally double in size as sprites are added.
+        Reserving the capacity up front avoids resizing them over and
+        over when the number of sprites is known.
+
+        Args:
+            capacity: The number of sprites to make room for
+        """
+        if self._pool is not None:
+            self._pool.reserve(capacity)
+        elif capacity > self._buf_capacity:
+            self._resize_sprite_buffers(capacity)
+        if capacity > self._idx_capacity:
+            self._resize_index_buffer(capacity)
 
     def insert(self, index: int, sprite: SpriteType) -> None:
         """
@@ -759,10 +1187,10 @@ def insert(self, index: int, sprite: SpriteType) -> None:
         index = max(min(len(self.sprite_list), index), 0)
 
         self.sprite_list.insert(index, sprite)
-        sprite.register_sprite_list(self)
+        self._register_sprite(sprite)
 
         # Allocate a new slot and write the data
-        slot = self._next_slot()
+        slot = self._pool._acquire(sprite) if self._pool is not None else self._next_slot()
         self.sprite_slot[sprite] = slot
         self._update_all(sprite)
 
@@ -773,6 +1201,7 @@ def insert(self, index: int, sprite: SpriteType) -> None:
         self._grow_index_buffer()
         self._sprite_index_data.insert(index, slot)
         self._sprite_index_data.pop()
+        self._sprite_index_changed = True
 
         if self.spatial_hash is not None:
             self.spatial_hash.add(sprite)
@@ -806,7 +1235,7 @@ def shuffle(self) -> None:
 
         # Reconstruct the lists again from pairs
         sprites, indices = cast(tuple[list[SpriteType], list[int]], zip(*pairs))
-        self.sprite_list = list(sprites)
+        self._sprite_list = list(sprites)
         self._sprite_index_data = array("I", indices)
 
         # Resize the index buffer to the original capacity
@@ -853,26 +1282,157 @@ def create_y_pos_comparison(sprite):
 
         self._sprite_index_changed = True
 
+    @property
+    def broad_phase(self) -> BroadPhase[SpriteType] | None:
+        """
+        The broad phase used to speed up collision checks, if any.
+
+        This is the same object as :py:attr:`spatial_hash`. Use
+        :py:meth:`enable_broad_phase` to replace it.
+        """
+        return self.spatial_hash
+
     def disable_spatial_hashing(self) -> None:
-        """Deletes the internal spatial hash object."""
+        """Deletes the internal spatial hash or other broad phase object."""
         self.spatial_hash = None
 
     def enable_spatial_hashing(self, spatial_hash_cell_size: int = 128) -> None:
         """
         Turn on spatial hashing unless it is already enabled with the same cell size.
 
+        This replaces any other broad phase the list is using.
+
         Args:
             spatial_hash_cell_size: The size of the cell in the spatial hash.
         """
-        if self.spatial_hash is None or self.spatial_hash.cell_size != spatial_hash_cell_size:
-            # LOG.debug("Enabled spatial hashing with cell size %s", spatial_hash_cell_size)
-            from .spatial_hash import SpatialHash
+        from .spatial_hash import SpatialHash
 
+        if (
+            not isinstance(self.spatial_hash, SpatialHash)
+            or self.spatial_hash.cell_size != spatial_hash_cell_size
+        ):
+            # LOG.debug("Enabled spatial hashing with cell size %s", spatial_hash_cell_size)
             self.spatial_hash = SpatialHash(cell_size=spatial_hash_cell_size)
             self._recalculate_spatial_hashes()
         # else:
         #     LOG.debug("Spatial hashing is already enabled with size %s", spatial_hash_cell_size)
 
+    def enable_broad_phase(self, broad_phase: BroadPhase[SpriteType]) -> None:
+        """
+        Use a custom broad phase for collision checks.
+
+        The broad phase is cleared and all the sprites in the list are added to it.
+
+        Example::
+
+            # Switch to a dynamic AABB tree for a list of moving sprites
+            enemies.enable_broad_phase(arcade.AABBTree(margin=16))
+
+        Args:
+            broad_phase: The broad phase to use, such as an
+                :py:class:`~arcade.sprite_list.aabb_tree.AABBTree`.
+        """
+        self.spatial_hash = broad_phase
+        self._recalculate_spatial_hashes()
+
+    def enable_chunked_culling(self, chunk_size: int = 1024) -> None:
+        """
+        Only draw the parts of the list that are visible to the current camera.
+
+        The sprites are grouped into square chunks of ``chunk_size`` pixels
+        by their position. When drawing, chunks outside the view of the
+        current :py:class:`~arcade.camera.Camera2D` are skipped entirely,
+        so the cost of drawing depends on how much is on screen instead
+        of the size of the list. This is useful for huge lists of static
+        sprites like the tiles of a large map.
+
+        The chunks are rebuilt when any sprite is added, removed, moved,
+        resized or rotated, so this is not useful for lists with moving
+        sprites.
+
+        .. note:: Sprites are drawn chunk by chunk. The order of sprites
+                  in the same chunk is kept, but sprites overlapping
+                  across chunks may be drawn in a different order than
+                  the list order.
+
+        Args:
+            chunk_size: The width and height of each chunk in pixels
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than 0")
+
+        self._chunk_size = chunk_size
+        self._chunks = None
+
+    def disable_chunked_culling(self) -> None:
+        """Draw all the sprites in the list again. See :py:meth:`enable_chunked_culling`."""
+        self._chunk_size = None
+        self._chunks = None
+        self._chunk_index_buf = None
+        self._chunk_geometry = None
+
+    def enable_velocity_columns(self) -> None:
+        """
+        Keep the velocity and ``change_angle`` of the sprites in columns
+        next to the position and angle buffer data.
+
+        :py:meth:`update` then moves and rotates all sprites in one pass
+        over the columns instead of calling ``update()`` on every sprite,
+        and :py:meth:`move` moves them in one pass as well. This is a lot
+        faster for large lists of sprites only moving by their velocity,
+        such as bullets. Overridden ``update()`` methods are not called.
+
+        The buffers are updated right away, but the sprites themselves are
+        only synced when the list is accessed, such as when iterating it,
+        or when :py:meth:`sync_sprites` is called. This includes their hit
+        boxes and the other sprite lists they are in. Lists with a spatial
+        hash sync the sprites right away. Call :py:meth:`sync_sprites`
+        before reading or changing a sprite you hold a reference to.
+
+        Positions and angles are updated as 32 bit floats, like in the
+        buffers. Not supported for lists in a
+        :py:class:`~arcade.sprite_list.sprite_pool.SpritePool`.
+        """
+        if self._pool is not None:
+            raise ValueError("Velocity columns are not supported for lists in a SpritePool")
+        if self._sprite_velocity_data is not None:
+            return
+
+        self._sprite_velocity_data = array("f", [0] * self._buf_capacity * 2)
+        self._sprite_change_angle_data = array("f", [0] * self._buf_capacity)
+        for sprite in self.sprite_slot:
+            self._update_velocity(sprite)
+
+    def disable_velocity_columns(self) -> None:
+        """Update the sprites one by one again. See :py:meth:`enable_velocity_columns`."""
+        self.sync_sprites()
+        self._sprite_velocity_data = None
+        self._sprite_change_angle_data = None
+
+    def sync_sprites(self) -> None:
+        """
+        Copy the positions and angles changed by the velocity columns
+        to the sprites. See :py:meth:`enable_velocity_columns`.
+
+        This goes through the property setters of the sprites, so their hit
+        boxes, spatial hashes and other sprite lists are updated as well.
+        Does nothing if the sprites are up to date.
+        """
+        sync_positions = self._sprite_positions_stale
+        sync_angles = self._sprite_angles_stale
+        if not (sync_positions or sync_angles):
+            return
+
+        self._sprite_positions_stale = False
+        self._sprite_angles_stale = False
+        pos_data = self._sprite_pos_data
+        angle_data = self._sprite_angle_data
+        for sprite, slot in list(self.sprite_slot.items()):
+            if sync_positions:
+                sprite.position = pos_data[slot * 3], pos_data[slot * 3 + 1]
+            if sync_angles and angle_data[slot] != sprite._angle:
+                sprite.angle = angle_data[slot]  # type: ignore
+
     def _recalculate_spatial_hashes(self) -> None:
         if self.spatial_hash is None:
             from .spatial_hash import SpatialHash
@@ -880,21 +1440,63 @@ def _recalculate_spatial_hashes(self) -> None:
             self.spatial_hash = SpatialHash(cell_size=self._spatial_hash_cell_size)
 
         self.spatial_hash.reset()
-        for sprite in self.sprite_list:
-            self.spatial_hash.add(sprite)
+        self.spatial_hash.add_many(self.sprite_list)
 
     def update(self, delta_time: float = 1 / 60, *args, **kwargs) -> None:
         """
         Call the update() method on each sprite in the list.
 
+        With velocity columns the sprites are moved and rotated by their
+        velocity and ``change_angle`` in one pass over the columns instead,
+        and the update() method of the sprites is not called.
+        See :py:meth:`enable_velocity_columns`.
+
         Args:
             delta_time: Time since last update in seconds
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
         """
+        if self._sprite_velocity_data is not None:
+            self._update_velocity_columns(delta_time)
+            return
+
         for sprite in self.sprite_list:
             sprite.update(delta_time, *args, **kwargs)
 
+    def _update_velocity_columns(self, delta_time: float) -> None:
+        """Move and rotate all sprites by the velocity columns."""
+        count = self._sprite_buffer_slots
+        # Velocities are historically in pixels per frame at 60 fps
+        time_step = delta_time * 60
+
+        pos_data = self._sprite_pos_data
+        velocity_data: array = self._sprite_velocity_data  # type: ignore
+        for axis in range(2):
+            changes = velocity_data[axis : count * 2 : 2]
+            if any(changes):
+                pos_data[axis : count * 3 : 3] = array(
+                    "f",
+                    [
+                        value + change * time_step
+                        for value, change in zip(pos_data[axis : count * 3 : 3], changes)
+                    ],
+                )
+                self._sprite_pos_changed = True
+                self._sprite_positions_stale = True
+
+        changes = self._sprite_change_angle_data[:count]  # type: ignore
+        if any(changes):
+            angle_data = self._sprite_angle_data
+            angle_data[:count] = array(
+                "f", [angle + change * time_step for angle, change in zip(angle_data, changes)]
+            )
+            self._sprite_angle_changed = True
+            self._sprite_angles_stale = True
+
+        # Collision checks query the spatial hash directly, so it can't wait
+        if self.spatial_hash is not None:
+            self.sync_sprites()
+
     def update_animation(self, delta_time: float = 1 / 60, *args, **kwargs) -> None:
         """
         Call the update_animation in every sprite in the sprite list.
@@ -918,8 +1520,13 @@ def _get_center(self) -> tuple[float, float]:
 
     def rescale(self, factor: float) -> None:
         """Rescale all sprites in the list relative to the spritelists center."""
+        if len(self.sprite_slot) == 0:
+            return
+
+        # The center moves as sprites are rescaled, so only calculate it once
+        center = self.center
         for sprite in self.sprite_list:
-            sprite.rescale_relative_to_point(self.center, factor)
+            sprite.rescale_relative_to_point(center, factor)
 
     def move(self, change_x: float, change_y: float) -> None:
         """
@@ -927,10 +1534,27 @@ def move(self, change_x: float, change_y: float) -> None:
         This can be a very expensive operation depending on the
         size of the sprite list.
 
+        With velocity columns this is a single pass over the position
+        columns. See :py:meth:`enable_velocity_columns`.
+
         Args:
             change_x: Amount to change all x values by
             change_y: Amount to change all y values by
         """
+        if self._sprite_velocity_data is not None:
+            count = self._sprite_buffer_slots
+            pos_data = self._sprite_pos_data
+            for axis, change in enumerate((change_x, change_y)):
+                if change:
+                    pos_data[axis : count * 3 : 3] = array(
+                        "f", [value + change for value in pos_data[axis : count * 3 : 3]]
+                    )
+                    self._sprite_pos_changed = True
+                    self._sprite_positions_stale = True
+            if self.spatial_hash is not None:
+                self.sync_sprites()
+            return
+
         for sprite in self.sprite_list:
             sprite.center_x += change_x
             sprite.center_y += change_y
@@ -946,9 +1570,8 @@ def preload_textures(self, texture_list: Iterable["Texture"]) -> None:
         if not self.ctx:
             raise ValueError("Cannot preload textures before the window is created")
 
-        for texture in texture_list:
-            # Ugly spacing is a fast workaround for None type checking issues
-            self._atlas.add(texture)  # type: ignore
+        # Ugly spacing is a fast workaround for None type checking issues
+        self._atlas.add_textures(texture_list)  # type: ignore
 
     def write_sprite_buffers_to_gpu(self) -> None:
         """
@@ -967,6 +1590,39 @@ def write_sprite_buffers_to_gpu(self) -> None:
         self._write_sprite_buffers_to_gpu()
 
     def _write_sprite_buffers_to_gpu(self) -> None:
+        if self._removed_slots:
+            self._normalize_index_buffer()
+
+        if self._pool is not None:
+            # The pool writes the shared sprite buffers once for all its lists.
+            # Its version tells if any sprite moved since this list was written.
+            self._pool._write_sprite_buffers_to_gpu()
+            moved = self._pool_version != self._pool._version
+            self._pool_version = self._pool._version
+            if self._sort_key is not None and (self._sprite_index_changed or moved):
+                self._sort_index_buffer()
+            if self._chunks is not None and (self._sprite_index_changed or moved):
+                self._chunks = None
+            self._write_index_buffer()
+            return
+
+        if self._sort_key is not None and (
+            self._sprite_index_changed or self._sprite_pos_changed or self._sprite_pos_dirty
+        ):
+            self._sort_index_buffer()
+
+        # Any change to the order or the bounds of sprites invalidates the chunks
+        if self._chunks is not None and (
+            self._sprite_index_changed
+            or self._sprite_pos_changed
+            or self._sprite_size_changed
+            or self._sprite_angle_changed
+            or self._sprite_pos_dirty
+            or self._sprite_size_dirty
+            or self._sprite_angle_dirty
+        ):
+            self._chunks = None
+
         # LOG.debug(
         #     (
         #         "[%s] SpriteList._write_sprite_buffers_to_gpu: "
@@ -981,36 +1637,116 @@ def _write_sprite_buffers_to_gpu(self) -> None:
         #     self._sprite_index_changed,
         # )
 
-        if self._sprite_pos_changed and self._sprite_pos_buf:
-            self._sprite_pos_buf.orphan()
-            self._sprite_pos_buf.write(self._sprite_pos_data)
+        if self._sprite_pos_buf and (self._sprite_pos_changed or self._sprite_pos_dirty):
+            self._write_sprite_buffer(
+                self._sprite_pos_buf,
+                self._sprite_pos_data,
+                self._sprite_pos_dirty,
+                3,
+                self._sprite_pos_changed,
+            )
             self._sprite_pos_changed = False
 
-        if self._sprite_size_changed and self._sprite_size_buf:
-            self._sprite_size_buf.orphan()
-            self._sprite_size_buf.write(self._sprite_size_data)
+        if self._sprite_size_buf and (self._sprite_size_changed or self._sprite_size_dirty):
+            self._write_sprite_buffer(
+                self._sprite_size_buf,
+                self._sprite_size_data,
+                self._sprite_size_dirty,
+                2,
+                self._sprite_size_changed,
+            )
             self._sprite_size_changed = False
 
-        if self._sprite_angle_changed and self._sprite_angle_buf:
-            self._sprite_angle_buf.orphan()
-            self._sprite_angle_buf.write(self._sprite_angle_data)
+        if self._sprite_angle_buf and (self._sprite_angle_changed or self._sprite_angle_dirty):
+            self._write_sprite_buffer(
+                self._sprite_angle_buf,
+                self._sprite_angle_data,
+                self._sprite_angle_dirty,
+                1,
+                self._sprite_angle_changed,
+            )
             self._sprite_angle_changed = False
 
-        if self._sprite_color_changed and self._sprite_color_buf:
-            self._sprite_color_buf.orphan()
-            self._sprite_color_buf.write(self._sprite_color_data)
+        if self._sprite_color_buf and (self._sprite_color_changed or self._sprite_color_dirty):
+            self._write_sprite_buffer(
+                self._sprite_color_buf,
+                self._sprite_color_data,
+                self._sprite_color_dirty,
+                4,
+                self._sprite_color_changed,
+            )
             self._sprite_color_changed = False
 
-        if self._sprite_texture_changed and self._sprite_texture_buf:
-            self._sprite_texture_buf.orphan()
-            self._sprite_texture_buf.write(self._sprite_texture_data)
+        if self._sprite_texture_buf and (
+            self._sprite_texture_changed or self._sprite_texture_dirty
+        ):
+            self._write_sprite_buffer(
+                self._sprite_texture_buf,
+                self._sprite_texture_data,
+                self._sprite_texture_dirty,
+                1,
+                self._sprite_texture_changed,
+            )
             self._sprite_texture_changed = False
 
+        self._write_index_buffer()
+
+    def _write_index_buffer(self) -> None:
+        """Write the index buffer to the GPU if it changed."""
         if self._sprite_index_changed and self._sprite_index_buf:
             self._sprite_index_buf.orphan()
             self._sprite_index_buf.write(self._sprite_index_data)
             self._sprite_index_changed = False
 
+    def _sort_index_buffer(self) -> None:
+        """Sort the used part of the index buffer by the sort key."""
+        count = self._sprite_index_slots
+        current = self._sprite_index_data[:count]
+        # Slicing out the y or z component gives a lookup table for
+        # the key of each slot without touching the sprites.
+        if self._sort_key == "y":
+            keys = self._sprite_pos_data[1::3]
+            order = sorted(current, key=keys.__getitem__, reverse=True)
+        else:
+            keys = self._sprite_pos_data[2::3]
+            order = sorted(current, key=keys.__getitem__)
+
+        # Sorting is stable and fast for mostly sorted data, so sprites
+        # that did not move rarely change the order
+        new = array(current.typecode, order)
+        if new != current:
+            self._sprite_index_data[:count] = new
+            self._sprite_index_changed = True
+
+    def _write_sprite_buffer(
+        self, buffer: Buffer, data: array, dirty_slots: set[int], components: int, full: bool
+    ) -> None:
+        """
+        Write one of the per sprite buffers to the GPU.
+
+        Only the ranges of dirty slots are written, unless ``full`` is set or
+        so much changed that orphaning and writing the whole buffer is faster.
+
+        Args:
+            buffer: The buffer to write to
+            data: The data for the buffer
+            dirty_slots: The slots changed since the last write. This is cleared.
+            components: The number of values per slot in ``data``
+            full: Write the whole buffer
+        """
+        ranges = None if full else _get_dirty_ranges(dirty_slots, self._sprite_buffer_slots)
+        dirty_slots.clear()
+
+        if ranges is None:
+            buffer.orphan()
+            buffer.write(data)
+            return
+
+        view = memoryview(data)
+        slot_size = data.itemsize * components
+        for start, end in ranges:
+            buffer.write(view[start * components : end * components], offset=start * slot_size)
+
     def initialize(self) -> None:
         """
         Request immediate creation of OpenGL resources for this list.
@@ -1060,7 +1796,7 @@ def draw(
                 the sprite list, such as 'arcade.Window.ctx.BLEND_ADDITIVE' or
                 'arcade.Window.ctx.BLEND_DEFAULT'
         """
-        if len(self.sprite_list) == 0 or not self._visible or self.alpha_normalized == 0.0:
+        if len(self.sprite_slot) == 0 or not self._visible or self.alpha_normalized == 0.0:
             return
 
         self._init_deferred()
@@ -1115,11 +1851,14 @@ def draw(
         atlas.use_uv_texture(1)
         if not self._geometry:
             raise ValueError("Attempting to render without '_geometry' field being set.")
-        self._geometry.render(
-            self.program,
-            mode=self.ctx.POINTS,
-            vertices=self._sprite_index_slots,
-        )
+        if self._chunk_size is not None:
+            self._draw_chunks()
+        else:
+            self._geometry.render(
+                self.program,
+                mode=self.ctx.POINTS,
+                vertices=self._sprite_index_slots,
+            )
 
         # Leave global states to default
         if self._blend:
@@ -1127,6 +1866,121 @@ def draw(
             if blend_function is not None:
                 self.ctx.blend_func = prev_blend_func
 
+    def _build_chunks(self) -> None:
+        """Group the sprites into chunks and write the chunk index buffer."""
+        chunk_size: int = self._chunk_size  # type: ignore
+        pos_data = self._sprite_pos_data
+        size_data = self._sprite_size_data
+        # Slots and bounds (left, bottom, right, top) per chunk
+        slots_per_chunk: dict[tuple[int, int], list[int]] = {}
+        bounds_per_chunk: dict[tuple[int, int], list[float]] = {}
+
+        # Walk the slots in draw order so the order in each chunk is kept
+        for slot in self._sprite_index_data[: self._sprite_index_slots]:
+            x = pos_data[slot * 3]
+            y = pos_data[slot * 3 + 1]
+            # The rotated sprite always fits inside this radius
+            radius = math.hypot(size_data[slot * 2], size_data[slot * 2 + 1]) / 2
+            # Chunks are sorted by row first so neighbors in a row
+            # end up next to each other in the index buffer
+            key = (int(y // chunk_size), int(x // chunk_size))
+            bounds = bounds_per_chunk.get(key)
+            if bounds is None:
+                slots_per_chunk[key] = [slot]
+                bounds_per_chunk[key] = [x - radius, y - radius, x + radius, y + radius]
+                continue
+
+            slots_per_chunk[key].append(slot)
+            if x - radius < bounds[0]:
+                bounds[0] = x - radius
+            if y - radius < bounds[1]:
+                bounds[1] = y - radius
+            if x + radius > bounds[2]:
+                bounds[2] = x + radius
+            if y + radius > bounds[3]:
+                bounds[3] = y + radius
+
+        index_data = array("I")
+        chunks = []
+        for key in sorted(slots_per_chunk):
+            slots = slots_per_chunk[key]
+            left, bottom, right, top = bounds_per_chunk[key]
+            chunks.append((left, bottom, right, top, len(index_data), len(slots)))
+            index_data.extend(slots)
+
+        # The chunk index buffer shares the sprite buffers with the main geometry
+        size = max(len(index_data), 1) * 4
+        if self._chunk_index_buf is None or self._chunk_index_buf.size < size:
+            self._chunk_index_buf = self.ctx.buffer(reserve=size)
+            self._chunk_geometry = self.ctx.geometry(
+                [
+                    gl.BufferDescription(self._sprite_pos_buf, "3f", ["in_pos"]),  # type: ignore
+                    gl.BufferDescription(self._sprite_size_buf, "2f", ["in_size"]),  # type: ignore
+                    gl.BufferDescription(
+                        self._sprite_angle_buf, "1f", ["in_angle"]  # type: ignore
+                    ),
+                    gl.BufferDescription(
+                        self._sprite_texture_buf, "1f", ["in_texture"]  # type: ignore
+                    ),
+                    gl.BufferDescription(
+                        self._sprite_color_buf, "4f1", ["in_color"]  # type: ignore
+                    ),
+                ],
+                index_buffer=self._chunk_index_buf,
+                index_element_size=4,
+            )
+        self._chunk_index_buf.write(index_data)
+        self._chunks = chunks
+
+    def _get_view_bounds(self) -> Rect | None:
+        """
+        Get the area of the world visible to the current camera.
+
+        Returns:
+            The bounds or ``None`` if they are unknown for this kind of camera.
+        """
+        from arcade.camera import Camera2D
+        from arcade.camera.default import ViewportProjector
+
+        camera = self.ctx.current_camera
+        if isinstance(camera, Camera2D):
+            return camera.aabb()
+        if isinstance(camera, ViewportProjector):
+            return LBWH(0, 0, camera.viewport.width, camera.viewport.height)
+        return None
+
+    def _draw_chunks(self) -> None:
+        """Draw the chunks overlapping the view of the current camera."""
+        if self._chunks is None:
+            self._build_chunks()
+
+        chunks: list[tuple[float, float, float, float, int, int]] = self._chunks  # type: ignore
+        geometry: Geometry = self._chunk_geometry  # type: ignore
+        program: Program = self.program  # type: ignore
+        mode = self.ctx.POINTS
+
+        view = self._get_view_bounds()
+        if view is None:
+            geometry.render(program, mode=mode, vertices=self._sprite_index_slots)
+            return
+
+        view_left, view_right, view_bottom, view_top = view.lrbt
+        # Visible chunks next to each other in the index buffer are drawn together
+        run_start = run_end = 0
+        for left, bottom, right, top, first, count in chunks:
+            if right < view_left or left > view_right or top < view_bottom or bottom > view_top:
+                continue
+            if first != run_end:
+                if run_end > run_start:
+                    geometry.render(
+                        program, mode=mode, first=run_start, vertices=run_end - run_start
+                    )
+                run_start = first
+            run_end = first + count
+
+        if run_end > run_start:
+            geometry.render(program, mode=mode, first=run_start, vertices=run_end - run_start)
+
     def draw_hit_boxes(self, color: RGBA255 = (0, 0, 0, 255), line_thickness: float = 1.0) -> None:
         """
         Draw all the hit boxes in this list.
@@ -1147,18 +2001,39 @@ def _normalize_index_buffer(self) -> None:
         The other buffers don't need this because they re-use slots.
         New sprites on the other hand always needs to be added
         to the end of the index buffer to preserve order
+
+        Removed sprites are also dropped from the python list here,
+        and their buffer slots are made available again.
         """
-        # NOTE: Currently we keep the index buffer normalized
-        #       but we can increase the performance in the future
-        #       delaying normalization.
-        # Need counter for how many slots are used in index buffer.
-        # 1) Sort the deleted indices (descending) and pop() them in a loop
-        # 2) Create a new array.array and manually copy every
-        #    item in the list except the deleted index slots
-        # 3) Use a transform (gpu) to trim the index buffer and
-        #    read this buffer back into a new array using array.from_bytes
-        # NOTE: Right now the index buffer is always normalized
-        pass
+        removed_slots = self._removed_slots
+        if not removed_slots:
+            return
+
+        removed_sprites = self._removed_sprites
+        self._sprite_list = [
+            sprite for sprite in self._sprite_list if sprite not in removed_sprites
+        ]
+
+        index_data = array(
+            self._sprite_index_data.typecode,
+            [
+                slot
+                for slot in self._sprite_index_data[: self._sprite_index_slots]
+                if slot not in removed_slots
+            ],
+        )
+        self._sprite_index_slots = len(index_data)
+        # Pad to the original capacity
+        index_data.extend([0] * (len(self._sprite_index_data) - len(index_data)))
+        self._sprite_index_data = index_data
+        self._sprite_index_changed = True
+
+        if self._pool is not None:
+            self._pool._release_many(removed_sprites)
+        else:
+            self._sprite_buffer_free_slots.extend(sorted(removed_slots))
+        self._removed_sprites = set()
+        self._removed_slots = set()
 
     def _grow_sprite_buffers(self) -> None:
         """Double the internal buffer sizes"""
@@ -1166,9 +2041,18 @@ def _grow_sprite_buffers(self) -> None:
         if self._sprite_buffer_slots <= self._buf_capacity:
             return
 
-        # Double the capacity
-        extend_by = self._buf_capacity
-        self._buf_capacity = self._buf_capacity * 2
+        # Double the capacity, or more if many slots were allocated at once
+        self._resize_sprite_buffers(max(self._buf_capacity * 2, self._sprite_buffer_slots))
+
+    def _resize_sprite_buffers(self, capacity: int) -> None:
+        """
+        Increase the capacity of the sprite buffers.
+
+        Args:
+            capacity: The new number of sprite slots
+        """
+        extend_by = capacity - self._buf_capacity
+        self._buf_capacity = capacity
 
         # LOG.debug(
         #     "(%s) Increasing buffer capacity from %s to %s",
@@ -1183,14 +2067,17 @@ def _grow_sprite_buffers(self) -> None:
         self._sprite_angle_data.extend([0] * extend_by)
         self._sprite_color_data.extend([0] * extend_by * 4)
         self._sprite_texture_data.extend([0] * extend_by)
+        if self._sprite_velocity_data is not None:
+            self._sprite_velocity_data.extend([0] * extend_by * 2)
+            self._sprite_change_angle_data.extend([0] * extend_by)  # type: ignore
 
         if self._initialized:
             # Proper initialization implies these buffers are allocated
-            self._sprite_pos_buf.orphan(double=True)  # type: ignore
-            self._sprite_size_buf.orphan(double=True)  # type: ignore
-            self._sprite_angle_buf.orphan(double=True)  # type: ignore
-            self._sprite_color_buf.orphan(double=True)  # type: ignore
-            self._sprite_texture_buf.orphan(double=True)  # type: ignore
+            self._sprite_pos_buf.orphan(size=capacity * 12)  # type: ignore
+            self._sprite_size_buf.orphan(size=capacity * 8)  # type: ignore
+            self._sprite_angle_buf.orphan(size=capacity * 4)  # type: ignore
+            self._sprite_color_buf.orphan(size=capacity * 4)  # type: ignore
+            self._sprite_texture_buf.orphan(size=capacity * 4)  # type: ignore
 
         self._sprite_pos_changed = True
         self._sprite_size_changed = True
@@ -1203,8 +2090,17 @@ def _grow_index_buffer(self) -> None:
         if self._sprite_index_slots <= self._idx_capacity:
             return
 
-        extend_by = self._idx_capacity
-        self._idx_capacity = self._idx_capacity * 2
+        self._resize_index_buffer(max(self._idx_capacity * 2, self._sprite_index_slots))
+
+    def _resize_index_buffer(self, capacity: int) -> None:
+        """
+        Increase the capacity of the index buffer.
+
+        Args:
+            capacity: The new number of index slots
+        """
+        extend_by = capacity - self._idx_capacity
+        self._idx_capacity = capacity
 
         # LOG.debug(
         #     "Buffers: index_slots=%s sprite_slots=%s over-allocation-ratio=%s",
@@ -1226,6 +2122,24 @@ def _grow_index_buffer(self) -> None:
 
         self._sprite_index_changed = True
 
+    def _register_sprite(self, sprite: SpriteType) -> None:
+        """
+        Register the list with a sprite added to it, so the list is told
+        about changes to the sprite. Sprites in a pool register the pool
+        instead, which writes the changes once for all its lists.
+        """
+        if self._pool is not None:
+            self._pool._join(sprite, self)
+        else:
+            sprite.register_sprite_list(self)
+
+    def _unregister_sprite(self, sprite: SpriteType) -> None:
+        """Undo :py:meth:`_register_sprite` for a sprite removed from the list."""
+        if self._pool is not None:
+            self._pool._leave(sprite, self)
+        else:
+            sprite.sprite_lists.remove(self)
+
     def _update_all(self, sprite: SpriteType) -> None:
         """
         Update all sprite data. This is faster when adding and moving sprites.
@@ -1239,20 +2153,23 @@ def _update_all(self, sprite: SpriteType) -> None:
         self._sprite_pos_data[slot * 3] = sprite._position[0]
         self._sprite_pos_data[slot * 3 + 1] = sprite._position[1]
         self._sprite_pos_data[slot * 3 + 2] = sprite._depth
-        self._sprite_pos_changed = True
+        self._sprite_pos_dirty.add(slot)
         # size
         self._sprite_size_data[slot * 2] = sprite._width
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        self._sprite_size_dirty.add(slot)
         # angle
         self._sprite_angle_data[slot] = sprite._angle
-        self._sprite_angle_changed = True
+        self._sprite_angle_dirty.add(slot)
         # color
         self._sprite_color_data[slot * 4] = sprite._color[0]
         self._sprite_color_data[slot * 4 + 1] = sprite._color[1]
         self._sprite_color_data[slot * 4 + 2] = sprite._color[2]
         self._sprite_color_data[slot * 4 + 3] = sprite._color[3]
-        self._sprite_color_changed = True
+        self._sprite_color_dirty.add(slot)
+        # velocity
+        if self._sprite_velocity_data is not None:
+            self._update_velocity(sprite)
 
         # Don't deal with textures if spritelist is not initialized.
         # This can often mean we don't have a context/window yet.
@@ -1267,7 +2184,7 @@ def _update_all(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
 
         self._sprite_texture_data[slot] = tex_slot
-        self._sprite_texture_changed = True
+        self._sprite_texture_dirty.add(slot)
 
     def _update_texture(self, sprite: SpriteType) -> None:
         """
@@ -1289,13 +2206,13 @@ def _update_texture(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
 
         self._sprite_texture_data[slot] = tex_slot
-        self._sprite_texture_changed = True
+        self._sprite_texture_dirty.add(slot)
 
         # Update size in cas the sprite was initialized without size
         # NOTE: There should be a better way to do this
         self._sprite_size_data[slot * 2] = sprite._width
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        self._sprite_size_dirty.add(slot)
 
     def _update_position(self, sprite: SpriteType) -> None:
         """
@@ -1311,7 +2228,7 @@ def _update_position(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3] = sprite._position[0]
         self._sprite_pos_data[slot * 3 + 1] = sprite._position[1]
-        self._sprite_pos_changed = True
+        self._sprite_pos_dirty.add(slot)
 
     def _update_position_x(self, sprite: SpriteType) -> None:
         """
@@ -1326,7 +2243,7 @@ def _update_position_x(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3] = sprite._position[0]
-        self._sprite_pos_changed = True
+        self._sprite_pos_dirty.add(slot)
 
     def _update_position_y(self, sprite: SpriteType) -> None:
         """
@@ -1341,7 +2258,7 @@ def _update_position_y(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3 + 1] = sprite._position[1]
-        self._sprite_pos_changed = True
+        self._sprite_pos_dirty.add(slot)
 
     def _update_depth(self, sprite: SpriteType) -> None:
         """
@@ -1353,7 +2270,7 @@ def _update_depth(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3 + 2] = sprite._depth
-        self._sprite_pos_changed = True
+        self._sprite_pos_dirty.add(slot)
 
     def _update_color(self, sprite: SpriteType) -> None:
         """
@@ -1369,7 +2286,7 @@ def _update_color(self, sprite: SpriteType) -> None:
         self._sprite_color_data[slot * 4 + 1] = int(sprite._color[1])
         self._sprite_color_data[slot * 4 + 2] = int(sprite._color[2])
         self._sprite_color_data[slot * 4 + 3] = int(sprite._color[3] * sprite._visible)
-        self._sprite_color_changed = True
+        self._sprite_color_dirty.add(slot)
 
     def _update_size(self, sprite: SpriteType) -> None:
         """
@@ -1382,7 +2299,7 @@ def _update_size(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
         self._sprite_size_data[slot * 2] = sprite._width
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        self._sprite_size_dirty.add(slot)
 
     def _update_width(self, sprite: SpriteType) -> None:
         """
@@ -1394,7 +2311,7 @@ def _update_width(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_size_data[slot * 2] = sprite._width
-        self._sprite_size_changed = True
+        self._sprite_size_dirty.add(slot)
 
     def _update_height(self, sprite: SpriteType) -> None:
         """
@@ -1406,7 +2323,7 @@ def _update_height(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        self._sprite_size_dirty.add(slot)
 
     def _update_angle(self, sprite: SpriteType) -> None:
         """
@@ -1418,4 +2335,23 @@ def _update_angle(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_angle_data[slot] = sprite._angle
-        self._sprite_angle_changed = True
+        self._sprite_angle_dirty.add(slot)
+
+    def _update_velocity(self, sprite: SpriteType) -> None:
+        """
+        Called by the Sprite class to update the velocity and ``change_angle``
+        of the specified sprite. Only used with velocity columns.
+
+        Args:
+            sprite: Sprite to update.
+        """
+        velocity_data = self._sprite_velocity_data
+        if velocity_data is None:
+            return
+
+        slot = self.sprite_slot[sprite]
+        # Basic sprites don't move on their own
+        change_x, change_y = getattr(sprite, "_velocity", (0.0, 0.0))
+        velocity_data[slot * 2] = change_x
+        velocity_data[slot * 2 + 1] = change_y
+        self._sprite_change_angle_data[slot] = getattr(sprite, "_change_angle", 0.0)  # type: ignore
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, Iterable
+
+from arcade.sprite import SpriteType
+from arcade.sprite.base import BasicSprite
+from arcade.types import Point
+from arcade.types.rect import Rect
+
+from .broad_phase import BroadPhase
+from .sprite_list import SpriteList
+
+if TYPE_CHECKING:
+    from arcade.texture_atlas import TextureAtlasBase
+
+
+class SpritePool(Generic[SpriteType]):
+    """
+    Sprite buffers shared by several :py:class:`~arcade.SpriteList` instances.
+
+    Games often keep the same sprite in several lists, such as a list for
+    drawing, a list for collisions and a list per team. Normally every list
+    keeps its own copy of the position, size, angle, color and texture of
+    the sprite, and writes it to its own buffers on the GPU.
+
+    Sprite lists created with the same pool share a single set of these
+    buffers. Each list only keeps its own index buffer, which decides
+    which sprites it draws and in what order. Being in more lists then
+    only costs an index per list, and the shared buffers are only written
+    to the GPU once per frame no matter how many lists are drawn.
+
+    Example::
+
+        pool = arcade.SpritePool()
+        self.all_sprites = arcade.SpriteList(pool=pool)
+        self.enemies = arcade.SpriteList(pool=pool, use_spatial_hash=True)
+        self.red_team = arcade.SpriteList(pool=pool)
+
+    A sprite is stored in the pool as long as it is in one of its lists.
+    Lists with a pool work like any other sprite list, including collision
+    checks, sorting and drawing.
+
+    Sprites register the pool once instead of every list of the pool they
+    are in, so a change to a sprite is only written once. Because of this
+    :py:attr:`~arcade.BasicSprite.sprite_lists` holds an internal list of
+    the pool in place of these lists. Use ``sprite in sprite_list`` to
+    check if a sprite is in a list of a pool.
+
+    Args:
+        capacity:
+            The initial number of sprites the pool has room for.
+            The pool grows as needed.
+        atlas:
+            The texture atlas for all lists in the pool. If no atlas
+            is supplied the default one is used.
+    """
+
+    def __init__(self, capacity: int = 100, atlas: TextureAtlasBase | None = None) -> None:
+        # The shared buffers are stored in a sprite list which is never
+        # drawn. Sprites are not added to it, but it is registered with
+        # them and receives the sprite updates for all lists in the pool.
+        self._storage: _PoolStorage[SpriteType] = _PoolStorage(self, capacity, atlas)
+        # The number of lists in the pool each sprite has a slot for
+        self._ref_count: dict[SpriteType, int] = {}
+        # The lists in the pool each sprite is in
+        self._sprite_lists: dict[SpriteType, list[SpriteList[SpriteType]]] = {}
+        # Increased every time sprites moved, were resized or rotated
+        # since the last write. Lists use this to know when to sort
+        # or rebuild chunks.
+        self._version = 0
+
+    def __len__(self) -> int:
+        """Return the number of sprites stored in the pool."""
+        return len(self._ref_count)
+
+    def __contains__(self, sprite: SpriteType) -> bool:
+        """Return if the sprite is stored in the pool."""
+        return sprite in self._ref_count
+
+    @property
+    def capacity(self) -> int:
+        """The number of sprites the buffers have room for before growing."""
+        return self._storage._buf_capacity
+
+    @property
+    def atlas(self) -> TextureAtlasBase | None:
+        """The texture atlas used by all lists in the pool."""
+        return self._storage._atlas
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Make room for at least ``capacity`` sprites in the shared buffers.
+
+        Args:
+            capacity: The number of sprites to make room for
+        """
+        if capacity > self._storage._buf_capacity:
+            self._storage._resize_sprite_buffers(capacity)
+
+    def _acquire(self, sprite: SpriteType) -> int:
+        """
+        Get the buffer slot of a sprite added to a list in the pool.
+
+        The first list adding a sprite allocates a new slot.
+        The list is responsible for writing the sprite data.
+        """
+        storage = self._storage
+        count = self._ref_count.get(sprite)
+        if count is not None:
+            self._ref_count[sprite] = count + 1
+            return storage.sprite_slot[sprite]
+
+        slot = storage._next_slot()
+        storage.sprite_slot[sprite] = slot
+        self._ref_count[sprite] = 1
+        return slot
+
+    def _release(self, sprite: SpriteType) -> None:
+        """
+        Release a sprite removed from a list in the pool.
+
+        The slot is freed when the last list in the pool releases it. Lists
+        only release sprites once their index buffer no longer uses the slot.
+        """
+        count = self._ref_count[sprite] - 1
+        if count > 0:
+            self._ref_count[sprite] = count
+            return
+
+        del self._ref_count[sprite]
+        storage = self._storage
+        storage._sprite_buffer_free_slots.append(storage.sprite_slot.pop(sprite))
+
+    def _release_many(self, sprites: Iterable[SpriteType]) -> None:
+        """Release several sprites. See :py:meth:`_release`."""
+        for sprite in sprites:
+            self._release(sprite)
+
+    def _join(self, sprite: SpriteType, sprite_list: SpriteList[SpriteType]) -> None:
+        """
+        Record a sprite added to a list in the pool.
+
+        The pool storage is registered with the sprite when it joins
+        its first list in the pool.
+        """
+        sprite_lists = self._sprite_lists.get(sprite)
+        if sprite_lists is None:
+            self._sprite_lists[sprite] = [sprite_list]
+            sprite.register_sprite_list(self._storage)
+        else:
+            sprite_lists.append(sprite_list)
+
+    def _leave(self, sprite: SpriteType, sprite_list: SpriteList[SpriteType]) -> None:
+        """
+        Record a sprite removed from a list in the pool.
+
+        The pool storage is unregistered when the sprite leaves
+        its last list in the pool.
+        """
+        sprite_lists = self._sprite_lists[sprite]
+        sprite_lists.remove(sprite_list)
+        if not sprite_lists:
+            del self._sprite_lists[sprite]
+            sprite.sprite_lists.remove(self._storage)
+
+    def _init_deferred(self) -> None:
+        """Create the shared buffers and add the textures of all sprites to the atlas."""
+        storage = self._storage
+        if storage._initialized:
+            return
+
+        storage._init_deferred()
+        for sprite in storage.sprite_slot:
+            if sprite._texture is None:
+                raise ValueError("Attempting to use a sprite without a texture")
+            storage._update_texture(sprite)
+
+    def _write_sprite_buffers_to_gpu(self) -> None:
+        """Write the shared buffers to the GPU if anything changed."""
+        storage = self._storage
+        if (
+            storage._sprite_pos_changed
+            or storage._sprite_size_changed
+            or storage._sprite_angle_changed
+            or storage._sprite_pos_dirty
+            or storage._sprite_size_dirty
+            or storage._sprite_angle_dirty
+        ):
+            self._version += 1
+        storage._write_sprite_buffers_to_gpu()
+
+
+class _PoolStorage(SpriteList[SpriteType]):
+    """
+    The shared buffers of a :py:class:`SpritePool`.
+
+    Sprites in the lists of the pool register this list once instead of
+    each of the lists, so their changes are only written once. Removing
+    a sprite from it, such as with :py:meth:`~arcade.BasicSprite.kill`,
+    removes it from all lists in the pool.
+    """
+
+    def __init__(
+        self,
+        pool: SpritePool[SpriteType],
+        capacity: int,
+        atlas: TextureAtlasBase | None,
+    ) -> None:
+        super().__init__(capacity=capacity, atlas=atlas, lazy=True)
+        self._owner = pool
+        # Sprites move themselves in the broad phase of the lists they are
+        # registered with. This one passes the moves on to the lists.
+        self.spatial_hash = _PoolBroadPhase(pool)
+
+    def remove(self, sprite: SpriteType) -> None:
+        """Remove a sprite from all lists in the pool."""
+        for sprite_list in list(self._owner._sprite_lists[sprite]):
+            sprite_list.remove(sprite)
+
+
+class _PoolBroadPhase(BroadPhase[SpriteType]):
+    """
+    Passes sprite moves on to the broad phases of the lists in a pool.
+
+    Only used by the pool storage. Like the storage it holds no sprites,
+    so queries find nothing.
+    """
+
+    def __init__(self, pool: SpritePool[SpriteType]) -> None:
+        self._pool = pool
+
+    def reset(self) -> None:
+        pass
+
+    def add(self, sprite: SpriteType) -> None:
+        pass
+
+    def move(self, sprite: SpriteType) -> None:
+        for sprite_list in self._pool._sprite_lists[sprite]:
+            if sprite_list.spatial_hash is not None:
+                sprite_list.spatial_hash.move(sprite)
+
+    def remove(self, sprite: SpriteType) -> None:
+        pass
+
+    def get_sprites_near_sprite(self, sprite: BasicSprite) -> set[SpriteType]:
+        return set()
+
+    def get_sprites_near_point(self, point: Point) -> set[SpriteType]:
+        return set()
+
+    def get_sprites_near_rect(self, rect: Rect) -> set[SpriteType]:
+        return set()
+
+    @property
+    def count(self) -> int:
+        return 0
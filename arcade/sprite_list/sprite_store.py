@@ -0,0 +1,657 @@
+"""
+SpriteStore - Stores and draws many sprites as columns of numbers.
+Each sprite is only a lightweight view into the columns.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Iterator
+
+from arcade import get_window
+from arcade.gl.buffer import Buffer
+from arcade.gl.types import BlendFunction
+from arcade.types import RGBA255, Color, Point2
+
+from .sprite_buffers import SpriteBuffers
+from .sprite_list import _get_dirty_ranges
+
+if TYPE_CHECKING:
+    from arcade import Sprite, Texture
+    from arcade.sprite.base import BasicSprite
+    from arcade.texture_atlas import TextureAtlasBase
+
+# The default number of sprites the store has room for
+_DEFAULT_CAPACITY = 100
+
+
+class SpriteView:
+    """
+    A sprite stored in a :py:class:`SpriteStore`.
+
+    A view only holds the store and the slot of the sprite in it. Reading
+    or writing an attribute goes straight to the columns of the store.
+    Views are created when they are needed, so two views of the same sprite
+    are equal but not always the same object.
+
+    Views of removed sprites must not be used. The slot can be reused by
+    a sprite added later.
+
+    Args:
+        store: The store holding the sprite
+        slot: The slot of the sprite in the store
+    """
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: SpriteStore, slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SpriteView):
+            return NotImplemented
+        return self._store is other._store and self._slot == other._slot
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._slot))
+
+    def __repr__(self) -> str:
+        return f"<SpriteView slot={self._slot} position={self.position}>"
+
+    @property
+    def store(self) -> SpriteStore:
+        """The store holding this sprite."""
+        return self._store
+
+    @property
+    def center_x(self) -> float:
+        """The x position of the center of the sprite."""
+        return self._store._pos_data[self._slot * 3]
+
+    @center_x.setter
+    def center_x(self, value: float) -> None:
+        store = self._store
+        store._pos_data[self._slot * 3] = value
+        store._pos_dirty.add(self._slot)
+
+    @property
+    def center_y(self) -> float:
+        """The y position of the center of the sprite."""
+        return self._store._pos_data[self._slot * 3 + 1]
+
+    @center_y.setter
+    def center_y(self, value: float) -> None:
+        store = self._store
+        store._pos_data[self._slot * 3 + 1] = value
+        store._pos_dirty.add(self._slot)
+
+    @property
+    def position(self) -> Point2:
+        """The position of the center of the sprite."""
+        index = self._slot * 3
+        data = self._store._pos_data
+        return data[index], data[index + 1]
+
+    @position.setter
+    def position(self, value: Point2) -> None:
+        store = self._store
+        index = self._slot * 3
+        store._pos_data[index : index + 2] = array("f", value)
+        store._pos_dirty.add(self._slot)
+
+    @property
+    def depth(self) -> float:
+        """The depth of the sprite. See :py:attr:`arcade.BasicSprite.depth`."""
+        return self._store._pos_data[self._slot * 3 + 2]
+
+    @depth.setter
+    def depth(self, value: float) -> None:
+        store = self._store
+        store._pos_data[self._slot * 3 + 2] = value
+        store._pos_dirty.add(self._slot)
+
+    @property
+    def change_x(self) -> float:
+        """The x velocity of the sprite in pixels per frame at 60 fps."""
+        return self._store._velocity_data[self._slot * 2]
+
+    @change_x.setter
+    def change_x(self, value: float) -> None:
+        self._store._velocity_data[self._slot * 2] = value
+
+    @property
+    def change_y(self) -> float:
+        """The y velocity of the sprite in pixels per frame at 60 fps."""
+        return self._store._velocity_data[self._slot * 2 + 1]
+
+    @change_y.setter
+    def change_y(self, value: float) -> None:
+        self._store._velocity_data[self._slot * 2 + 1] = value
+
+    @property
+    def velocity(self) -> Point2:
+        """The velocity of the sprite. See :py:meth:`SpriteStore.update`."""
+        index = self._slot * 2
+        data = self._store._velocity_data
+        return data[index], data[index + 1]
+
+    @velocity.setter
+    def velocity(self, value: Point2) -> None:
+        index = self._slot * 2
+        self._store._velocity_data[index : index + 2] = array("f", value)
+
+    @property
+    def width(self) -> float:
+        """The width of the sprite in pixels."""
+        return self._store._size_data[self._slot * 2]
+
+    @width.setter
+    def width(self, value: float) -> None:
+        store = self._store
+        store._size_data[self._slot * 2] = value
+        store._size_dirty.add(self._slot)
+
+    @property
+    def height(self) -> float:
+        """The height of the sprite in pixels."""
+        return self._store._size_data[self._slot * 2 + 1]
+
+    @height.setter
+    def height(self, value: float) -> None:
+        store = self._store
+        store._size_data[self._slot * 2 + 1] = value
+        store._size_dirty.add(self._slot)
+
+    @property
+    def size(self) -> Point2:
+        """The width and height of the sprite in pixels."""
+        index = self._slot * 2
+        data = self._store._size_data
+        return data[index], data[index + 1]
+
+    @size.setter
+    def size(self, value: Point2) -> None:
+        store = self._store
+        index = self._slot * 2
+        store._size_data[index : index + 2] = array("f", value)
+        store._size_dirty.add(self._slot)
+
+    @property
+    def scale(self) -> Point2:
+        """The scale of the texture on each axis."""
+        texture: Texture = self._store._textures[self._slot]  # type: ignore
+        width, height = self.size
+        return width / texture.width, height / texture.height
+
+    @scale.setter
+    def scale(self, value: float | Point2) -> None:
+        if isinstance(value, (float, int)):
+            value = value, value
+        texture: Texture = self._store._textures[self._slot]  # type: ignore
+        self.size = texture.width * value[0], texture.height * value[1]
+
+    @property
+    def angle(self) -> float:
+        """The angle of the sprite in degrees, clockwise."""
+        return self._store._angle_data[self._slot]
+
+    @angle.setter
+    def angle(self, value: float) -> None:
+        store = self._store
+        store._angle_data[self._slot] = value
+        store._angle_dirty.add(self._slot)
+
+    @property
+    def change_angle(self) -> float:
+        """How much the angle changes per frame at 60 fps."""
+        return self._store._change_angle_data[self._slot]
+
+    @change_angle.setter
+    def change_angle(self, value: float) -> None:
+        self._store._change_angle_data[self._slot] = value
+
+    @property
+    def color(self) -> Color:
+        """The color the texture is tinted with, including the alpha."""
+        index = self._slot * 4
+        return Color.from_iterable(self._store._color_data[index : index + 4])
+
+    @color.setter
+    def color(self, value: RGBA255) -> None:
+        color = Color.from_iterable(value)
+        store = self._store
+        index = self._slot * 4
+        store._color_data[index : index + 4] = array("B", color)
+        store._color_dirty.add(self._slot)
+
+    @property
+    def alpha(self) -> int:
+        """The alpha value of the sprite from 0 to 255."""
+        return self._store._color_data[self._slot * 4 + 3]
+
+    @alpha.setter
+    def alpha(self, value: int) -> None:
+        store = self._store
+        store._color_data[self._slot * 4 + 3] = value
+        store._color_dirty.add(self._slot)
+
+    @property
+    def texture(self) -> Texture:
+        """
+        The texture of the sprite.
+
+        Setting a new texture keeps the scale, so the size of the
+        sprite follows the size of the new texture.
+        """
+        return self._store._textures[self._slot]  # type: ignore
+
+    @texture.setter
+    def texture(self, texture: Texture) -> None:
+        scale = self.scale
+        store = self._store
+        store._textures[self._slot] = texture
+        store._texture_dirty.add(self._slot)
+        self.size = texture.width * scale[0], texture.height * scale[1]
+
+    def remove_from_store(self) -> None:
+        """Remove the sprite from its store."""
+        self._store.remove(self)
+
+    def to_sprite(self) -> Sprite:
+        """
+        Create a regular :py:class:`~arcade.Sprite` with the same attributes.
+
+        The new sprite is a copy and is not connected to the store.
+        """
+        from arcade import Sprite
+
+        sprite = Sprite(self.texture, center_x=self.center_x, center_y=self.center_y)
+        sprite.size = self.size
+        sprite.angle = self.angle
+        sprite.depth = self.depth
+        sprite.color = self.color
+        sprite.velocity = self.velocity
+        sprite.change_angle = self.change_angle
+        return sprite
+
+
+class SpriteStore:
+    """
+    A compact batch of sprites stored as columns of numbers.
+
+    A :py:class:`~arcade.SpriteList` keeps a copy of the position, size,
+    angle and color of every sprite in its buffers, on top of the attributes
+    and hit box stored in each sprite object. Every change to a sprite goes
+    through a property setter that updates all the lists the sprite is in.
+
+    A sprite store only keeps the columns. Sprites are added with
+    :py:meth:`add`, which returns a :py:class:`SpriteView`. The views read
+    and write the columns directly, so changing a sprite is a single
+    array write. Views are only created when they are asked for, such as
+    when iterating or indexing the store.
+
+    This uses much less memory and is a lot faster to build for huge
+    amounts of sprites like the tiles of a large map or decorations.
+    The trade-off is that sprites in a store have no hit boxes, can't be
+    used with the collision functions and can't be in several lists.
+    Use :py:meth:`SpriteView.to_sprite` to make a regular sprite from one.
+
+    Sprites in a store also have a velocity and ``change_angle``.
+    :py:meth:`update` moves and rotates all of them in one pass over the
+    columns, instead of calling a method on every sprite.
+
+    Example::
+
+        store = arcade.SpriteStore()
+        for x in range(1000):
+            store.add(grass_texture, x * 64, 32)
+
+        store[0].center_y += 10
+        store.draw()
+
+    Args:
+        capacity:
+            The initial number of sprites the store has room for.
+            The store grows as needed.
+        atlas:
+            The texture atlas for the textures. If no atlas is supplied
+            the default one is used.
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY, atlas: TextureAtlasBase | None = None):
+        self._atlas: TextureAtlasBase | None = atlas
+        self._initialized = False
+        self.visible: bool = True
+        """Setting this to ``False`` will skip drawing the store."""
+
+        self._capacity = max(capacity, 1)
+        # The number of slots used in the columns, including free slots
+        self._slot_count = 0
+        # Slots freed by removed sprites
+        self._free_slots: Deque[int] = deque()
+
+        # The columns. Same layout as the sprite list buffers.
+        self._pos_data = array("f", bytes(self._capacity * 12))
+        self._size_data = array("f", bytes(self._capacity * 8))
+        self._angle_data = array("f", bytes(self._capacity * 4))
+        self._color_data = array("B", bytes(self._capacity * 4))
+        self._texture_data = array("f", bytes(self._capacity * 4))
+        # Velocity and change_angle. These are not written to the GPU.
+        self._velocity_data = array("f", bytes(self._capacity * 8))
+        self._change_angle_data = array("f", bytes(self._capacity * 4))
+        # The texture of each slot or None for free slots.
+        # Textures are only added to the atlas when drawing.
+        self._textures: list[Texture | None] = [None] * self._capacity
+        # The slots in draw order. This is the index buffer.
+        self._index_data = array("i")
+
+        # Slots changed since the last write to the GPU
+        self._pos_dirty: set[int] = set()
+        self._size_dirty: set[int] = set()
+        self._angle_dirty: set[int] = set()
+        self._color_dirty: set[int] = set()
+        self._texture_dirty: set[int] = set()
+        # Write all buffers on the next draw, such as after resizing them
+        self._buffers_changed = False
+        # Write the whole position or angle buffer after update() moved everything
+        self._pos_changed = False
+        self._angle_changed = False
+        self._index_changed = False
+
+        self._buffers: SpriteBuffers | None = None
+
+    def __len__(self) -> int:
+        """Return the number of sprites in the store."""
+        return len(self._index_data)
+
+    def __iter__(self) -> Iterator[SpriteView]:
+        """Iterate over views of the sprites in draw order."""
+        for slot in self._index_data:
+            yield SpriteView(self, slot)
+
+    def __getitem__(self, index: int) -> SpriteView:
+        """Get a view of the sprite at an index in draw order."""
+        return SpriteView(self, self._index_data[index])
+
+    def __contains__(self, view: object) -> bool:
+        return (
+            isinstance(view, SpriteView)
+            and view._store is self
+            and self._textures[view._slot] is not None
+        )
+
+    @property
+    def capacity(self) -> int:
+        """The number of sprites the store has room for before growing."""
+        return self._capacity
+
+    def add(
+        self,
+        texture: Texture,
+        center_x: float = 0.0,
+        center_y: float = 0.0,
+        *,
+        angle: float = 0.0,
+        scale: float | Point2 = 1.0,
+        color: RGBA255 = (255, 255, 255, 255),
+        depth: float = 0.0,
+        velocity: Point2 = (0.0, 0.0),
+        change_angle: float = 0.0,
+    ) -> SpriteView:
+        """
+        Add a sprite to the end of the store.
+
+        Args:
+            texture: The texture of the sprite
+            center_x: The x position of the sprite
+            center_y: The y position of the sprite
+            angle: The angle of the sprite in degrees
+            scale: The scale of the texture, uniform or per axis
+            color: The color to tint the texture with
+            depth: The depth of the sprite
+            velocity: The velocity of the sprite in pixels per frame at 60 fps
+            change_angle: How much the angle changes per frame at 60 fps
+        Returns:
+            A view of the new sprite
+        """
+        if isinstance(scale, (float, int)):
+            scale = scale, scale
+
+        if self._free_slots:
+            slot = self._free_slots.popleft()
+        else:
+            slot = self._slot_count
+            if slot == self._capacity:
+                self._resize(self._capacity * 2)
+            self._slot_count += 1
+
+        self._pos_data[slot * 3 : slot * 3 + 3] = array("f", (center_x, center_y, depth))
+        self._size_data[slot * 2 : slot * 2 + 2] = array(
+            "f", (texture.width * scale[0], texture.height * scale[1])
+        )
+        self._angle_data[slot] = angle
+        self._velocity_data[slot * 2 : slot * 2 + 2] = array("f", velocity)
+        self._change_angle_data[slot] = change_angle
+        self._color_data[slot * 4 : slot * 4 + 4] = array("B", Color.from_iterable(color))
+        self._textures[slot] = texture
+        self._index_data.append(slot)
+
+        self._pos_dirty.add(slot)
+        self._size_dirty.add(slot)
+        self._angle_dirty.add(slot)
+        self._color_dirty.add(slot)
+        self._texture_dirty.add(slot)
+        self._index_changed = True
+        return SpriteView(self, slot)
+
+    def add_sprite(self, sprite: BasicSprite) -> SpriteView:
+        """
+        Copy a sprite into the store.
+
+        The sprite itself is not changed or kept by the store.
+
+        Args:
+            sprite: The sprite to copy
+        Returns:
+            A view of the new sprite
+        """
+        view = self.add(
+            sprite.texture,
+            sprite.center_x,
+            sprite.center_y,
+            angle=sprite._angle,
+            color=sprite.color,
+            depth=sprite.depth,
+            # NOTE: Not all sprites have velocity
+            velocity=getattr(sprite, "velocity", (0.0, 0.0)),
+            change_angle=getattr(sprite, "change_angle", 0.0),
+        )
+        view.size = sprite.size
+        return view
+
+    def remove(self, view: SpriteView) -> None:
+        """
+        Remove a sprite from the store.
+
+        Args:
+            view: A view of the sprite to remove
+        Raises:
+            ValueError: If the sprite is not in the store
+        """
+        if view not in self:
+            raise ValueError("Sprite is not in the store")
+
+        slot = view._slot
+        self._index_data.remove(slot)
+        self._textures[slot] = None
+        self._free_slots.append(slot)
+        self._texture_dirty.discard(slot)
+        self._index_changed = True
+
+    def clear(self) -> None:
+        """Remove all sprites from the store."""
+        self._textures = [None] * self._capacity
+        self._index_data = array("i")
+        self._slot_count = 0
+        self._free_slots.clear()
+        self._pos_dirty.clear()
+        self._size_dirty.clear()
+        self._angle_dirty.clear()
+        self._color_dirty.clear()
+        self._texture_dirty.clear()
+        self._index_changed = True
+
+    def update(self, delta_time: float = 1 / 60) -> None:
+        """
+        Move and rotate all sprites by their velocity and ``change_angle``.
+
+        This gives the same result as the default :py:meth:`arcade.Sprite.update`,
+        but each axis is updated in a single pass over its column.
+
+        Args:
+            delta_time: Time since last update in seconds
+        """
+        count = self._slot_count
+        # Velocities are historically in pixels per frame at 60 fps
+        time_step = delta_time * 60
+
+        pos_data = self._pos_data
+        velocity_data = self._velocity_data
+        for axis in range(2):
+            changes = velocity_data[axis : count * 2 : 2]
+            if any(changes):
+                pos_data[axis : count * 3 : 3] = array(
+                    "f",
+                    [
+                        value + change * time_step
+                        for value, change in zip(pos_data[axis : count * 3 : 3], changes)
+                    ],
+                )
+                self._pos_changed = True
+
+        changes = self._change_angle_data[:count]
+        if any(changes):
+            self._angle_data[:count] = array(
+                "f",
+                [
+                    angle + change * time_step
+                    for angle, change in zip(self._angle_data[:count], changes)
+                ],
+            )
+            self._angle_changed = True
+
+    def _resize(self, capacity: int) -> None:
+        """Grow the columns and buffers to hold ``capacity`` sprites."""
+        extend_by = capacity - self._capacity
+        self._pos_data.frombytes(bytes(extend_by * 12))
+        self._size_data.frombytes(bytes(extend_by * 8))
+        self._angle_data.frombytes(bytes(extend_by * 4))
+        self._color_data.frombytes(bytes(extend_by * 4))
+        self._texture_data.frombytes(bytes(extend_by * 4))
+        self._velocity_data.frombytes(bytes(extend_by * 8))
+        self._change_angle_data.frombytes(bytes(extend_by * 4))
+        self._textures.extend([None] * extend_by)
+        self._capacity = capacity
+
+        if self._buffers is not None:
+            self._buffers.resize(capacity)
+            self._buffers_changed = True
+
+    def _init_deferred(self) -> None:
+        """Create the OpenGL resources once a window exists."""
+        if self._initialized:
+            return
+
+        ctx = get_window().ctx
+        if not self._atlas:
+            self._atlas = ctx.default_atlas
+        self._buffers = SpriteBuffers(ctx, self._capacity, indexed=True)
+        self._initialized = True
+        self._buffers_changed = True
+
+    def _write_buffers_to_gpu(self) -> None:
+        """Write the changed parts of the columns to the GPU buffers."""
+        # Look up the atlas slots of new textures
+        if self._texture_dirty:
+            atlas: TextureAtlasBase = self._atlas  # type: ignore
+            textures = self._textures
+            texture_data = self._texture_data
+            for slot in self._texture_dirty:
+                texture_data[slot] = atlas.add(textures[slot])[0]  # type: ignore
+
+        buffers: SpriteBuffers = self._buffers  # type: ignore
+        full = self._buffers_changed
+        self._write_buffer(
+            buffers.pos, self._pos_data, self._pos_dirty, 3, full or self._pos_changed
+        )
+        self._write_buffer(buffers.size, self._size_data, self._size_dirty, 2, full)
+        self._write_buffer(
+            buffers.angle, self._angle_data, self._angle_dirty, 1, full or self._angle_changed
+        )
+        self._write_buffer(buffers.color, self._color_data, self._color_dirty, 4, full)
+        self._write_buffer(buffers.texture, self._texture_data, self._texture_dirty, 1, full)
+        self._buffers_changed = False
+        self._pos_changed = False
+        self._angle_changed = False
+
+        if self._index_changed:
+            index_buf: Buffer = buffers.index  # type: ignore
+            if index_buf.size < len(self._index_data) * 4:
+                index_buf.orphan(size=self._capacity * 4)
+            index_buf.write(self._index_data)
+            self._index_changed = False
+
+    def _write_buffer(
+        self, buffer: Buffer, data: array, dirty_slots: set[int], components: int, full: bool
+    ) -> None:
+        """
+        Write one column to the GPU.
+
+        Only the ranges of dirty slots are written unless ``full`` is set
+        or writing the whole column is likely faster.
+        """
+        if not full and not dirty_slots:
+            return
+
+        ranges = None if full else _get_dirty_ranges(dirty_slots, self._slot_count)
+        dirty_slots.clear()
+
+        if ranges is None:
+            buffer.write(data)
+            return
+
+        view = memoryview(data)
+        slot_size = data.itemsize * components
+        for start, end in ranges:
+            buffer.write(view[start * components : end * components], offset=start * slot_size)
+
+    def draw(
+        self,
+        *,
+        pixelated: bool = False,
+        blend_function: BlendFunction | None = None,
+    ) -> None:
+        """
+        Draw all the sprites.
+
+        Args:
+            pixelated:
+                ``True`` for pixelated and ``False`` for smooth interpolation.
+            blend_function:
+                Optional blend function to draw the sprites with, such as
+                ``ctx.BLEND_ADDITIVE``. Defaults to ``ctx.BLEND_DEFAULT``.
+        """
+        if not self._index_data or not self.visible:
+            return
+
+        self._init_deferred()
+        self._write_buffers_to_gpu()
+
+        self._buffers.draw(  # type: ignore
+            self._atlas,  # type: ignore
+            len(self._index_data),
+            pixelated=pixelated,
+            blend_function=blend_function,
+        )
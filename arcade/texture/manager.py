@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
 import PIL.Image
 import PIL.ImageDraw
@@ -12,8 +15,10 @@
     HitBoxCache,
     ImageDataCache,
     TextureCache,
+    TextureDiskCache,
 )
 from arcade.texture import ImageData, SpriteSheet
+from arcade.types import Point2List
 
 from .texture import Texture
 
@@ -30,6 +35,9 @@ class TextureCacheManager:
             Optional image data cache to use. If not specified, a new cache will be created.
         texture_cache:
             Optional texture cache to use. If not specified, a new cache will be created
+        cache_path:
+            Optional directory for a persistent cache of image hashes and hit boxes.
+            See :py:attr:`cache_path`.
     """
 
     def __init__(
@@ -37,11 +45,14 @@ def __init__(
         hit_box_cache: HitBoxCache | None = None,
         image_data_cache: ImageDataCache | None = None,
         texture_cache: TextureCache | None = None,
+        cache_path: str | Path | None = None,
     ):
         self._sprite_sheets: dict[str, SpriteSheet] = {}
         self._hit_box_cache = hit_box_cache or HitBoxCache()
         self._image_data_cache = image_data_cache or ImageDataCache()
         self._texture_cache = texture_cache or TextureCache()
+        self._disk_cache: TextureDiskCache | None = None
+        self.cache_path = cache_path
 
     @property
     def hit_box_cache(self) -> HitBoxCache:
@@ -62,12 +73,42 @@ def texture_cache(self) -> TextureCache:
         """Cache for textures."""
         return self._texture_cache
 
+    @property
+    def cache_path(self) -> Path | None:
+        """
+        Get or set the directory of the persistent cache.
+
+        When set, the hash, size and hit boxes of loaded image files are
+        stored on disk. The next time an unchanged file is loaded, even
+        after a restart, the pixels are not hashed again and the hit boxes
+        are not calculated again. Only the image itself is decoded.
+
+        Set to ``None`` to stop using the persistent cache.
+
+        Example::
+
+            arcade.texture.default_texture_cache.cache_path = "~/.cache/my_game"
+        """
+        return self._disk_cache.path if self._disk_cache is not None else None
+
+    @cache_path.setter
+    def cache_path(self, value: str | Path | None):
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+        self._disk_cache = TextureDiskCache(value) if value is not None else None
+
+    @property
+    def disk_cache(self) -> TextureDiskCache | None:
+        """The persistent cache, if a :py:attr:`cache_path` is set."""
+        return self._disk_cache
+
     def flush(
         self,
         sprite_sheets: bool = True,
         textures: bool = True,
         image_data: bool = True,
         hit_boxes: bool = False,
+        disk: bool = False,
     ):
         """
         Remove contents from the texture manager.
@@ -81,6 +122,8 @@ def flush(
                 If ``True``, image data will be flushed.
             hit_boxes:
                 If ``True``, hit boxes will be flushed.
+            disk:
+                If ``True``, the persistent cache will be flushed.
         """
         if sprite_sheets:
             self._sprite_sheets.clear()
@@ -90,6 +133,8 @@ def flush(
             self._image_data_cache.flush()
         if hit_boxes:
             self._hit_box_cache.flush()
+        if disk and self._disk_cache is not None:
+            self._disk_cache.flush()
 
     def _get_real_path(self, path: str | Path) -> Path:
         """
@@ -201,8 +246,7 @@ def load_or_get_image(
         im_data = self._image_data_cache.get(name)
         if im_data:
             return im_data
-        image = PIL.Image.open(real_path).convert(mode)
-        im_data = ImageData(image, hash=hash)
+        im_data = self._load_image_data(real_path, hash=hash, mode=mode)
         self._image_data_cache.put(name, im_data)
         return im_data
 
@@ -247,6 +291,135 @@ def load_or_get_texture(
             crop=(x, y, width, height),
         )
 
+    def load_textures(
+        self,
+        file_paths: Iterable[str | Path],
+        *,
+        hit_box_algorithm: hitbox.HitBoxAlgorithm | None = None,
+        workers: int | None = None,
+    ) -> list[Texture]:
+        """
+        Load many images from disk in parallel and create textures.
+        Images already loaded are returned from the cache.
+
+        Decoding the images, calculating the image hashes and the hit boxes
+        are done on a pool of threads. Pillow and hashlib release the GIL
+        while working, so this is a lot faster than calling
+        :meth:`load_or_get_texture` for each file when loading a level
+        with many images.
+
+        The caches are only updated once all the files are loaded.
+        If a file fails to load, the error is raised and nothing
+        is added to the caches.
+
+        Example::
+
+            textures = manager.load_textures(
+                [f":resources:images/tiles/{name}.png" for name in names],
+                hit_box_algorithm=arcade.hitbox.algo_detailed,
+            )
+
+        Args:
+            file_paths:
+                Paths to the image files.
+            hit_box_algorithm (optional):
+                The hit box algorithm to use for the textures. If not specified,
+                the global default will be used.
+            workers (optional):
+                The maximum number of threads to use. If not specified the
+                default of :py:class:`concurrent.futures.ThreadPoolExecutor` is used.
+        Returns:
+            The textures in the same order as the paths.
+        """
+        hit_box_algorithm = hit_box_algorithm or hitbox.algo_default
+        real_paths = [self._get_real_path(path) for path in file_paths]
+
+        # Find the files not in the image data cache, loading each only once
+        to_load: dict[str, Path] = {}
+        for path in real_paths:
+            name = Texture.create_image_cache_name(path)
+            if name not in to_load and self._image_data_cache.get(name) is None:
+                to_load[name] = path
+
+        if to_load:
+            # The persistent cache is only used from this thread
+            disk_cache = self._get_disk_cache()
+            known: dict[str, tuple[str | None, Point2List | None]] = {}
+            # Files are checked before they are read, so a file changed
+            # while loading is not stored as unchanged
+            stats: dict[str, os.stat_result] = {}
+            for name, path in to_load.items():
+                info = None
+                if disk_cache is not None:
+                    stats[name] = os.stat(path)
+                    info = disk_cache.get_image_info(path, ImageData.hash_func, stats[name])
+                hash = info[0] if info is not None else None
+                points = self._get_hit_box_points(hash, hit_box_algorithm) if hash else None
+                known[name] = hash, points
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    name: executor.submit(
+                        self._load_texture_from_file, path, hit_box_algorithm, *known[name]
+                    )
+                    for name, path in to_load.items()
+                }
+                textures = {name: future.result() for name, future in futures.items()}
+
+            for name, texture in textures.items():
+                self._image_data_cache.put(name, texture.image_data)
+                self._hit_box_cache.put(texture, texture.hit_box_points)
+                # Files with the same pixel data share the first texture
+                if self._texture_cache.get(texture.cache_name) is None:
+                    self._texture_cache.put(texture)
+
+            if disk_cache is not None:
+                new = [name for name in textures if known[name][0] is None]
+                disk_cache.put_image_infos(
+                    (
+                        to_load[name],
+                        ImageData.hash_func,
+                        textures[name].image_data.hash,
+                        *textures[name].size,
+                        stats[name],
+                    )
+                    for name in new
+                )
+                disk_cache.put_hit_boxes(
+                    (texture.cache_name, texture.hit_box_points)
+                    for name, texture in textures.items()
+                    if known[name][1] is None
+                )
+
+        return [
+            self._load_or_get_texture(path, hit_box_algorithm=hit_box_algorithm)
+            for path in real_paths
+        ]
+
+    def _load_texture_from_file(
+        self,
+        file_path: Path,
+        hit_box_algorithm: hitbox.HitBoxAlgorithm,
+        hash: str | None = None,
+        hit_box_points: Point2List | None = None,
+    ) -> Texture:
+        """
+        Load an image and create a texture without touching the caches,
+        except for looking up hit boxes. This is called from worker threads.
+        """
+        image = PIL.Image.open(file_path).convert("RGBA")
+        image_data = ImageData(image, hash=hash)
+        if hit_box_points is None:
+            hit_box_points = self._hit_box_cache.get(
+                Texture.create_cache_name(hash=image_data.hash, hit_box_algorithm=hit_box_algorithm)
+            )
+        texture = Texture(
+            image_data, hit_box_algorithm=hit_box_algorithm, hit_box_points=hit_box_points
+        )
+        texture.file_path = file_path
+        texture.crop_values = (0, 0, 0, 0)
+        return texture
+
     def _load_or_get_texture(
         self,
         file_path: Path,
@@ -266,7 +439,7 @@ def _load_or_get_texture(
             texture = self._texture_cache.get_with_config(image_data.hash, hit_box_algorithm)
         # If we still don't have a texture, create it
         if texture is None:
-            texture = Texture(image_data, hit_box_algorithm=hit_box_algorithm)
+            texture = self._create_texture(image_data, hit_box_algorithm)
             texture.file_path = file_path
             texture.crop_values = crop
             self._texture_cache.put(texture)
@@ -287,7 +460,7 @@ def _load_or_get_texture(
                 # We might have a texture for this image data
                 texture = self._texture_cache.get_with_config(image_data.hash, hit_box_algorithm)
                 if texture is None:
-                    texture = Texture(image_data, hit_box_algorithm=hit_box_algorithm)
+                    texture = self._create_texture(image_data, hit_box_algorithm)
                     texture.file_path = file_path
                     texture.crop_values = crop
                     self._texture_cache.put(texture)
@@ -322,11 +495,75 @@ def _load_or_get_image(
         image_data = self._image_data_cache.get(Texture.create_image_cache_name(file_path_str))
         if not image_data:
             cached = False
-            im = PIL.Image.open(file_path).convert(mode)
-            image_data = ImageData(im, hash)
+            image_data = self._load_image_data(file_path, hash=hash, mode=mode)
             self._image_data_cache.put(
                 Texture.create_image_cache_name(file_path_str),
                 image_data,
             )
 
         return image_data, cached
+
+    def _get_disk_cache(self) -> TextureDiskCache | None:
+        """
+        Get the persistent cache, unless the current image hash
+        depends on the load order and can't be stored.
+        """
+        if ImageData.hash_func == "sampled":
+            return None
+        return self._disk_cache
+
+    def _load_image_data(
+        self,
+        file_path: Path,
+        hash: str | None = None,
+        mode: str = "RGBA",
+    ) -> ImageData:
+        """
+        Load an image from disk, using the hash in the persistent
+        cache if the file did not change.
+        """
+        disk_cache = self._get_disk_cache()
+        if hash is not None or disk_cache is None or mode != "RGBA":
+            return ImageData(PIL.Image.open(file_path).convert(mode), hash=hash)
+
+        # Check the file before reading it, so a file changed while
+        # loading is not stored as unchanged
+        stat = os.stat(file_path)
+        image = PIL.Image.open(file_path).convert(mode)
+        info = disk_cache.get_image_info(file_path, ImageData.hash_func, stat)
+        if info is not None and info[1:] == image.size:
+            return ImageData(image, hash=info[0])
+
+        image_data = ImageData(image)
+        disk_cache.put_image_info(
+            file_path, ImageData.hash_func, image_data.hash, image.width, image.height, stat
+        )
+        return image_data
+
+    def _get_hit_box_points(
+        self, hash: str, hit_box_algorithm: hitbox.HitBoxAlgorithm
+    ) -> Point2List | None:
+        """Look up hit box points in the hit box cache and the persistent cache."""
+        name = Texture.create_cache_name(hash=hash, hit_box_algorithm=hit_box_algorithm)
+        points = self._hit_box_cache.get(name)
+        disk_cache = self._get_disk_cache()
+        if points is None and disk_cache is not None:
+            points = disk_cache.get_hit_box(name)
+            if points is not None:
+                self._hit_box_cache.put(name, points)
+        return points
+
+    def _create_texture(
+        self, image_data: ImageData, hit_box_algorithm: hitbox.HitBoxAlgorithm
+    ) -> Texture:
+        """Create a texture, reusing cached hit box points and caching new ones."""
+        hit_box_points = self._get_hit_box_points(image_data.hash, hit_box_algorithm)
+        texture = Texture(
+            image_data, hit_box_algorithm=hit_box_algorithm, hit_box_points=hit_box_points
+        )
+        if hit_box_points is None:
+            self._hit_box_cache.put(texture, texture.hit_box_points)
+            disk_cache = self._get_disk_cache()
+            if disk_cache is not None:
+                disk_cache.put_hit_box(texture.cache_name, texture.hit_box_points)
+        return texture
@@ -6,10 +6,11 @@
 from PIL import Image
 from PIL.Image import Transpose
 
+from arcade import hitbox
 from arcade.resources import resolve
 
 # from arcade import Texture
-from arcade.texture import Texture
+from arcade.texture import ImageData, Texture
 
 if TYPE_CHECKING:
     from arcade.hitbox import HitBoxAlgorithm
@@ -208,10 +209,16 @@ def get_texture_grid(
         count: int,
         margin: tuple[int, int, int, int] = (0, 0, 0, 0),
         hit_box_algorithm: HitBoxAlgorithm | None = None,
+        hash_by_position: bool = False,
     ) -> list[Texture]:
         """
         Slice a grid of textures from the sprite sheet.
 
+        Add the textures to an atlas with
+        :py:meth:`~arcade.DefaultTextureAtlas.add_textures` or
+        :py:meth:`~arcade.SpriteList.preload_textures` to write them
+        to the atlas in a few large batches.
+
         Args:
             size:
                 Size of each texture ``(width, height)``
@@ -224,20 +231,40 @@ def get_texture_grid(
             hit_box_algorithm:
                 Hit box algorithm to use for the textures.
                 If not provided, the default hit box algorithm will be used.
+            hash_by_position:
+                Make the hash of each texture from the hash of the sheet and
+                the position of the cell instead of hashing every cell. This
+                is faster for sheets with many cells, but cells with the same
+                pixels no longer share a texture or space in the atlas.
         """
         textures = []
         width, height = size
         left, right, bottom, top = margin
 
+        regions = []
         for sprite_no in range(count):
             row = sprite_no // columns
             column = sprite_no % columns
 
             x = (width + left + right) * column
             y = (height + top + bottom) * row
+            regions.append((x, y, width, height))
+
+        # Calculate the hit boxes of all cells in one pass over the sheet
+        hit_box_algorithm = hit_box_algorithm or hitbox.algo_default
+        hit_boxes = hit_box_algorithm.calculate_regions(self.image, regions)
+        # Optionally hash the sheet once and name each cell by its position in it
+        sheet_hash = ImageData.calculate_hash(self.image) if hash_by_position else None
+
+        for (x, y, width, height), hit_box_points in zip(regions, hit_boxes):
             im = self.image.crop((x, y, x + width, y + height))
+            hash = f"{sheet_hash}|{x},{y},{width},{height}" if sheet_hash else None
 
-            texture = Texture(im, hit_box_algorithm=hit_box_algorithm)
+            texture = Texture(
+                ImageData(im, hash=hash),
+                hit_box_algorithm=hit_box_algorithm,
+                hit_box_points=hit_box_points,
+            )
             texture.file_path = self._path
             texture.crop_values = x, y, width, height
             textures.append(texture)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+import weakref
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import PIL.Image
 import PIL.ImageDraw
@@ -36,6 +37,7 @@ class ImageData:
 
     If a hash is not provided, it will be calculated.
     By default, the hash is calculated using the sha256 algorithm.
+    See :py:meth:`calculate_hash` for faster alternatives.
 
     The ability to provide a hash directly is mainly there
     for ensuring we can load and save texture atlases to disk
@@ -52,6 +54,14 @@ class ImageData:
     __slots__ = ("image", "hash", "__weakref__")
     hash_func = "sha256"
 
+    # The largest width and height of the sample of an image with the "sampled" hash
+    _SAMPLE_SIZE = 128
+    # Every sample hash seen, with a weak reference to the first image having
+    # it and the full hash of that image once calculated. Entries are kept
+    # after the image is gone, so the sample hash alone is never reused for
+    # other pixels.
+    _sampled_hashes: ClassVar[dict[str, list]] = {}
+
     def __init__(self, image: PIL.Image.Image, hash: str | None = None, **kwargs):
         self.image = image
         """The pillow image"""
@@ -63,14 +73,83 @@ def calculate_hash(cls, image: PIL.Image.Image) -> str:
         """
         Calculates the hash of an image.
 
-        The algorithm used is defined by the ``hash_func`` class variable.
+        The algorithm used is defined by the ``hash_func`` class variable:
+
+        * Any algorithm in :py:mod:`hashlib` such as ``"sha256"`` (default),
+          ``"md5"`` or ``"blake2b"``. On CPUs with SHA instructions
+          ``"sha256"`` is usually the fastest of these.
+        * ``"xxh3_64"``, ``"xxh3_128"``, ``"xxh64"`` or ``"xxh32"`` from the
+          optional `xxhash <https://pypi.org/project/xxhash/>`_ package.
+          These are many times faster than the hashlib algorithms.
+        * ``"sampled"`` only hashes the size and an evenly spread sample of
+          the pixels, without copying the full pixel data. The full pixel
+          data is only hashed when two images have the same sample. This is
+          the fastest option. Within a program run a hash never stands for
+          two different images, but which of the images with the same sample
+          gets the shorter hash depends on the order they are loaded in.
+          These hashes should not be saved, and the persistent texture cache
+          is not used with them.
+
+        Example::
+
+            arcade.texture.ImageData.hash_func = "xxh3_128"
 
         Args:
             image: The Pillow image to calculate the hash for
         """
-        hash = hashlib.new(cls.hash_func)
-        hash.update(image.tobytes())
-        return hash.hexdigest()
+        if cls.hash_func == "sampled":
+            return cls._calculate_sampled_hash(image)
+        return cls._calculate_full_hash(cls.hash_func, image.tobytes())
+
+    @staticmethod
+    def _calculate_full_hash(hash_func: str, data: bytes) -> str:
+        """Hash all the data with a hashlib or xxhash algorithm."""
+        if hash_func.startswith("xxh"):
+            try:
+                import xxhash  # type: ignore[import-not-found]
+            except ImportError:
+                raise ImportError(
+                    f"The xxhash package is needed for the {hash_func!r} hash: pip install xxhash"
+                )
+            return getattr(xxhash, hash_func)(data).hexdigest()
+
+        return hashlib.new(hash_func, data).hexdigest()
+
+    @classmethod
+    def _calculate_sampled_hash(cls, image: PIL.Image.Image) -> str:
+        """
+        Hash the size and a sample of the pixels. The full data is only
+        hashed when another image had the same sample.
+        """
+        # Nearest neighbor scaling picks evenly spread rows and columns
+        # without copying the rest of the image
+        sample_size = min(image.width, cls._SAMPLE_SIZE), min(image.height, cls._SAMPLE_SIZE)
+        sample_image = image.resize(sample_size, PIL.Image.Resampling.NEAREST)
+        sample = hashlib.sha256(sample_image.tobytes()).hexdigest()[:32]
+        key = f"{image.mode}|{image.width}x{image.height}|{sample}"
+
+        entry = cls._sampled_hashes.get(key)
+        if entry is None:
+            new_entry: list = [None, None]
+
+            def _forget(ref: weakref.ref) -> None:
+                new_entry[0] = None
+
+            new_entry[0] = weakref.ref(image, _forget)
+            cls._sampled_hashes[key] = new_entry
+            return key
+
+        first_image = entry[0]() if entry[0] is not None else None
+        if first_image is image:
+            return key
+
+        # Another image had the same sample, so compare all the pixels.
+        # If the first image is gone before its full hash was needed, the
+        # key alone stays reserved for it.
+        if entry[1] is None and first_image is not None:
+            entry[1] = hashlib.sha256(first_image.tobytes()).hexdigest()
+        full = hashlib.sha256(image.tobytes()).hexdigest()
+        return key if full == entry[1] else f"{key}|{full}"
 
     @property
     def width(self) -> int:
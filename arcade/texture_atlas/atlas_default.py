@@ -8,6 +8,7 @@
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Iterable,
     Sequence,
 )
 from weakref import WeakSet, WeakValueDictionary, finalize
@@ -279,6 +280,47 @@ def add(self, texture: Texture) -> tuple[int, AtlasRegion]:
         """
         return self._add(texture)
 
+    def add_textures(self, textures: Iterable[Texture]) -> list[tuple[int, AtlasRegion]]:
+        """
+        Add several textures to the atlas.
+
+        The new images are written to the atlas texture together, using
+        one write for each row of the atlas they are placed in instead of
+        one write per image. This is a lot faster for many small textures
+        such as the cells of a sprite sheet.
+
+        Args:
+            textures: The textures to add
+        Returns:
+            A texture_id, AtlasRegion tuple for each texture
+        Raises:
+            AllocatorException: If there are no room for a texture
+        """
+        results = []
+        # Images with allocated space not yet written to the atlas texture
+        pending: list[tuple[int, int, PIL.Image.Image]] = []
+        for texture in textures:
+            if self.has_unique_texture(texture) or self.has_image(texture.image_data):
+                results.append(self._add(texture))
+                continue
+
+            try:
+                x, y, _, _ = self._allocate_image(texture.image_data)
+            except AllocatorException:
+                # Let add() resize or rebuild the atlas. All allocated
+                # images must be written before the atlas is moved around.
+                self._write_images(pending)
+                pending = []
+                results.append(self._add(texture))
+                continue
+
+            pending.append((x, y, texture.image_data.image))
+            self._add_texture_ref(texture)
+            results.append(self._allocate_texture(texture))
+
+        self._write_images(pending)
+        return results
+
     def _add(self, texture: Texture, create_finalizer=True) -> tuple[int, AtlasRegion]:
         """
         Internal add method with additional control. We we rebuild the atlas
@@ -483,6 +525,47 @@ def write_image(self, image: PIL.Image.Image, x: int, y: int) -> None:
             image.height + self._border * 2,
         )
 
+        # Write the image directly to graphics memory in the allocated space
+        self._texture.write(self._add_border(image).tobytes(), 0, viewport=viewport)
+
+    def _write_images(self, images: list[tuple[int, int, PIL.Image.Image]]) -> None:
+        """
+        Write several images to the atlas.
+
+        The allocator places images next to each other in horizontal strips.
+        Images allocated one after another in the same strip are combined
+        into a single write.
+
+        Args:
+            images: The x and y position of the allocated space and the image
+        """
+        border = self._border * 2
+        strips: dict[int, list[tuple[int, PIL.Image.Image]]] = {}
+        for x, y, image in images:
+            strips.setdefault(y, []).append((x, image))
+
+        for y, strip in strips.items():
+            start = min(x for x, _ in strip)
+            end = max(x + image.width + border for x, image in strip)
+            # Only combine the images if nothing else is between them
+            if len(strip) == 1 or sum(image.width + border for _, image in strip) != end - start:
+                for x, image in strip:
+                    self.write_image(image, x, y)
+                continue
+
+            height = max(image.height for _, image in strip) + border
+            tmp = Image.new("RGBA", size=(end - start, height), color=(0, 0, 0, 0))
+            for x, image in strip:
+                tmp.paste(self._add_border(image), (x - start, 0))
+            self._texture.write(tmp.tobytes(), 0, viewport=(start, y, end - start, height))
+
+    def _add_border(self, image: PIL.Image.Image) -> PIL.Image.Image:
+        """
+        Create a copy of an image with the edge pixels repeated in the border.
+
+        Args:
+            image: The pillow image
+        """
         # Only do extrusion if we have a border
         if self._border > 0:
             # Make new image with room for borders
@@ -516,8 +599,7 @@ def write_image(self, image: PIL.Image.Image, x: int, y: int) -> None:
         else:
             tmp = image
 
-        # Write the image directly to graphics memory in the allocated space
-        self._texture.write(tmp.tobytes(), 0, viewport=viewport)
+        return tmp
 
     def _remove_texture_by_identifiers(self, atlas_name: str, hash: str):
         """
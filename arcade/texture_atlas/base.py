@@ -28,7 +28,7 @@
 import abc
 import contextlib
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import PIL.Image
 
@@ -124,6 +124,22 @@ def add(self, texture: Texture) -> tuple[int, AtlasRegion]:
         """
         ...
 
+    def add_textures(self, textures: Iterable[Texture]) -> list[tuple[int, AtlasRegion]]:
+        """
+        Add several textures to the atlas.
+
+        Atlases can override this to add the textures more efficiently
+        than adding them one by one.
+
+        Args:
+            textures: The textures to add
+        Returns:
+            A texture_id, AtlasRegion tuple for each texture
+        Raises:
+            AllocatorException: If there are no room for a texture
+        """
+        return [self.add(texture) for texture in textures]
+
     @abc.abstractmethod
     def remove(self, texture: Texture) -> None:
         """
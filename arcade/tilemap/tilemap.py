@@ -776,6 +776,9 @@ def _process_tile_layer(
             # Can never be None because we already detect and reject infinite maps
             assert map_array
 
+        # Collect the sprites and add them to the list in bulk at the end
+        sprites: list[Sprite] = []
+
         # Loop through the layer and add in the list
         for row_index, row in enumerate(map_array):
             for column_index, item in enumerate(row):
@@ -826,11 +829,12 @@ def _process_tile_layer(
                         my_sprite.alpha = int(opacity * 255)
 
                     sprite_list.visible = layer.visible
-                    sprite_list.append(my_sprite)
+                    sprites.append(my_sprite)
 
                 if layer.properties:
                     sprite_list.properties = layer.properties
 
+        sprite_list.extend(sprites)
         return sprite_list
 
     def _process_object_layer(
@@ -0,0 +1,47 @@
+"""
+Checking every bullet against a list of enemies one by one
+vs a single check_for_collision_between_lists call.
+"""
+
+import random
+import timeit
+import arcade
+
+BULLET_COUNT = 1000
+ENEMY_COUNT = 200
+
+rng = random.Random(0)
+
+bullets = arcade.SpriteList()
+for _ in range(BULLET_COUNT):
+    bullet = arcade.SpriteSolidColor(4, 10)
+    bullet.position = rng.uniform(0, 1280), rng.uniform(0, 720)
+    bullets.append(bullet)
+
+enemies = arcade.SpriteList()
+enemies_hashed = arcade.SpriteList(use_spatial_hash=True)
+for _ in range(ENEMY_COUNT):
+    enemy = arcade.SpriteSolidColor(32, 32)
+    enemy.position = rng.uniform(0, 1280), rng.uniform(0, 720)
+    enemies.append(enemy)
+    enemies_hashed.append(enemy)
+
+
+def per_bullet():
+    for bullet in bullets:
+        arcade.check_for_collision_with_list(bullet, enemies)
+
+
+def per_bullet_spatial_hash():
+    for bullet in bullets:
+        arcade.check_for_collision_with_list(bullet, enemies_hashed)
+
+
+def between_lists():
+    arcade.check_for_collision_between_lists(bullets, enemies)
+
+
+print(f"{BULLET_COUNT} bullets vs {ENEMY_COUNT} enemies")
+print("per bullet          ", timeit.timeit(per_bullet, number=10) / 10)
+print("per bullet (hashed) ", timeit.timeit(per_bullet_spatial_hash, number=10) / 10)
+print("between lists       ", timeit.timeit(between_lists, number=10) / 10)
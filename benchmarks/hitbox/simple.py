@@ -0,0 +1,26 @@
+"""
+Time the simple hit box algorithm on single images and on a sprite sheet grid.
+
+Run with:
+    python benchmarks/hitbox/simple.py
+"""
+
+import timeit
+
+import arcade
+from arcade.hitbox import algo_simple
+
+image = arcade.load_image(
+    ":resources:images/animated_characters/female_person/femalePerson_idle.png"
+)
+count = 200
+result = timeit.timeit(lambda: algo_simple.calculate(image), number=count)
+print(f"calculate: {result / count * 1000:.3f} ms")
+
+sheet = arcade.load_spritesheet(":resources:images/spritesheets/codepage_437.png")
+count = 10
+result = timeit.timeit(
+    lambda: sheet.get_texture_grid(size=(8, 16), margin=(0, 1, 0, 0), columns=32, count=255),
+    number=count,
+)
+print(f"get_texture_grid (255 cells): {result / count * 1000:.1f} ms")
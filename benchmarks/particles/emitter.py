@@ -0,0 +1,54 @@
+"""
+Time updating and drawing an emitter keeping 10,000 particles alive,
+storing the particles as sprites and in a ParticleList.
+
+Run with:
+    python benchmarks/particles/emitter.py
+"""
+
+import random
+import timeit
+
+import arcade
+from arcade import particles
+
+PARTICLE_COUNT = 10_000
+
+window = arcade.Window(100, 100)
+random.seed(1)
+texture = arcade.make_soft_circle_texture(8, arcade.color.WHITE)
+
+
+def make_particle(emitter):
+    return particles.FadeParticle(
+        texture,
+        change_xy=arcade.math.rand_in_circle((0.0, 0.0), 2.0),
+        lifetime=random.uniform(0.5, 2.0),
+    )
+
+
+def make_emitter(particle_list=None):
+    emitter = particles.Emitter(
+        center_xy=(50, 50),
+        emit_controller=particles.EmitMaintainCount(PARTICLE_COUNT),
+        particle_factory=make_particle,
+        particle_list=particle_list,
+    )
+    # Fill up and reach a steady state
+    for _ in range(60):
+        emitter.update()
+    return emitter
+
+
+def frame(emitter):
+    emitter.update()
+    emitter.draw()
+
+
+count = 60
+for name, emitter in (
+    ("sprite_list", make_emitter()),
+    ("particle_list", make_emitter(particles.ParticleList())),
+):
+    result = timeit.timeit(lambda: frame(emitter), number=count)
+    print(f"{name}: {result / count * 1000:.1f} ms per frame")
@@ -0,0 +1,27 @@
+"""
+Compare A* searches on a large open grid with a maze-like wall.
+
+Run with:
+    python benchmarks/paths/astar.py
+"""
+
+import random
+import timeit
+
+from arcade.paths import _AStarGraph, _AStarSearch
+
+SIZE = 256
+random.seed(1)
+barriers = {(random.randrange(SIZE), random.randrange(SIZE)) for _ in range(SIZE * SIZE // 5)}
+# A wall with a single gap, forcing long detours
+barriers.update((SIZE // 2, y) for y in range(SIZE - 4))
+barriers.discard((0, 0))
+barriers.discard((SIZE - 1, 0))
+
+graph = _AStarGraph(barriers, 0, SIZE - 1, 0, SIZE - 1, diagonal_movement=True)
+path = _AStarSearch((0, 0), (SIZE - 1, 0), graph)
+print(f"Path length: {len(path) if path else None}")
+
+count = 10
+result = timeit.timeit(lambda: _AStarSearch((0, 0), (SIZE - 1, 0), graph), number=count)
+print(f"{SIZE}x{SIZE} search: {result / count * 1000:.1f} ms")
@@ -0,0 +1,37 @@
+"""
+Time building an AStarBarrierList for a 200x200 grid and updating a
+small region of it.
+
+Run with:
+    python benchmarks/paths/barrier_list.py
+"""
+
+import random
+import timeit
+
+import arcade
+
+GRID_SIZE = 32
+CELLS = 200
+
+window = arcade.Window(100, 100)
+random.seed(1)
+mover = arcade.SpriteSolidColor(28, 28)
+walls = arcade.SpriteList(use_spatial_hash=True)
+for _ in range(CELLS * CELLS // 10):
+    wall = arcade.SpriteSolidColor(GRID_SIZE, GRID_SIZE)
+    wall.position = random.randrange(CELLS) * GRID_SIZE, random.randrange(CELLS) * GRID_SIZE
+    walls.append(wall)
+
+size = CELLS * GRID_SIZE
+barrier_list = arcade.AStarBarrierList(mover, walls, GRID_SIZE, 0, size, 0, size)
+
+count = 3
+result = timeit.timeit(barrier_list.recalculate, number=count)
+print(f"recalculate: {result / count * 1000:.1f} ms")
+
+door = walls[0]
+area = arcade.LRBT(door.left, door.right, door.bottom, door.top)
+count = 1000
+result = timeit.timeit(lambda: barrier_list.update_region(area), number=count)
+print(f"update_region: {result / count * 1000:.3f} ms")
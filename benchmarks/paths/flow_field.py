@@ -0,0 +1,40 @@
+"""
+Compare building a flow field with moving its goal a few grid locations.
+
+Run with:
+    python benchmarks/paths/flow_field.py
+"""
+
+import random
+import timeit
+
+import arcade
+
+GRID_SIZE = 16
+CELLS = 256
+
+window = arcade.Window(100, 100)
+random.seed(1)
+mover = arcade.SpriteSolidColor(12, 12)
+walls = arcade.SpriteList(use_spatial_hash=True)
+for _ in range(CELLS * CELLS // 10):
+    wall = arcade.SpriteSolidColor(GRID_SIZE, GRID_SIZE)
+    wall.position = random.randrange(CELLS) * GRID_SIZE, random.randrange(CELLS) * GRID_SIZE
+    walls.append(wall)
+
+size = (CELLS - 1) * GRID_SIZE
+barrier_list = arcade.AStarBarrierList(mover, walls, GRID_SIZE, 0, size, 0, size)
+goal = (size // 2, size // 2)
+flow_field = arcade.FlowField(barrier_list, goal)
+
+count = 5
+result = timeit.timeit(flow_field.recalculate, number=count)
+print(f"recalculate: {result / count * 1000:.1f} ms")
+
+goals = [(goal[0] + GRID_SIZE * dx, goal[1]) for dx in (2, 0) * 5]
+result = timeit.timeit(lambda: flow_field.set_goal(goals.pop()), number=len(goals))
+print(f"set_goal 2 locations away: {result / count * 1000 / 2:.1f} ms")
+
+positions = [(random.randrange(size), random.randrange(size)) for _ in range(1000)]
+result = timeit.timeit(lambda: [flow_field.get_next_step(p) for p in positions], number=10)
+print(f"get_next_step: {result / 10 / len(positions) * 1_000_000:.2f} us")
@@ -0,0 +1,34 @@
+"""
+Time line of sight checks across a map with scattered walls.
+
+Run with:
+    python benchmarks/paths/line_of_sight.py
+"""
+
+import random
+import timeit
+
+import arcade
+
+window = arcade.Window(100, 100)
+random.seed(1)
+walls = arcade.SpriteList(use_spatial_hash=True)
+for _ in range(500):
+    wall = arcade.SpriteSolidColor(32, 32)
+    wall.position = random.randrange(0, 3200, 32), random.randrange(0, 3200, 32)
+    walls.append(wall)
+
+observers = [(random.uniform(0, 3200), random.uniform(0, 3200)) for _ in range(100)]
+targets = [(random.uniform(0, 3200), random.uniform(0, 3200)) for _ in range(10)]
+
+result = timeit.timeit(
+    lambda: [arcade.has_line_of_sight(o, t, walls, 1000) for o in observers for t in targets],
+    number=1,
+)
+print(f"has_line_of_sight: {result * 1000:.1f} ms for {len(observers) * len(targets)} checks")
+
+result = timeit.timeit(
+    lambda: arcade.has_line_of_sight_many(observers, targets, walls, 1000),
+    number=1,
+)
+print(f"has_line_of_sight_many: {result * 1000:.1f} ms for {len(observers) * len(targets)} checks")
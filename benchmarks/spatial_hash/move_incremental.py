@@ -0,0 +1,68 @@
+"""
+Incremental spatial hash move vs removing and re-adding the sprite.
+
+Most moves in a game are small and keep the sprite inside the
+same cells. The incremental move skips those entirely and only
+updates the cells at the edges when the covered range changes.
+"""
+
+import timeit
+import arcade
+from arcade import SpatialHash
+
+CELL_SIZE = 64
+
+sprites = []
+for y in range(50):
+    for x in range(50):
+        sprite = arcade.SpriteSolidColor(10, 10, center_x=x * 20, center_y=y * 20)
+        sprites.append(sprite)
+
+sh = SpatialHash(CELL_SIZE)
+for sprite in sprites:
+    sh.add(sprite)
+
+
+def step(dx):
+    # Move the sprites without touching the spatial hash.
+    # The hit box is refreshed here so it's not part of the measurement.
+    for sprite in sprites:
+        sprite._position = sprite._position[0] + dx, sprite._position[1]
+        sprite._hit_box.position = sprite._position
+        sprite._hit_box.get_adjusted_points()
+
+
+def remove_add(dx=1.0):
+    step(dx)
+    for sprite in sprites:
+        sh.remove(sprite)
+        sh.add(sprite)
+    step(-dx)
+    for sprite in sprites:
+        sh.remove(sprite)
+        sh.add(sprite)
+
+
+def move(dx=1.0):
+    step(dx)
+    for sprite in sprites:
+        sh.move(sprite)
+    step(-dx)
+    for sprite in sprites:
+        sh.move(sprite)
+
+
+def only_step(dx=1.0):
+    step(dx)
+    step(-dx)
+
+
+for dx in (1.0, 20.0, 100.0):
+    print(f"Moving {len(sprites)} sprites by {dx} pixels (cell size {CELL_SIZE})")
+    # Subtract the time spent moving the sprites themselves
+    res_0 = timeit.timeit(lambda: only_step(dx), number=100)
+    res_1 = timeit.timeit(lambda: remove_add(dx), number=100) - res_0
+    print("  remove/add", res_1)
+    res_2 = timeit.timeit(lambda: move(dx), number=100) - res_0
+    print("  move      ", res_2)
+    print("  ratio     ", res_1 / res_2)
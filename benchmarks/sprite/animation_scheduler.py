@@ -0,0 +1,44 @@
+"""
+Compare animating 20,000 tiles with SpriteList.update_animation and a TextureAnimationScheduler.
+
+Every tile has four keyframes of 250 ms, so at 60 fps a tile changes
+texture about every 15th update.
+
+Run with:
+    python benchmarks/sprite/animation_scheduler.py
+"""
+
+import timeit
+
+import arcade
+
+TILE_COUNT = 20_000
+
+window = arcade.Window(100, 100)
+keyframes = [
+    arcade.TextureKeyframe(arcade.make_soft_square_texture(8, color), duration=250)
+    for color in (arcade.color.BLUE, arcade.color.AQUA, arcade.color.TEAL, arcade.color.NAVY_BLUE)
+]
+animation = arcade.TextureAnimation(keyframes)
+
+
+def build() -> arcade.SpriteList:
+    sprite_list = arcade.SpriteList(capacity=TILE_COUNT)
+    for i in range(TILE_COUNT):
+        sprite = arcade.TextureAnimationSprite(i % 200, i // 200, animation=animation)
+        # Spread the tiles over the animation
+        sprite.time = (i % 97) / 97
+        sprite_list.append(sprite)
+    return sprite_list
+
+
+count = 120
+
+sprite_list = build()
+result = timeit.timeit(lambda: sprite_list.update_animation(1 / 60), number=count)
+print(f"SpriteList.update_animation: {result / count * 1000:.2f} ms")
+
+sprite_list = build()
+scheduler = arcade.TextureAnimationScheduler(sprite_list)
+result = timeit.timeit(lambda: scheduler.update_animation(1 / 60), number=count)
+print(f"TextureAnimationScheduler.update_animation: {result / count * 1000:.2f} ms")
@@ -0,0 +1,41 @@
+"""
+Time drawing a 400x400 tile map where only a small part is on screen,
+with and without chunked culling.
+
+Run with:
+    python benchmarks/sprite_list/chunked_culling.py
+"""
+
+import timeit
+
+import arcade
+
+TILES = 400
+TILE_SIZE = 32
+
+window = arcade.Window(800, 600)
+texture = arcade.make_soft_square_texture(TILE_SIZE, arcade.color.WHITE)
+positions = [
+    (x * TILE_SIZE + TILE_SIZE / 2, y * TILE_SIZE + TILE_SIZE / 2)
+    for x in range(TILES)
+    for y in range(TILES)
+]
+tiles = arcade.SpriteList.from_arrays(texture, positions)
+camera = arcade.Camera2D(position=(TILES * TILE_SIZE / 2, TILES * TILE_SIZE / 2))
+
+
+def draw():
+    with camera.activate():
+        tiles.draw()
+    window.ctx.finish()
+
+
+count = 20
+draw()
+result = timeit.timeit(draw, number=count)
+print(f"all sprites: {result / count * 1000:.1f} ms")
+
+tiles.enable_chunked_culling(512)
+draw()
+result = timeit.timeit(draw, number=count)
+print(f"chunked culling: {result / count * 1000:.1f} ms")
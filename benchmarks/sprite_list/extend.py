@@ -0,0 +1,51 @@
+"""
+Time adding 50,000 sprites to a sprite list with a spatial hash,
+and creating the same sprites from a list of positions.
+
+Run with:
+    python benchmarks/sprite_list/extend.py
+"""
+
+import timeit
+
+import arcade
+
+SPRITE_COUNT = 50_000
+
+window = arcade.Window(100, 100)
+texture = arcade.make_soft_square_texture(8, arcade.color.WHITE)
+positions = [(i % 250 * 16, i // 250 * 16) for i in range(SPRITE_COUNT)]
+sprites = [arcade.Sprite(texture, center_x=x, center_y=y) for x, y in positions]
+
+
+def append():
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    for sprite in sprites:
+        sprite_list.append(sprite)
+    sprite_list.draw()
+    sprite_list.clear()
+
+
+def extend():
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    sprite_list.extend(sprites)
+    sprite_list.draw()
+    sprite_list.clear()
+
+
+def create_and_append():
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    for x, y in positions:
+        sprite_list.append(arcade.Sprite(texture, center_x=x, center_y=y))
+    sprite_list.draw()
+
+
+def from_arrays():
+    sprite_list = arcade.SpriteList.from_arrays(texture, positions, use_spatial_hash=True)
+    sprite_list.draw()
+
+
+count = 5
+for func in (append, extend, create_and_append, from_arrays):
+    result = timeit.timeit(func, number=count)
+    print(f"{func.__name__}: {result / count * 1000:.1f} ms")
@@ -0,0 +1,43 @@
+"""
+Time removing 2,000 sprites from a list of 20,000 sprites and drawing it.
+
+Run with:
+    python benchmarks/sprite_list/remove.py
+"""
+
+import random
+import timeit
+
+import arcade
+
+SPRITE_COUNT = 20_000
+REMOVE_COUNT = 2_000
+
+window = arcade.Window(100, 100)
+random.seed(1)
+texture = arcade.make_soft_square_texture(8, arcade.color.WHITE)
+
+
+def setup():
+    global sprite_list, to_remove
+    sprite_list = arcade.SpriteList(capacity=SPRITE_COUNT)
+    sprite_list.extend(arcade.Sprite(texture) for _ in range(SPRITE_COUNT))
+    sprite_list.draw()
+    to_remove = random.sample(sprite_list.sprite_list, REMOVE_COUNT)
+
+
+def remove():
+    for sprite in to_remove:
+        sprite.remove_from_sprite_lists()
+    sprite_list.draw()
+
+
+def remove_many():
+    sprite_list.remove_many(to_remove)
+    sprite_list.draw()
+
+
+count = 5
+for func in (remove, remove_many):
+    total = sum(timeit.repeat(func, setup=setup, number=1, repeat=count))
+    print(f"{func.__name__}: {total / count * 1000:.1f} ms")
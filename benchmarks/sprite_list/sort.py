@@ -0,0 +1,49 @@
+"""
+Time keeping 10,000 moving sprites y-sorted with SpriteList.sort and sort_key.
+
+Run with:
+    python benchmarks/sprite_list/sort.py
+"""
+
+import random
+import timeit
+
+import arcade
+
+SPRITE_COUNT = 10_000
+
+window = arcade.Window(100, 100)
+random.seed(1)
+texture = arcade.make_soft_square_texture(8, arcade.color.WHITE)
+
+
+def make_list(**kwargs) -> arcade.SpriteList:
+    sprite_list = arcade.SpriteList(**kwargs)
+    for _ in range(SPRITE_COUNT):
+        sprite = arcade.Sprite(texture)
+        sprite.position = random.random() * 1000, random.random() * 1000
+        sprite.velocity = random.random() - 0.5, random.random() - 0.5
+        sprite_list.append(sprite)
+    sprite_list.write_sprite_buffers_to_gpu()
+    return sprite_list
+
+
+manual_list = make_list()
+sorted_list = make_list(sort_key="y")
+
+
+def manual_sort():
+    manual_list.update()
+    manual_list.sort(key=lambda sprite: -sprite.center_y)
+    manual_list.write_sprite_buffers_to_gpu()
+
+
+def sort_key():
+    sorted_list.update()
+    sorted_list.write_sprite_buffers_to_gpu()
+
+
+count = 20
+for name, func in (("sort", manual_sort), ("sort_key", sort_key)):
+    result = timeit.timeit(func, number=count)
+    print(f"{name}: {result / count * 1000:.1f} ms")
@@ -0,0 +1,53 @@
+"""
+Compare building and moving 100,000 static sprites in a SpriteList and a SpriteStore.
+
+Run with:
+    python benchmarks/sprite_list/sprite_store.py
+"""
+
+import timeit
+import tracemalloc
+
+import arcade
+
+SPRITE_COUNT = 100_000
+
+window = arcade.Window(100, 100)
+texture = arcade.make_soft_square_texture(8, arcade.color.WHITE)
+
+
+def build_sprite_list() -> arcade.SpriteList:
+    sprite_list = arcade.SpriteList(capacity=SPRITE_COUNT)
+    sprite_list.extend(
+        arcade.Sprite(texture, center_x=i % 1000, center_y=i // 1000)
+        for i in range(SPRITE_COUNT)
+    )
+    return sprite_list
+
+
+def build_sprite_store() -> arcade.SpriteStore:
+    store = arcade.SpriteStore(capacity=SPRITE_COUNT)
+    for i in range(SPRITE_COUNT):
+        store.add(texture, i % 1000, i // 1000)
+    return store
+
+
+def move(sprites) -> None:
+    for sprite in sprites:
+        sprite.center_x += 1
+
+
+for name, build in (("SpriteList", build_sprite_list), ("SpriteStore", build_sprite_store)):
+    tracemalloc.start()
+    sprites = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{name} memory: {memory / 1024 / 1024:.1f} MiB")
+
+    result = timeit.timeit(build, number=1)
+    print(f"{name} build: {result * 1000:.1f} ms")
+
+    views = list(sprites)
+    count = 5
+    result = timeit.timeit(lambda: move(views), number=count)
+    print(f"{name} move: {result / count * 1000:.1f} ms")
@@ -0,0 +1,42 @@
+"""
+Time moving 10,000 sprites with SpriteList.update, SpriteList.move
+and SpriteStore.update, and the sprite list methods with velocity columns.
+Syncing the sprites after the column updates is timed separately.
+
+Run with:
+    python benchmarks/sprite_list/update.py
+"""
+
+import random
+import timeit
+
+import arcade
+
+SPRITE_COUNT = 10_000
+
+random.seed(1)
+texture = arcade.make_soft_square_texture(8, arcade.color.WHITE)
+sprite_list = arcade.SpriteList()
+column_list = arcade.SpriteList()
+column_list.enable_velocity_columns()
+store = arcade.SpriteStore()
+for _ in range(SPRITE_COUNT):
+    sprite = arcade.Sprite(texture)
+    sprite.position = random.random() * 1000, random.random() * 1000
+    sprite.velocity = random.random(), random.random()
+    sprite.change_angle = 1.0
+    sprite_list.append(sprite)
+    column_list.append(sprite)
+    store.add_sprite(sprite)
+
+count = 20
+for name, func in (
+    ("SpriteList.update", sprite_list.update),
+    ("SpriteList.move", lambda: sprite_list.move(1.0, 1.0)),
+    ("SpriteStore.update", store.update),
+    ("SpriteList.update with columns", column_list.update),
+    ("SpriteList.move with columns", lambda: column_list.move(1.0, 1.0)),
+    ("SpriteList.sync_sprites", lambda: (column_list.move(1.0, 1.0), column_list.sync_sprites())),
+):
+    result = timeit.timeit(func, number=count)
+    print(f"{name}: {result / count * 1000:.1f} ms")
@@ -0,0 +1,58 @@
+"""
+Compare the ImageData hash functions on the images in the bundled resources.
+
+Two things are timed for every hash function:
+
+* hashing: every image is decoded once up front, so only the hashing is timed
+* loading: decoding every file and creating its ImageData, like loading textures
+
+The xxhash functions are skipped if the package is not installed.
+
+Run with:
+    ARCADE_HEADLESS=1 python benchmarks/texture/hashing.py
+"""
+
+import timeit
+
+import PIL.Image
+
+import arcade
+from arcade.texture import ImageData
+
+HASH_FUNCS = ["sha256", "md5", "blake2b", "xxh3_64", "xxh3_128", "sampled"]
+REPEAT = 3
+
+paths = sorted(arcade.resources.resolve(":resources:images").glob("**/*.png"))
+images = [PIL.Image.open(path).convert("RGBA") for path in paths]
+size = sum(image.width * image.height * 4 for image in images)
+print(f"{len(images)} images, {size / 1024 / 1024:.1f} MiB of pixels")
+
+
+def hash_all():
+    for image in images:
+        ImageData.calculate_hash(image)
+
+
+def load_all():
+    for path in paths:
+        ImageData(PIL.Image.open(path).convert("RGBA"))
+
+
+def best_time(func) -> float:
+    """The best time of a few runs, starting each with no sampled hashes"""
+    results = []
+    for _ in range(REPEAT):
+        ImageData._sampled_hashes.clear()
+        results.append(timeit.timeit(func, number=1))
+    return min(results)
+
+
+for hash_func in HASH_FUNCS:
+    ImageData.hash_func = hash_func
+    try:
+        hash_time = best_time(hash_all)
+    except ImportError:
+        print(f"{hash_func}: skipped, xxhash is not installed")
+        continue
+    load_time = best_time(load_all)
+    print(f"{hash_func}: hashing {hash_time * 1000:.1f} ms, loading {load_time * 1000:.1f} ms")
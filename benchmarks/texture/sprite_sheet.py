@@ -0,0 +1,72 @@
+"""
+Time slicing a 4,096 cell sprite sheet and adding the cells to an atlas.
+
+The sheet is built by tiling the bundled 256 cell codepage sheet 16 times,
+so most cells have the same pixels as 15 others. Slicing is timed with
+cells hashed by content (the default) and by position. Adding the
+textures one by one writes each cell to the atlas separately, while
+add_textures writes one row of the atlas at a time.
+
+The atlas part needs a window and is skipped if one can't be created.
+
+Run with:
+    python benchmarks/texture/sprite_sheet.py
+"""
+
+import timeit
+
+import PIL.Image
+
+import arcade
+
+codepage = arcade.load_spritesheet(":resources:images/spritesheets/codepage_437.png").image
+image = PIL.Image.new("RGBA", (codepage.width * 4, codepage.height * 4))
+for i in range(16):
+    image.paste(codepage, ((i % 4) * codepage.width, (i // 4) * codepage.height))
+sheet = arcade.SpriteSheet(image=image)
+
+
+def get_textures(hash_by_position: bool = False) -> list[arcade.Texture]:
+    return sheet.get_texture_grid(
+        size=(8, 16),
+        columns=128,
+        count=4096,
+        margin=(0, 1, 0, 0),
+        hash_by_position=hash_by_position,
+    )
+
+
+results = {}
+for hash_by_position in (False, True):
+    name = "by position" if hash_by_position else "by content"
+    result = min(timeit.repeat(lambda: get_textures(hash_by_position), number=1, repeat=3))
+    textures = get_textures(hash_by_position)
+    unique = len({texture.image_data.hash for texture in textures})
+    results[hash_by_position] = textures
+    print(f"get_texture_grid {name}: {result * 1000:.1f} ms, {unique} unique images")
+
+try:
+    window = arcade.Window(100, 100)
+except Exception as e:
+    print(f"Skipping the atlas benchmark, no window: {e}")
+    raise SystemExit
+
+
+def add_one_by_one(textures):
+    atlas = arcade.DefaultTextureAtlas((2048, 2048))
+    for texture in textures:
+        atlas.add(texture)
+    window.ctx.finish()
+
+
+def add_textures(textures):
+    atlas = arcade.DefaultTextureAtlas((2048, 2048))
+    atlas.add_textures(textures)
+    window.ctx.finish()
+
+
+for hash_by_position, textures in results.items():
+    hashing = "by position" if hash_by_position else "by content"
+    for name, func in (("add", add_one_by_one), ("add_textures", add_textures)):
+        result = timeit.timeit(lambda: func(textures), number=1)
+        print(f"{name} {hashing}: {result * 1000:.1f} ms")
@@ -141,3 +141,39 @@ def buf_check(atlas):
     buf_check(atlas)
     atlas.rebuild()
     buf_check(atlas)
+
+
+@pytest.mark.parametrize("border", [0, 1, 2])
+def test_add_textures(ctx, common, border):
+    """Add many textures at once and check the pixels in the atlas"""
+    sheet = arcade.load_spritesheet(":resources:images/spritesheets/codepage_437.png")
+    textures = sheet.get_texture_grid(
+        size=(8, 16), columns=32, count=96, margin=(0, 1, 0, 0), hash_by_position=True
+    )
+    # Start with one texture already in the atlas
+    tex_a = load_texture(":resources:onscreen_controls/shaded_dark/a.png")
+    atlas = DefaultTextureAtlas((256, 256), border=border)
+    atlas.add(tex_a)
+
+    results = atlas.add_textures(textures + [tex_a])
+    assert len(results) == 97
+    assert results[-1] == atlas.add(tex_a)
+    common.check_internals(atlas, images=97, textures=97, unique_textures=97)
+    for texture in textures[::7] + [tex_a]:
+        image = atlas.read_texture_image_from_atlas(texture)
+        assert image.tobytes() == texture.image.tobytes()
+
+
+def test_add_textures_resize(ctx, common):
+    """The atlas is resized when it gets full while adding textures"""
+    sheet = arcade.load_spritesheet(":resources:images/spritesheets/codepage_437.png")
+    textures = sheet.get_texture_grid(
+        size=(8, 16), columns=32, count=64, margin=(0, 1, 0, 0), hash_by_position=True
+    )
+    atlas = DefaultTextureAtlas((64, 64))
+    atlas.add_textures(textures)
+    assert atlas.size > (64, 64)
+    common.check_internals(atlas, images=64, textures=64, unique_textures=64)
+    for texture in textures[::5]:
+        image = atlas.read_texture_image_from_atlas(texture)
+        assert image.tobytes() == texture.image.tobytes()
@@ -0,0 +1,85 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from arcade.cache import TextureDiskCache
+
+
+@pytest.fixture(scope="function")
+def cache(tmp_path):
+    """Create a new cache for each test"""
+    cache = TextureDiskCache(tmp_path / "cache")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture(scope="function")
+def image_file(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"not really an image")
+    return path
+
+
+def test_create(cache, tmp_path):
+    assert len(cache) == 0
+    assert cache.path == tmp_path / "cache"
+    assert (tmp_path / "cache" / TextureDiskCache.FILE_NAME).exists()
+
+
+def test_image_info(cache, image_file):
+    assert cache.get_image_info(image_file, "sha256") is None
+    cache.put_image_info(image_file, "sha256", "abc", 16, 32)
+    assert cache.get_image_info(image_file, "sha256") == ("abc", 16, 32)
+    assert len(cache) == 1
+    # Hashes made with another function are not used
+    assert cache.get_image_info(image_file, "md5") is None
+
+    # Changed files are not used
+    stat = os.stat(image_file)
+    os.utime(image_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get_image_info(image_file, "sha256") is None
+
+
+def test_image_info_stat(cache, image_file):
+    """The file is identified by the stat from before it was read"""
+    stat = os.stat(image_file)
+    os.utime(image_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.put_image_info(image_file, "sha256", "abc", 16, 32, stat)
+    assert cache.get_image_info(image_file, "sha256") is None
+    assert cache.get_image_info(image_file, "sha256", stat) == ("abc", 16, 32)
+
+
+def test_hit_box(cache):
+    assert cache.get_hit_box("a|simple") is None
+    cache.put_hit_box("a|simple", ((0, 0), (1, 0), (0.5, 1)))
+    assert cache.get_hit_box("a|simple") == ((0.0, 0.0), (1.0, 0.0), (0.5, 1.0))
+
+
+def test_persistent(cache, image_file, tmp_path):
+    cache.put_image_info(image_file, "sha256", "abc", 16, 32)
+    cache.put_hit_box("a|simple", ((0, 0), (1, 0), (0.5, 1)))
+    cache.close()
+
+    cache = TextureDiskCache(tmp_path / "cache")
+    assert cache.get_image_info(image_file, "sha256") == ("abc", 16, 32)
+    assert cache.get_hit_box("a|simple") == ((0.0, 0.0), (1.0, 0.0), (0.5, 1.0))
+
+    cache.flush()
+    assert len(cache) == 0
+    assert cache.get_hit_box("a|simple") is None
+    cache.close()
+
+
+def test_threads(cache, image_file):
+    """The cache can be used from other threads than the one creating it"""
+
+    def put_and_get(i):
+        cache.put_hit_box(f"{i}|simple", ((0, 0), (i, 0), (0, i)))
+        cache.put_image_info(image_file, "sha256", "abc", 16, 32)
+        return cache.get_hit_box(f"{i}|simple")
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(put_and_get, range(20)))
+    assert results == [((0.0, 0.0), (float(i), 0.0), (0.0, float(i))) for i in range(20)]
+    assert cache.get_image_info(image_file, "sha256") == ("abc", 16, 32)
@@ -181,3 +181,21 @@ def test_camera_corner_properties(window: Window, angle: float):
     corner = camera.bottom_center
     assert corner.x == pytest.approx(-up.x)
     assert corner.y == pytest.approx(-up.y)
+
+
+@pytest.mark.parametrize('angle', ROTATIONS)
+@pytest.mark.parametrize('zoom', (0.5, 1.0, 2.0))
+def test_camera_aabb_contains_view(window: Window, angle: float, zoom: float):
+    camera = Camera2D(position=(100.0, 50.0))
+    camera.angle = angle
+    camera.zoom = zoom
+    aabb = camera.aabb()
+
+    corners = [
+        camera.unproject(point)
+        for point in ((0, 0), (window.width, 0), (0, window.height), (window.width, window.height))
+    ]
+    assert aabb.left == pytest.approx(min(corner.x for corner in corners))
+    assert aabb.right == pytest.approx(max(corner.x for corner in corners))
+    assert aabb.bottom == pytest.approx(min(corner.y for corner in corners))
+    assert aabb.top == pytest.approx(max(corner.y for corner in corners))
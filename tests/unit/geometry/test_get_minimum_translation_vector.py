@@ -0,0 +1,33 @@
+import pytest
+
+from arcade.geometry import are_polygons_intersecting, get_minimum_translation_vector
+
+
+def test_not_intersecting():
+    poly_a = [(0, 0), (0, 50), (50, 50), (50, 0)]
+    poly_b = [(50, 0), (50, 50), (100, 50), (100, 0)]
+    assert get_minimum_translation_vector(poly_a, poly_b) is None
+    assert get_minimum_translation_vector(poly_a, []) is None
+    assert get_minimum_translation_vector([], poly_b) is None
+
+
+def test_boxes():
+    """The shortest way out of an overlapping box"""
+    poly_a = [(0, 0), (0, 50), (50, 50), (50, 0)]
+    poly_b = [(40, 10), (40, 60), (90, 60), (90, 10)]
+    assert get_minimum_translation_vector(poly_a, poly_b) == pytest.approx((-10, 0))
+    assert get_minimum_translation_vector(poly_b, poly_a) == pytest.approx((10, 0))
+
+    poly_b = [(10, 45), (10, 95), (60, 95), (60, 45)]
+    assert get_minimum_translation_vector(poly_a, poly_b) == pytest.approx((0, -5))
+
+
+def test_rotated():
+    """A diamond overlapping the corner of a box is pushed out diagonally"""
+    diamond = [(50, 40), (60, 50), (50, 60), (40, 50)]
+    box = [(0, 0), (0, 50), (50, 50), (50, 0)]
+    mtv = get_minimum_translation_vector(diamond, box)
+    assert mtv == pytest.approx((5, 5))
+
+    moved = [(x + mtv[0], y + mtv[1]) for x, y in diamond]
+    assert not are_polygons_intersecting(moved, box)
@@ -50,3 +50,19 @@ def test_create_rotatable():
     rot_p = rot.get_adjusted_points()
     for i, (a, b) in enumerate(zip(rot_90, rot_p)):
         assert a == pytest.approx(b, abs = 1e-6), f"[{i}] {a} != {b}"
+
+
+def test_is_axis_aligned():
+    assert hitbox.HitBox(points).is_axis_aligned is True
+    # Not a box
+    assert hitbox.HitBox([(0.0, 0.0), (10.0, 0.0), (5.0, 10.0)]).is_axis_aligned is False
+    assert hitbox.HitBox([(0.0, 0.0), (10.0, 0.0), (12.0, 10.0), (0.0, 10.0)]).is_axis_aligned is False
+    # Empty box
+    assert hitbox.HitBox([(0.0, 0.0), (0.0, 0.0), (0.0, 10.0), (0.0, 10.0)]).is_axis_aligned is False
+
+    hb = hitbox.HitBox(points).create_rotatable()
+    assert hb.is_axis_aligned is True
+    hb.angle = 45
+    assert hb.is_axis_aligned is False
+    hb.angle = 0
+    assert hb.is_axis_aligned is True
@@ -43,3 +43,24 @@ def test_texture_cache_name():
 def test_call_override():
     assert hitbox.algo_detailed.detail == 4.5
     assert hitbox.algo_detailed(detail=10.0).detail == 10.0
+
+
+def test_calculate_regions_simple():
+    image = Image.new("RGBA", (20, 10), (0, 0, 0, 0))
+    # A filled square in the left region and a diagonal line in the right one
+    image.paste((255, 255, 255, 255), (2, 2, 8, 8))
+    for i in range(10):
+        image.putpixel((10 + i, i), (255, 255, 255, 255))
+    regions = [(0, 0, 10, 10), (10, 0, 10, 10)]
+
+    points = hitbox.algo_simple.calculate_regions(image, regions)
+    assert points == [
+        hitbox.algo_simple.calculate(image.crop((x, y, x + w, y + h)))
+        for x, y, w, h in regions
+    ]
+    assert points[0] == ((-3.0, -3.0), (3.0, -3.0), (3.0, 3.0), (-3.0, 3.0))
+
+    # The default implementation crops each region
+    assert hitbox.algo_bounding_box.calculate_regions(image, regions) == [
+        hitbox.algo_bounding_box.calculate(image.crop((0, 0, 10, 10)))
+    ] * 2
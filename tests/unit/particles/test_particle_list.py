@@ -0,0 +1,123 @@
+import math
+
+import pytest
+
+import arcade
+from arcade import particles
+
+TEXTURE = arcade.make_soft_square_texture(8, arcade.color.WHITE)
+
+
+def make_fade_particle(i: int) -> particles.FadeParticle:
+    return particles.FadeParticle(
+        TEXTURE,
+        change_xy=(i * 0.5, -i),
+        lifetime=0.05 + i * 0.01,
+        center_xy=(i, 2 * i),
+        angle=i,
+        change_angle=1.5,
+        scale=2.0,
+        start_alpha=200,
+        end_alpha=20,
+    )
+
+
+def test_matches_sprite_particles():
+    """Updating the columns should give the same result as updating the sprites"""
+    sprite_particles = arcade.SpriteList()
+    particle_list = particles.ParticleList()
+    for i in range(10):
+        sprite_particles.append(make_fade_particle(i))
+        particle_list.add_particle(make_fade_particle(i))
+
+    for _ in range(8):
+        sprite_particles.update(1 / 60)
+        for particle in [p for p in sprite_particles if p.can_reap()]:
+            particle.kill()
+        particle_list.update(1 / 60)
+
+        assert len(particle_list) == len(sprite_particles)
+        assert particle_list.positions == pytest.approx(
+            [particle.position for particle in sprite_particles]
+        )
+        assert particle_list.alphas == [particle.alpha for particle in sprite_particles]
+        assert particle_list._angle == pytest.approx(
+            [particle.angle for particle in sprite_particles]
+        )
+
+    assert len(particle_list) < 10
+
+
+def test_add():
+    particle_list = particles.ParticleList()
+    particle_list.add(TEXTURE, (10, 20), (1, 2), scale=2.0, color=(255, 0, 0))
+    particle_list.add(TEXTURE, (0, 0), lifetime=1.0, start_alpha=255, end_alpha=0)
+    assert len(particle_list) == 2
+    assert particle_list._width == [16, 8]
+
+    particle_list.update(0.5)
+    assert particle_list.positions == [(40, 80), (0, 0)]
+    assert particle_list.alphas == [255, 127]
+    assert particle_list._lifetime_original[0] == math.inf
+
+    # The second particle expires, the first lives forever
+    particle_list.update(0.5)
+    assert len(particle_list) == 1
+    assert particle_list.positions == [(70, 140)]
+
+    particle_list.clear()
+    assert len(particle_list) == 0
+
+
+def test_mutation_callback_not_supported():
+    particle = particles.EternalParticle(TEXTURE, (0, 0), mutation_callback=lambda p: None)
+    with pytest.raises(ValueError):
+        particles.ParticleList().add_particle(particle)
+
+
+def test_overridden_methods_not_supported():
+    class SpinningParticle(particles.EternalParticle):
+        def update(self, delta_time: float = 1 / 60):
+            self.angle += 10
+
+    class ShortParticle(particles.LifetimeParticle):
+        def can_reap(self):
+            return True
+
+    with pytest.raises(ValueError):
+        particles.ParticleList().add_particle(SpinningParticle(TEXTURE, (0, 0)))
+    with pytest.raises(ValueError):
+        particles.ParticleList().add_particle(ShortParticle(TEXTURE, (0, 0), lifetime=1.0))
+
+
+def test_zero_lifetime():
+    particle_list = particles.ParticleList()
+    particle_list.add_particle(particles.LifetimeParticle(TEXTURE, (1, 0), lifetime=0))
+    particle_list.add(TEXTURE, lifetime=0, start_alpha=255, end_alpha=0)
+    particle_list.update()
+    assert len(particle_list) == 0
+
+
+def test_emitter(window):
+    particle_list = particles.ParticleList()
+    emitter = particles.Emitter(
+        center_xy=(100, 100),
+        emit_controller=particles.EmitBurst(50),
+        particle_factory=lambda emitter: particles.LifetimeParticle(
+            TEXTURE, change_xy=(1, 0), lifetime=0.1
+        ),
+        particle_list=particle_list,
+    )
+    emitter.update()
+    assert emitter.get_count() == 50
+    assert particle_list.positions[0] == pytest.approx((101, 100))
+
+    window.clear()
+    emitter.draw()
+    assert particle_list._texture_slots == [particle_list._texture_slots[0]] * 50
+    assert arcade.get_pixel(101, 100) != (0, 0, 0)
+
+    for _ in range(10):
+        emitter.update()
+    assert emitter.get_count() == 0
+    assert emitter.can_reap()
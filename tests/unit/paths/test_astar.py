@@ -1,6 +1,8 @@
 """
 Test for A-Star path routing
 """
+import math
+
 import arcade
 
 SPRITE_IMAGE_SIZE = 128
@@ -106,3 +108,103 @@ def test_astar(window):
                                        diagonal_movement=True)
 
     assert path == [(160, 160), (128, 160), (96, 192), (64, 160), (64, 128), (64, 96), (64, 64), (32, 32)]
+
+
+def test_astar_large_grid(window):
+    """Long paths aren't cut off and the expansion budget is respected"""
+    mover = arcade.SpriteSolidColor(8, 8)
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    # A wall across the grid with a gap at the top
+    for y in range(0, 90):
+        walls.append(arcade.SpriteSolidColor(10, 10, center_x=500, center_y=y * 10))
+
+    barrier_list = arcade.AStarBarrierList(mover, walls, 10, 0, 1000, 0, 1000)
+
+    path = arcade.astar_calculate_path((0, 0), (990, 0), barrier_list)
+    assert path is not None
+    assert path[0] == (0, 0)
+    assert path[-1] == (990, 0)
+    assert max(y for _, y in path) >= 900
+
+    # The same cached graph is used for the next search
+    graph = barrier_list._get_graph(True)
+    assert len(arcade.astar_calculate_path((990, 0), (0, 0), barrier_list)) == len(path)
+    assert barrier_list._get_graph(True) is graph
+
+    assert arcade.astar_calculate_path((0, 0), (990, 0), barrier_list, max_expansions=100) is None
+
+    # Targets outside the grid or inside a wall can't be reached
+    assert arcade.astar_calculate_path((0, 0), (5000, 0), barrier_list) is None
+    assert arcade.astar_calculate_path((0, 0), (500, 0), barrier_list) is None
+
+
+def test_barrier_list_update_region(window):
+    mover = arcade.SpriteSolidColor(10, 10)
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    door = arcade.SpriteSolidColor(20, 20, center_x=100, center_y=100)
+    walls.append(door)
+    barrier_list = arcade.AStarBarrierList(mover, walls, 10, 0, 200, 0, 200)
+
+    # The mover can't be closer than 15 pixels to the door's center
+    expected = [(x, y) for x in range(9, 12) for y in range(9, 12)]
+    assert barrier_list.barrier_list == expected
+    assert sum(barrier_list.blocked_cells) == 9
+
+    # Move the door and update both the old and new area
+    old_area = arcade.LRBT(door.left, door.right, door.bottom, door.top)
+    door.position = (150, 50)
+    barrier_list.update_region(old_area)
+    barrier_list.update_region(arcade.LRBT(door.left, door.right, door.bottom, door.top))
+    assert barrier_list.barrier_list == [(x, y) for x in range(14, 17) for y in range(4, 7)]
+
+    # Searches use the updated grid
+    path = arcade.astar_calculate_path((150, 0), (150, 100), barrier_list)
+    assert path is not None
+    assert (150, 50) not in path
+
+    walls.remove(door)
+    barrier_list.update_region(arcade.LRBT(door.left, door.right, door.bottom, door.top))
+    assert barrier_list.barrier_list == []
+    assert arcade.astar_calculate_path((150, 0), (150, 100), barrier_list, False) == [
+        (150, y) for y in range(0, 110, 10)
+    ]
+
+
+def test_flow_field(window):
+    mover = arcade.SpriteSolidColor(8, 8)
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    # A wall with a gap at the top
+    for y in range(0, 8):
+        walls.append(arcade.SpriteSolidColor(10, 10, center_x=50, center_y=y * 10))
+    barrier_list = arcade.AStarBarrierList(mover, walls, 10, 0, 100, 0, 100)
+
+    flow_field = arcade.FlowField(barrier_list, (0, 0), diagonal_movement=False)
+    assert flow_field.goal == (0, 0)
+    assert flow_field.get_distance((0, 0)) == 0
+    assert flow_field.get_next_step((0, 0)) == (0, 0)
+    assert flow_field.get_direction((0, 0)) == (0, 0)
+
+    # Following the field gives a shortest path around the wall
+    position = (100, 0)
+    path = [position]
+    while position != flow_field.goal:
+        position = flow_field.get_next_step(position)
+        path.append(position)
+    assert len(path) - 1 == flow_field.get_distance((100, 0)) == 26
+    assert len(path) == len(arcade.astar_calculate_path((100, 0), (0, 0), barrier_list, False))
+
+    # Locations inside the wall or outside the grid can't reach the goal
+    assert flow_field.get_next_step((50, 0)) is None
+    assert flow_field.get_distance((50, 0)) == math.inf
+    assert flow_field.get_direction((500, 0)) == (0, 0)
+
+    # Moving the goal gives the same field as a new one
+    for goal in [(10, 0), (30, 20), (80, 90), (100, 0)]:
+        flow_field.set_goal(goal)
+        expected = arcade.FlowField(barrier_list, goal, diagonal_movement=False)
+        assert flow_field._distances == expected._distances
+        assert flow_field.get_distance((0, 0)) == expected.get_distance((0, 0))
+
+    # A goal inside a wall can't be reached
+    flow_field.set_goal((50, 0))
+    assert flow_field.get_next_step((0, 0)) is None
@@ -1,3 +1,5 @@
+import pytest
+
 import arcade
 
 
@@ -43,3 +45,47 @@ def test_line_of_sight(window):
 
     result = arcade.has_line_of_sight(player.position, enemy.position, wall_list)
     assert result
+
+
+@pytest.mark.parametrize("use_spatial_hash", [True, False])
+def test_line_of_sight_exact(window, use_spatial_hash):
+    walls = arcade.SpriteList(use_spatial_hash=use_spatial_hash, spatial_hash_cell_size=32)
+
+    # Thin walls are found no matter how far apart the points are
+    thin_wall = arcade.SpriteSolidColor(1, 100, center_x=-301.5, center_y=-40)
+    walls.append(thin_wall)
+    assert not arcade.has_line_of_sight((-1000, -50), (1000, -50), walls)
+    assert arcade.has_line_of_sight((-1000, 50), (1000, 50), walls)
+    # Lines ending just before the wall
+    assert arcade.has_line_of_sight((-1000, -50), (-302.5, -50), walls)
+    assert not arcade.has_line_of_sight((-1000, -50), (-301.5, -50), walls)
+
+    # Diagonal lines passing a rotated wall
+    wall = arcade.SpriteSolidColor(20, 20, center_x=100, center_y=100)
+    wall.angle = 45
+    walls.append(wall)
+    assert not arcade.has_line_of_sight((0, 0), (200, 200), walls)
+    assert arcade.has_line_of_sight((0, 200), (200, 200), walls)
+    assert not arcade.has_line_of_sight((0, 110), (200, 110), walls)
+
+    # Observers inside a wall can't see out
+    assert not arcade.has_line_of_sight((100, 100), (300, 100), walls)
+
+
+def test_line_of_sight_many(window):
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    walls.append(arcade.SpriteSolidColor(20, 20, center_x=50, center_y=0))
+
+    observers = [(0, 0), (0, 100)]
+    targets = [(100, 0), (100, 100), (0, 0)]
+    assert arcade.has_line_of_sight_many(observers, targets, walls) == [
+        [False, True, True],
+        [True, True, True],
+    ]
+    assert arcade.has_line_of_sight_many(observers, targets, walls, max_distance=110) == [
+        [False, False, True],
+        [False, True, True],
+    ]
+
+    with pytest.raises(ValueError):
+        arcade.has_line_of_sight_many(observers, targets, walls, max_distance=0)
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 import arcade
@@ -208,6 +210,30 @@ def test_check_for_collision_with_list(window):
     assert len(arcade.check_for_collision_with_list(a, sl)) == 4
 
 
+def test_check_for_collision_with_list_sorted(window):
+    """The GPU check finds the right sprites when the draw order is sorted"""
+    sl = arcade.SpriteList(sort_key="y")
+    for y in range(10):
+        for x in range(10):
+            sprite = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
+            sprite.position = x * 50, y * 50
+            sl.append(sprite)
+    sl.remove(sl[0])
+
+    a = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
+    a.position = 100, 100
+    expected = arcade.check_for_collision_with_list(a, sl, method=3)
+    # Sprite (2, 2) is at index 21 after removing the first sprite
+    assert expected == [sl[21]]
+    assert arcade.check_for_collision_with_list(a, sl, method=2) == expected
+
+    a.position = 75, 375
+    expected = arcade.check_for_collision_with_list(a, sl, method=3)
+    assert len(expected) == 4
+    result = arcade.check_for_collision_with_list(a, sl, method=2)
+    assert sorted(result, key=id) == sorted(expected, key=id)
+
+
 def test_check_for_collision_with_lists(window):
     # TODO: Check that the right collision function is called internally
     a = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
@@ -241,6 +267,100 @@ def test_check_for_collision_with_lists(window):
     assert len(arcade.check_for_collision_with_lists(a, sls)) == 4
 
 
+def test_check_for_collision_between_lists(window):
+    rng = random.Random(1)
+    bullets = arcade.SpriteList()
+    enemies = arcade.SpriteList()
+    for _ in range(200):
+        bullet = arcade.SpriteSolidColor(6, 12, color=arcade.csscolor.RED)
+        bullet.position = rng.uniform(0, 800), rng.uniform(0, 600)
+        bullet.angle = rng.choice([0, 30, 45, 90])
+        bullets.append(bullet)
+    for _ in range(40):
+        enemy = arcade.SpriteSolidColor(rng.randint(10, 120), rng.randint(10, 120))
+        enemy.position = rng.uniform(0, 800), rng.uniform(0, 600)
+        enemies.append(enemy)
+
+    if not window.using_accelerate:
+        with pytest.raises(TypeError):
+            arcade.check_for_collision_between_lists("moo", enemies)
+        with pytest.raises(TypeError):
+            arcade.check_for_collision_between_lists(bullets, "moo")
+
+    # Compare against checking every sprite in the first list individually
+    expected = {
+        (bullet, enemy)
+        for bullet in bullets
+        for enemy in arcade.check_for_collision_with_list(bullet, enemies)
+    }
+    pairs = arcade.check_for_collision_between_lists(bullets, enemies)
+    assert len(pairs) == len(expected)
+    assert set(pairs) == expected
+    assert len(expected) > 0
+
+    # Swapping the lists swaps the pairs
+    pairs = arcade.check_for_collision_between_lists(enemies, bullets)
+    assert set(pairs) == {(enemy, bullet) for bullet, enemy in expected}
+
+    assert arcade.check_for_collision_between_lists(bullets, arcade.SpriteList()) == []
+
+
+def test_check_for_collision_between_lists_same_list(window):
+    a = arcade.SpriteSolidColor(50, 50, center_x=0)
+    b = arcade.SpriteSolidColor(50, 50, center_x=40)
+    c = arcade.SpriteSolidColor(50, 50, center_x=80)
+    d = arcade.SpriteSolidColor(50, 50, center_x=500)
+    sl = arcade.SpriteList()
+    sl.extend((c, a, d, b))
+
+    pairs = arcade.check_for_collision_between_lists(sl, sl)
+    assert len(pairs) == 2
+    assert {frozenset(pair) for pair in pairs} == {frozenset((a, b)), frozenset((b, c))}
+
+    # A sprite in both lists never collides with itself
+    other = arcade.SpriteList()
+    other.extend((a, d))
+    pairs = arcade.check_for_collision_between_lists(sl, other)
+    assert set(pairs) == {(b, a)}
+
+
+def test_axis_aligned_fast_path(window):
+    """Collisions between unrotated boxes should match the polygon check"""
+    from arcade.geometry import are_polygons_intersecting
+
+    rng = random.Random(2)
+    sprites = []
+    for _ in range(100):
+        sprite = arcade.SpriteSolidColor(rng.choice([10, 20, 32]), rng.choice([10, 20, 32]))
+        # Snap to a grid so plenty of sprites touch at the edges
+        sprite.position = rng.randint(0, 20) * 5, rng.randint(0, 20) * 5
+        if rng.random() < 0.3:
+            sprite.angle = rng.choice([30, 90])
+        sprites.append(sprite)
+
+    for sprite_1 in sprites:
+        for sprite_2 in sprites:
+            expected = are_polygons_intersecting(
+                sprite_1.hit_box.get_adjusted_points(), sprite_2.hit_box.get_adjusted_points()
+            )
+            assert arcade.check_for_collision(sprite_1, sprite_2) == expected
+
+    sl = arcade.SpriteList()
+    sl.extend(sprites)
+    for sprite in sprites:
+        expected = [s for s in sprites if s is not sprite and arcade.check_for_collision(sprite, s)]
+        assert arcade.check_for_collision_with_list(sprite, sl) == expected
+
+    # Touching edges don't collide, and zero sized boxes never collide
+    a = arcade.SpriteSolidColor(10, 10, center_x=0)
+    b = arcade.SpriteSolidColor(10, 10, center_x=10)
+    assert not arcade.check_for_collision(a, b)
+    b.center_x = 9.9
+    assert arcade.check_for_collision(a, b)
+    b.width = 0
+    assert not arcade.check_for_collision(a, b)
+
+
 def test_get_sprites_at_point(window):
     a = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
     b = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
@@ -311,3 +431,46 @@ def test_get_sprites_in_rect(use_spatial_hash):
     assert set(arcade.get_sprites_in_rect(arcade.LRBT(100, 200, 100, 200), sp)) == set()
     assert set(arcade.get_sprites_in_rect(arcade.LRBT(-100, 0, -100, 0), sp)) == {b, d}
     assert set(arcade.get_sprites_in_rect(arcade.LRBT(100, 0, 100, 0), sp)) == {a, c}
+
+
+@pytest.mark.parametrize("use_spatial_hash", [True, False])
+def test_sweep_sprite(use_spatial_hash):
+    mover = arcade.SpriteSolidColor(10, 10, center_x=0, center_y=0)
+    near = arcade.SpriteSolidColor(10, 10, center_x=30, center_y=0)
+    far = arcade.SpriteSolidColor(10, 10, center_x=60, center_y=0)
+    above = arcade.SpriteSolidColor(10, 10, center_x=30, center_y=10)
+    walls = arcade.SpriteList(use_spatial_hash=use_spatial_hash)
+    walls.extend((near, far, above))
+
+    # The first sprite along the path is hit
+    t, hit, normal = arcade.sweep_sprite(mover, (100, 0), walls)
+    assert t == pytest.approx(0.2)
+    assert hit is near
+    assert normal == (-1.0, 0.0)
+    # The sprite isn't moved
+    assert mover.position == (0, 0)
+
+    # Moving left and down
+    t, hit, normal = arcade.sweep_sprite(mover, (-100, 0), walls)
+    assert (t, hit, normal) == (1.0, None, (0.0, 0.0))
+    t, hit, normal = arcade.sweep_sprite(near, (0, 20), walls)
+    assert (t, hit, normal) == (0.0, above, (0.0, -1.0))
+    t, hit, normal = arcade.sweep_sprite(above, (0, -20), walls)
+    assert (t, hit, normal) == (0.0, near, (0.0, 1.0))
+
+    # Stopping just short of a sprite or sliding along an edge isn't a hit
+    assert arcade.sweep_sprite(mover, (20, 0), walls)[1] is None
+    mover.center_y = 20
+    assert arcade.sweep_sprite(mover, (100, 0), walls)[1] is None
+
+    # Thin walls can't be skipped by moving fast
+    mover.position = (0, 0)
+    near.width = 1
+    assert arcade.sweep_sprite(mover, (1000, 0), [walls])[1] is near
+
+    # Already overlapping
+    mover.position = (30, 0)
+    t, hit, normal = arcade.sweep_sprite(mover, (100, 0), walls)
+    assert t == 0.0
+    assert hit is near
+    assert normal == (0.0, 0.0)
@@ -74,3 +74,70 @@ def test_animating_sprite(keyframes):
     # Not looping
     sprite.time = 8.0
     sprite.update_animation(0.0, loop=False)
+
+
+def test_scheduler(keyframes):
+    """Test updating sprites with a scheduler"""
+    anim = arcade.TextureAnimation(keyframes=keyframes)
+    sprites = [arcade.TextureAnimationSprite(animation=anim) for _ in range(3)]
+    sprites[1].time = 2.5
+    scheduler = arcade.TextureAnimationScheduler(sprites[:2])
+    assert len(scheduler) == 2
+    assert sprites[1].texture == keyframes[2].texture
+
+    # Only the due sprites are updated, but all times move forward
+    scheduler.update_animation(0.75)
+    assert sprites[0].time == 0.75
+    assert sprites[0].texture == keyframes[0].texture
+    assert sprites[1].time == 3.25
+    assert sprites[1].texture == keyframes[3].texture
+
+    # Looping
+    for _ in range(10):
+        scheduler.update_animation(0.5)
+    assert sprites[0].texture == keyframes[5].texture
+    assert sprites[1].texture == keyframes[0].texture
+
+    # Setting the time reschedules the sprite
+    sprites[0].time = 7.0
+    assert sprites[0].texture == keyframes[7].texture
+    scheduler.update_animation(1.0)
+    assert sprites[0].texture == keyframes[0].texture
+
+    # Removed sprites keep their time and are no longer updated
+    scheduler.remove(sprites[0])
+    assert sprites[0].time == 8.0
+    scheduler.update_animation(1.0)
+    assert sprites[0].texture == keyframes[0].texture
+    assert sprites[1].texture == keyframes[2].texture
+
+    with pytest.raises(ValueError):
+        scheduler.update_animation(-1.0)
+    with pytest.raises(ValueError):
+        arcade.TextureAnimationScheduler([sprites[1]])
+    with pytest.raises(RuntimeError):
+        scheduler.add(arcade.TextureAnimationSprite())
+
+    scheduler.clear()
+    assert len(scheduler) == 0
+    assert sprites[1].time == 10.25
+
+
+def test_scheduler_rounding():
+    """Scheduled sprites change keyframe on the same update as a lookup of their time"""
+    keyframes = [
+        arcade.TextureKeyframe(
+            texture=arcade.make_soft_square_texture(4, (i, 0, 0, 255)), duration=17 + i
+        )
+        for i in range(8)
+    ]
+    anim = arcade.TextureAnimation(keyframes=keyframes)
+    sprites = [arcade.TextureAnimationSprite(animation=anim) for _ in range(200)]
+    for i, sprite in enumerate(sprites):
+        sprite.time = i * 0.0137
+    scheduler = arcade.TextureAnimationScheduler(sprites)
+
+    for i in range(20):
+        scheduler.update_animation(1 / 60 if i % 3 else 0.0231)
+        for sprite in sprites:
+            assert sprite.texture == anim.get_keyframe(sprite.time)[1].texture
@@ -0,0 +1,191 @@
+import random
+
+import pytest
+import arcade
+from arcade.sprite_list.aabb_tree import AABBTree
+
+
+def check_tree(tree: AABBTree):
+    """Verify parent links, heights, boxes and balance of every node"""
+    if tree.root is None:
+        assert tree.count == 0
+        return
+    assert tree.root.parent is None
+
+    leaves = 0
+    stack = [tree.root]
+    while stack:
+        node = stack.pop()
+        if node.sprite is not None:
+            leaves += 1
+            assert node.height == 0
+            assert tree.leaf_for_sprite[node.sprite] is node
+            continue
+        child1, child2 = node.child1, node.child2
+        assert child1.parent is node
+        assert child2.parent is node
+        assert node.height == 1 + max(child1.height, child2.height)
+        assert abs(child1.height - child2.height) <= 1
+        for child in (child1, child2):
+            assert node.left <= child.left and node.bottom <= child.bottom
+            assert node.right >= child.right and node.top >= child.top
+        stack.extend((child1, child2))
+
+    assert leaves == tree.count
+
+
+def test_create():
+    tree = AABBTree(margin=4)
+    assert tree.margin == 4
+    assert tree.root is None
+    assert tree.count == 0
+    assert tree.height == 0
+
+
+def test_incorrect_margin():
+    with pytest.raises(ValueError):
+        AABBTree(margin=-1)
+
+
+def test_add_remove():
+    tree = AABBTree()
+    sprites = [arcade.SpriteSolidColor(10, 10, center_x=i * 20) for i in range(100)]
+    for sprite in sprites:
+        tree.add(sprite)
+    assert tree.count == 100
+    # Balanced tree
+    assert tree.height < 16
+    check_tree(tree)
+
+    for sprite in sprites[::2]:
+        tree.remove(sprite)
+    assert tree.count == 50
+    check_tree(tree)
+
+    with pytest.raises(KeyError):
+        tree.remove(sprites[0])
+
+    tree.reset()
+    assert tree.count == 0
+    assert tree.root is None
+
+
+def test_add_twice():
+    tree = AABBTree()
+    sprite = arcade.SpriteSolidColor(10, 10)
+    tree.add(sprite)
+    tree.add(sprite)
+    assert tree.count == 1
+    check_tree(tree)
+
+
+def test_move_inside_margin():
+    """Small moves should not re-insert the sprite"""
+    tree = AABBTree(margin=10)
+    sprite = arcade.SpriteSolidColor(10, 10)
+    tree.add(sprite)
+    leaf = tree.leaf_for_sprite[sprite]
+    bounds = leaf.left, leaf.bottom, leaf.right, leaf.top
+    assert bounds == (-15, -15, 15, 15)
+
+    sprite.position = 5, -5
+    tree.move(sprite)
+    assert (leaf.left, leaf.bottom, leaf.right, leaf.top) == bounds
+
+    sprite.position = 50, 0
+    tree.move(sprite)
+    assert (leaf.left, leaf.bottom, leaf.right, leaf.top) == (35, -15, 65, 15)
+
+
+def test_queries():
+    tree = AABBTree(margin=0)
+    small = arcade.SpriteSolidColor(10, 10, center_x=0, center_y=0)
+    huge = arcade.SpriteSolidColor(1000, 1000, center_x=1000, center_y=1000)
+    tree.add(small)
+    tree.add(huge)
+
+    assert tree.get_sprites_near_point((0, 0)) == {small}
+    assert tree.get_sprites_near_point((1200, 700)) == {huge}
+    assert tree.get_sprites_near_point((-100, 0)) == set()
+    assert tree.get_sprites_near_rect(arcade.LRBT(-10, 600, -10, 600)) == {small, huge}
+    assert tree.get_sprites_near_sprite(
+        arcade.SpriteSolidColor(10, 10, center_x=3, center_y=3)
+    ) == {small}
+
+
+def test_random_moves_match_brute_force():
+    """The tree should never miss an overlapping sprite"""
+    random.seed(42)
+    tree = AABBTree(margin=5)
+    sprites = [
+        arcade.SpriteSolidColor(
+            random.choice([4, 16, 300]),
+            random.choice([4, 16, 300]),
+            center_x=random.uniform(0, 2000),
+            center_y=random.uniform(0, 2000),
+        )
+        for _ in range(200)
+    ]
+    for sprite in sprites:
+        tree.add(sprite)
+
+    for _ in range(10):
+        for sprite in random.sample(sprites, 50):
+            sprite.position = (
+                sprite.center_x + random.uniform(-40, 40),
+                sprite.center_y + random.uniform(-40, 40),
+            )
+            tree.move(sprite)
+        check_tree(tree)
+
+        for x, y in ((random.uniform(0, 2000), random.uniform(0, 2000)) for _ in range(20)):
+            rect = arcade.LRBT(x, x + 50, y, y + 50)
+            expected = {
+                s for s in sprites
+                if s.left <= rect.right and s.right >= rect.left
+                and s.bottom <= rect.top and s.top >= rect.bottom
+            }
+            assert expected <= tree.get_sprites_near_rect(rect)
+
+
+def test_spritelist_broad_phase():
+    """Collision functions should use the broad phase transparently"""
+    tree = AABBTree()
+    sl = arcade.SpriteList(broad_phase=tree)
+    assert sl.spatial_hash is tree
+    assert sl.broad_phase is tree
+
+    sprite_1 = arcade.SpriteSolidColor(10, 10, center_x=0)
+    sprite_2 = arcade.SpriteSolidColor(10, 10, center_x=100)
+    sl.extend([sprite_1, sprite_2])
+    assert tree.count == 2
+
+    player = arcade.SpriteSolidColor(10, 10, center_x=5)
+    assert arcade.check_for_collision_with_list(player, sl) == [sprite_1]
+    assert arcade.get_sprites_at_point((100, 0), sl) == [sprite_2]
+    assert set(arcade.get_sprites_in_rect(arcade.LRBT(-10, 200, -1, 1), sl)) == {sprite_1, sprite_2}
+
+    # Moving a sprite in the list updates the tree
+    sprite_2.position = 500, 500
+    assert arcade.get_sprites_at_point((500, 500), sl) == [sprite_2]
+    assert arcade.get_sprites_at_point((100, 0), sl) == []
+
+    sprite_1.remove_from_sprite_lists()
+    assert tree.count == 1
+    sl.clear()
+    assert tree.count == 0
+    assert sl.spatial_hash is tree
+
+
+def test_spritelist_enable_broad_phase():
+    sl = arcade.SpriteList(use_spatial_hash=True)
+    sl.append(arcade.SpriteSolidColor(10, 10))
+    tree = AABBTree()
+    sl.enable_broad_phase(tree)
+    assert sl.spatial_hash is tree
+    assert tree.count == 1
+
+    # Switching back to a spatial hash
+    sl.enable_spatial_hashing()
+    assert isinstance(sl.spatial_hash, arcade.SpatialHash)
+    assert sl.spatial_hash.count == 1
@@ -77,6 +77,67 @@ def test_remove_twice():
         sh.remove(sprite)
 
 
+def test_move_same_cells():
+    """Moving a sprite within the same cells should not touch any buckets"""
+    sh = SpatialHash(cell_size=10)
+    sprite = arcade.SpriteSolidColor(4, 4, center_x=5, center_y=5)
+    sh.add(sprite)
+    buckets = sh.buckets_for_sprite[sprite]
+    assert sh.cell_range_for_sprite[sprite] == (0, 0, 0, 0)
+
+    sprite.position = 6, 6
+    sh.move(sprite)
+    assert sh.buckets_for_sprite[sprite] is buckets
+    assert sh.cell_range_for_sprite[sprite] == (0, 0, 0, 0)
+
+
+def test_move_changed_cells():
+    """Moving a sprite to new cells should only leave it in the new cells"""
+    sh = SpatialHash(cell_size=10)
+    sprite = arcade.SpriteSolidColor(10, 10, center_x=5, center_y=5)
+    sh.add(sprite)
+    assert sh.cell_range_for_sprite[sprite] == (0, 0, 1, 1)
+
+    sprite.position = 15, 5
+    sh.move(sprite)
+    assert sh.cell_range_for_sprite[sprite] == (1, 0, 2, 1)
+    assert len(sh.buckets_for_sprite[sprite]) == 4
+    for (i, j), bucket in sh.contents.items():
+        assert (sprite in bucket) == (1 <= i <= 2 and 0 <= j <= 1)
+
+    # Moving far away should leave no overlap at all
+    sprite.position = 105, 105
+    sh.move(sprite)
+    assert sh.cell_range_for_sprite[sprite] == (10, 10, 11, 11)
+    for (i, j), bucket in sh.contents.items():
+        assert (sprite in bucket) == (10 <= i <= 11 and 10 <= j <= 11)
+
+    sh.remove(sprite)
+    assert sh.count == 0
+    assert sh.cell_range_for_sprite == {}
+    for bucket in sh.contents.values():
+        assert len(bucket) == 0
+
+
+def test_move_resized():
+    """Changing the size of a sprite should update the covered cells"""
+    sh = SpatialHash(cell_size=10)
+    sprite = arcade.SpriteSolidColor(4, 4, center_x=5, center_y=5)
+    sh.add(sprite)
+    sprite.size = 30, 30
+    sh.move(sprite)
+    assert sh.cell_range_for_sprite[sprite] == (-1, -1, 2, 2)
+    assert len(sh.buckets_for_sprite[sprite]) == 16
+    assert sh.get_sprites_near_point((-5, -5)) == {sprite}
+
+
+def test_move_not_added():
+    """Moving a sprite not in the spatial hash should raise an error"""
+    sh = SpatialHash(cell_size=10)
+    with pytest.raises(KeyError):
+        sh.move(arcade.SpriteSolidColor(10, 10))
+
+
 def get_nearby_sprites():
     """Test getting nearby sprites"""
     sh = SpatialHash(cell_size=10)
@@ -0,0 +1,152 @@
+import pytest
+import arcade
+from arcade import SpritePool
+from arcade.gl import Geometry
+
+
+def make_sprite(x=0, y=0, color=arcade.color.RED):
+    return arcade.SpriteSolidColor(32, 32, center_x=x, center_y=y, color=color)
+
+
+def test_shared_slots(ctx):
+    pool = SpritePool()
+    draw_list = arcade.SpriteList(pool=pool)
+    team = arcade.SpriteList(pool=pool, use_spatial_hash=True)
+    sprites = [make_sprite(i, i) for i in range(3)]
+
+    draw_list.extend(sprites)
+    team.append(sprites[1])
+    assert len(pool) == 3
+    # The same slot and data is used by both lists
+    assert team.sprite_slot[sprites[1]] == draw_list.sprite_slot[sprites[1]]
+    assert team._sprite_pos_data is draw_list._sprite_pos_data
+    assert team.buffer_positions is draw_list.buffer_positions
+
+    sprites[1].position = 50, 60
+    slot = draw_list.sprite_slot[sprites[1]]
+    assert tuple(draw_list._sprite_pos_data[slot * 3 : slot * 3 + 2]) == (50, 60)
+    assert arcade.get_sprites_at_point((50, 60), team) == [sprites[1]]
+
+    # The slot is kept until the sprite is not in any list
+    draw_list.remove(sprites[1])
+    draw_list.write_sprite_buffers_to_gpu()
+    assert sprites[1] in pool
+    sprites[1].remove_from_sprite_lists()
+    team.write_sprite_buffers_to_gpu()
+    assert sprites[1] not in pool
+    assert len(pool) == 2
+
+    # The free slot is reused by the next sprite
+    new_sprite = make_sprite()
+    team.append(new_sprite)
+    assert team.sprite_slot[new_sprite] == slot
+
+    team.clear()
+    draw_list.clear()
+    assert len(pool) == 0
+
+
+def test_setitem_and_insert(ctx):
+    pool = SpritePool()
+    list_1 = arcade.SpriteList(pool=pool)
+    list_2 = arcade.SpriteList(pool=pool)
+    sprites = [make_sprite(i) for i in range(3)]
+    list_1.extend(sprites)
+    list_2.extend(sprites)
+
+    new_sprite = make_sprite(10)
+    list_1[0] = new_sprite
+    # The other list still uses the old sprite and slot
+    assert list_2[0] is sprites[0]
+    assert list_1._sprite_index_data[0] == pool._storage.sprite_slot[new_sprite]
+    assert list_2._sprite_index_data[0] == pool._storage.sprite_slot[sprites[0]]
+
+    list_2.insert(0, new_sprite)
+    assert list_2._sprite_index_data[0] == list_1._sprite_index_data[0]
+    assert len(pool) == 4
+
+
+def test_draw(window, monkeypatch):
+    pool = SpritePool(capacity=1)
+    list_1 = arcade.SpriteList(pool=pool)
+    list_2 = arcade.SpriteList(pool=pool)
+    red = make_sprite(50, 50)
+    blue = make_sprite(150, 150, color=arcade.color.BLUE)
+    list_1.append(red)
+    list_2.extend([red, blue])
+
+    window.clear(color=arcade.color.BLACK)
+    list_1.draw()
+    assert arcade.get_pixel(50, 50) == (255, 0, 0)
+    assert arcade.get_pixel(150, 150) == (0, 0, 0)
+    list_2.draw()
+    assert arcade.get_pixel(150, 150) == (0, 0, 255)
+
+    # Changes are written once for all lists
+    writes = []
+    original_write = arcade.gl.buffer.Buffer.write
+    def write(self, data, offset=0):
+        writes.append(self)
+        original_write(self, data, offset)
+    monkeypatch.setattr(arcade.gl.buffer.Buffer, "write", write)
+
+    red.position = 250, 250
+    window.clear(color=arcade.color.BLACK)
+    list_1.draw()
+    list_2.draw()
+    assert writes == [list_1.buffer_positions]
+    assert arcade.get_pixel(250, 250) == (255, 0, 0)
+    assert arcade.get_pixel(150, 150) == (0, 0, 255)
+
+
+def test_sort_key(ctx):
+    pool = SpritePool()
+    list_1 = arcade.SpriteList(pool=pool, sort_key="y")
+    list_2 = arcade.SpriteList(pool=pool, sort_key="y")
+    sprites = [make_sprite(0, y) for y in (10, 20)]
+    list_1.extend(sprites)
+    list_2.extend(sprites)
+    list_1.write_sprite_buffers_to_gpu()
+    list_2.write_sprite_buffers_to_gpu()
+
+    # Moves are seen by both lists even though the pool is only written once
+    sprites[0].center_y = 30
+    list_1.write_sprite_buffers_to_gpu()
+    list_2.write_sprite_buffers_to_gpu()
+    slots = [list_1.sprite_slot[sprite] for sprite in sprites]
+    assert list(list_1._sprite_index_data[:2]) == slots
+    assert list(list_2._sprite_index_data[:2]) == slots
+
+
+def test_single_listener(monkeypatch):
+    """Sprites register the pool once, no matter how many lists of the pool they are in"""
+    pool = SpritePool()
+    list_1 = arcade.SpriteList(pool=pool)
+    list_2 = arcade.SpriteList(pool=pool, use_spatial_hash=True)
+    other = arcade.SpriteList()
+    sprite = make_sprite()
+    list_1.append(sprite)
+    list_2.append(sprite)
+    other.append(sprite)
+    assert sprite.sprite_lists == [pool._storage, other]
+
+    updated = []
+    original_update = arcade.SpriteList._update_position
+    def update_position(self, sprite):
+        updated.append(self)
+        original_update(self, sprite)
+    monkeypatch.setattr(arcade.SpriteList, "_update_position", update_position)
+
+    sprite.position = 500, 500
+    assert updated == [pool._storage, other]
+    slot = list_1.sprite_slot[sprite]
+    assert tuple(list_1._sprite_pos_data[slot * 3 : slot * 3 + 2]) == (500, 500)
+    # Moves are passed on to the spatial hash of the lists
+    assert arcade.get_sprites_at_point((500, 500), list_2) == [sprite]
+
+    list_1.remove(sprite)
+    assert sprite.sprite_lists == [pool._storage, other]
+    sprite.remove_from_sprite_lists()
+    assert sprite.sprite_lists == []
+    assert sprite not in list_2
+    assert sprite not in other
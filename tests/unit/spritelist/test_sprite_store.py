@@ -0,0 +1,138 @@
+import pytest
+import arcade
+from arcade import SpriteStore, SpriteView
+
+
+def test_add_and_views():
+    texture = arcade.make_soft_square_texture(10, arcade.color.WHITE)
+    store = SpriteStore(capacity=2)
+    view = store.add(texture, 10, 20, angle=45, scale=2, color=(255, 0, 0), depth=1)
+
+    assert len(store) == 1
+    assert view in store
+    assert store[0] == view
+    assert list(store) == [view]
+    assert view.position == (10, 20)
+    assert view.size == (20, 20)
+    assert view.scale == (2, 2)
+    assert view.angle == 45
+    assert view.depth == 1
+    assert view.color == (255, 0, 0, 255)
+    assert view.texture is texture
+
+    # Writes go straight to the columns
+    view.center_x = 15
+    view.alpha = 128
+    assert store[0].center_x == 15
+    assert store._pos_data[0] == 15
+    assert store._color_data[3] == 128
+    assert store._pos_dirty == {0}
+
+    # The store grows past the capacity
+    for i in range(10):
+        store.add(texture, i, i)
+    assert len(store) == 11
+    assert store.capacity >= 11
+    assert store[1].position == (0, 0)
+
+
+def test_remove_and_clear():
+    texture = arcade.make_soft_square_texture(10, arcade.color.WHITE)
+    store = SpriteStore()
+    views = [store.add(texture, i, 0) for i in range(3)]
+
+    views[1].remove_from_store()
+    assert views[1] not in store
+    assert [view.center_x for view in store] == [0, 2]
+    with pytest.raises(ValueError):
+        store.remove(views[1])
+
+    # The free slot is reused
+    view = store.add(texture, 5, 0)
+    assert view._slot == views[1]._slot
+    assert [view.center_x for view in store] == [0, 2, 5]
+
+    store.clear()
+    assert len(store) == 0
+    assert views[0] not in store
+
+
+def test_sprite_conversion():
+    sprite = arcade.SpriteSolidColor(10, 20, 30, 40, color=arcade.color.RED)
+    sprite.angle = 30
+    store = SpriteStore()
+    view = store.add_sprite(sprite)
+    assert isinstance(view, SpriteView)
+    assert view.position == sprite.position
+    assert view.size == sprite.size
+    assert view.angle == 30
+    assert view.color == arcade.color.RED
+
+    copy = view.to_sprite()
+    assert isinstance(copy, arcade.Sprite)
+    assert copy.position == sprite.position
+    assert copy.size == sprite.size
+    assert copy.angle == 30
+    assert copy.color == arcade.color.RED
+
+
+def test_update():
+    """Should give the same result as calling update on the same sprites"""
+    texture = arcade.make_soft_square_texture(10, arcade.color.WHITE)
+    store = SpriteStore()
+    sprites = []
+    for i in range(20):
+        sprite = arcade.Sprite(texture, center_x=i * 20, center_y=i)
+        sprite.velocity = i % 3, -(i % 2)
+        sprite.change_angle = i % 4
+        sprites.append(sprite)
+        store.add_sprite(sprite)
+    store[3].remove_from_store()
+    assert store[0].velocity == (0, 0)
+    assert store[4].velocity == (2, -1)
+    assert store[4].change_angle == 1
+
+    store.update(1 / 30)
+    for sprite in sprites:
+        sprite.update(1 / 30)
+    del sprites[3]
+    for view, sprite in zip(store, sprites):
+        assert view.position == sprite.position
+        assert view.angle == sprite.angle
+    # All positions and angles are written on the next draw
+    assert store._pos_changed and store._angle_changed
+
+    copy = store[4].to_sprite()
+    assert copy.velocity == (2, -1)
+    assert copy.change_angle == 1
+
+    # Nothing is changed if no sprite moves
+    store = SpriteStore()
+    store.add(texture, 1, 2)
+    store.update()
+    assert store[0].position == (1, 2)
+    assert not store._pos_changed and not store._angle_changed
+
+
+def test_draw(window):
+    texture = arcade.make_soft_square_texture(32, arcade.color.WHITE, 255, 255)
+    store = SpriteStore(capacity=1)
+    view = store.add(texture, 50, 50, color=arcade.color.RED)
+
+    window.clear(color=arcade.color.BLACK)
+    store.draw()
+    assert arcade.get_pixel(50, 50) == (255, 0, 0)
+
+    # Changes are written before drawing, also after the store grows
+    view.position = 150, 150
+    store.add(texture, 250, 250, color=arcade.color.BLUE)
+    window.clear(color=arcade.color.BLACK)
+    store.draw()
+    assert arcade.get_pixel(50, 50) == (0, 0, 0)
+    assert arcade.get_pixel(150, 150) == (255, 0, 0)
+    assert arcade.get_pixel(250, 250) == (0, 0, 255)
+
+    store.visible = False
+    window.clear(color=arcade.color.BLACK)
+    store.draw()
+    assert arcade.get_pixel(150, 150) == (0, 0, 0)
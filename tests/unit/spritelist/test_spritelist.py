@@ -104,6 +104,85 @@ def sprite_grid_generator(cols: int, rows: int, cell_size: float):
             index += 1
 
 
+def test_extend_matches_append(ctx):
+    """Bulk extend should produce the same buffers as appending one by one"""
+    def make_sprites():
+        return [
+            arcade.SpriteSolidColor(
+                10 + i, 20 + i, center_x=i, center_y=-i, angle=i, color=(i, 2 * i, 3 * i, 255)
+            )
+            for i in range(50)
+        ]
+
+    sl_append = arcade.SpriteList(capacity=1, use_spatial_hash=True)
+    for sprite in make_sprites():
+        sl_append.append(sprite)
+    sl_extend = arcade.SpriteList(capacity=1, use_spatial_hash=True)
+    sl_extend.extend(make_sprites())
+
+    for sl in (sl_append, sl_extend):
+        sl.write_sprite_buffers_to_gpu()
+    # Extend grows the buffers once to fit, append doubles them
+    assert sl_extend._buf_capacity == 50
+    assert sl_append._buf_capacity == 64
+    assert sl_extend._sprite_pos_data[:150] == sl_append._sprite_pos_data[:150]
+    assert sl_extend._sprite_size_data[:100] == sl_append._sprite_size_data[:100]
+    assert sl_extend._sprite_angle_data[:50] == sl_append._sprite_angle_data[:50]
+    assert sl_extend._sprite_color_data[:200] == sl_append._sprite_color_data[:200]
+    assert sl_extend._sprite_texture_data[:50] == sl_append._sprite_texture_data[:50]
+    assert sl_extend._sprite_index_data[:50] == sl_append._sprite_index_data[:50]
+    assert sl_extend._sprite_pos_buf.read() == sl_extend._sprite_pos_data.tobytes()
+    assert sl_extend._sprite_texture_buf.read() == sl_extend._sprite_texture_data.tobytes()
+    assert len(sl_extend.spatial_hash.cell_range_for_sprite) == 50
+
+    # Free slots are reused first
+    sl_extend.remove_many(sl_extend[:10])
+    sl_extend.write_sprite_buffers_to_gpu()
+    sl_extend.extend(make_sprites()[:20])
+    assert len(sl_extend) == 60
+    assert sl_extend._sprite_buffer_slots == 60
+    assert sorted(sl_extend.sprite_slot.values()) == list(range(60))
+    assert list(sl_extend._sprite_index_data[40:60]) == list(range(10)) + list(range(50, 60))
+
+    # Adding a sprite already in the list leaves it unchanged
+    with pytest.raises(ValueError):
+        sl_extend.extend([arcade.SpriteSolidColor(10, 10), sl_extend[0]])
+    assert len(sl_extend) == 60
+
+
+def test_reserve():
+    sl = arcade.SpriteList(capacity=10)
+    sl.reserve(1000)
+    assert sl._buf_capacity == 1000
+    assert sl._idx_capacity == 1000
+    assert len(sl._sprite_pos_data) == 3000
+    assert len(sl._sprite_index_data) == 1000
+    sl.extend(arcade.SpriteSolidColor(10, 10) for _ in range(1000))
+    assert sl._buf_capacity == 1000
+    # Reserving less than the capacity does nothing
+    sl.reserve(10)
+    assert sl._buf_capacity == 1000
+
+
+def test_from_arrays(ctx):
+    texture = arcade.make_soft_square_texture(8, arcade.color.WHITE)
+    positions = [(x, y) for x in range(10) for y in range(5)]
+    sl = arcade.SpriteList.from_arrays(
+        texture, positions, angles=[45] * 50, scales=[2.0] * 50, use_spatial_hash=True
+    )
+    assert len(sl) == 50
+    assert sl._buf_capacity == 50
+    assert sl.spatial_hash is not None
+    for sprite, position in zip(sl, positions):
+        assert sprite.texture is texture
+        assert sprite.position == position
+        assert sprite.angle == 45
+        assert sprite.scale == (2.0, 2.0)
+
+    with pytest.raises(ValueError):
+        arcade.SpriteList.from_arrays(texture, positions, angles=[0])
+
+
 def test_it_can_insert_in_a_spritelist():
     spritelist = make_named_sprites(2)
 
@@ -219,6 +298,51 @@ def test_sort(ctx):
     assert spritelist._sprite_index_data[0:3] == array("f", [0, 1, 2])
 
 
+def test_sort_key(ctx):
+    sprites = [
+        arcade.SpriteSolidColor(10, 10, center_x=i, center_y=y)
+        for i, y in enumerate([5, 30, 10, 30])
+    ]
+    spritelist = arcade.SpriteList(sort_key="y")
+    spritelist.extend(sprites)
+    spritelist.write_sprite_buffers_to_gpu()
+
+    # Higher sprites are drawn first. Equal keys keep the list order.
+    assert list(spritelist._sprite_index_data[0:4]) == [1, 3, 2, 0]
+    # The list order is not affected
+    assert spritelist.sprite_list == sprites
+    assert spritelist._sprite_index_changed is False
+
+    # Moving a sprite updates the order
+    sprites[0].center_y = 100
+    spritelist.write_sprite_buffers_to_gpu()
+    assert list(spritelist._sprite_index_data[0:4]) == [0, 1, 3, 2]
+
+    # Removing and appending sprites keeps the order
+    spritelist.remove(sprites[1])
+    new_sprite = arcade.SpriteSolidColor(10, 10, center_y=20)
+    spritelist.append(new_sprite)
+    spritelist.write_sprite_buffers_to_gpu()
+    order = [spritelist.sprite_slot[s] for s in (sprites[0], sprites[3], new_sprite, sprites[2])]
+    assert list(spritelist._sprite_index_data[0:4]) == order
+
+    # Depth sorting draws lower depth first
+    spritelist.sort_key = "depth"
+    for i, sprite in enumerate(spritelist):
+        sprite.depth = -i
+    spritelist.write_sprite_buffers_to_gpu()
+    slots = [spritelist.sprite_slot[s] for s in reversed(spritelist.sprite_list)]
+    assert list(spritelist._sprite_index_data[0:4]) == slots
+
+    # Turning it off goes back to list order
+    spritelist.sort_key = None
+    slots = [spritelist.sprite_slot[s] for s in spritelist.sprite_list]
+    assert list(spritelist._sprite_index_data[0:4]) == slots
+
+    with pytest.raises(ValueError):
+        spritelist.sort_key = "x"
+
+
 def test_clear(ctx):
     sp = arcade.SpriteList()
     sp.clear()
@@ -306,3 +430,87 @@ def test_swap(window):
     sl.draw()
     assert arcade.get_pixel(x=0, y=0, components=4) == arcade.color.RED
     assert sl.sprite_list == sprites[::-1]
+
+
+def test_move():
+    sprites = [arcade.SpriteSolidColor(10, 10, center_x=i * 20) for i in range(10)]
+    sl = arcade.SpriteList(use_spatial_hash=True)
+    sl.extend(sprites)
+    sl.move(5, -5)
+
+    for i, sprite in enumerate(sprites):
+        assert sprite.position == (i * 20 + 5, -5)
+        assert sprite.left == i * 20
+        assert sl._sprite_pos_data[i * 3 : i * 3 + 2].tolist() == [i * 20 + 5, -5]
+    assert arcade.get_sprites_at_point((45, -5), sl) == [sprites[2]]
+
+    # Sprites are moved through their center_x and center_y properties
+    class TrackedSprite(arcade.SpriteSolidColor):
+        moves = 0
+
+        @arcade.SpriteSolidColor.center_x.setter
+        def center_x(self, value):
+            TrackedSprite.moves += 1
+            arcade.SpriteSolidColor.center_x.fset(self, value)
+
+    sl.append(TrackedSprite(10, 10))
+    sl.move(1, 1)
+    assert TrackedSprite.moves == 1
+
+
+def test_rescale():
+    sprites = [arcade.SpriteSolidColor(10, 10, center_x=x) for x in (0, 10, 20)]
+    sl = arcade.SpriteList()
+    sl.extend(sprites)
+    sl.rescale(2.0)
+
+    # Every sprite is scaled relative to the original center
+    assert [sprite.center_x for sprite in sprites] == [-10, 10, 30]
+    assert all(sprite.width == 20 for sprite in sprites)
+    arcade.SpriteList().rescale(2.0)
+
+
+def test_velocity_columns():
+    sprites = [arcade.SpriteSolidColor(10, 10, center_x=i * 20) for i in range(10)]
+    sl = arcade.SpriteList()
+    sl.extend(sprites[:5])
+    sl.enable_velocity_columns()
+    sl.extend(sprites[5:])
+    other = arcade.SpriteList()
+    other.append(sprites[1])
+    for sprite in sprites:
+        sprite.velocity = 1, 2
+    sprites[1].change_angle = 3
+
+    # The buffer data moves, the sprites are synced when the list is accessed
+    sl.update()
+    assert sprites[1].position == (20, 0)
+    assert sl._sprite_pos_data[3:5].tolist() == [21, 2]
+    assert sl._sprite_angle_data[1] == 3
+    assert sl[1] is sprites[1]
+    assert sprites[1].position == (21, 2)
+    assert sprites[1].angle == 3
+    assert sprites[2].left == 36
+    assert other._sprite_pos_data[0:2].tolist() == [21, 2]
+
+    sl.move(-1, -2)
+    sl.sync_sprites()
+    assert [sprite.position for sprite in sprites] == [(i * 20, 0) for i in range(10)]
+
+    # Removed sprites keep their latest position
+    sl.update()
+    sl.remove(sprites[0])
+    assert sprites[0].position == (1, 2)
+    assert sprites[0].velocity == (1, 2)
+
+    # Lists with a spatial hash are synced right away
+    hashed = arcade.SpriteList(use_spatial_hash=True)
+    hashed.enable_velocity_columns()
+    hashed.extend(sprites[5:])
+    hashed.update()
+    assert arcade.get_sprites_at_point((100 + 2, 1 + 4), hashed) == [sprites[5]]
+
+    sl.disable_velocity_columns()
+    assert sl._sprite_velocity_data is None
+    with pytest.raises(ValueError):
+        arcade.SpriteList(pool=arcade.SpritePool()).enable_velocity_columns()
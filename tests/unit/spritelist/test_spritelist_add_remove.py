@@ -32,3 +32,53 @@ def test_add():
     assert sprite_1.sprite_lists == []
     assert sprite_2.sprite_lists == []
     assert sprite_3.sprite_lists == []
+
+
+def test_remove_deferred():
+    sl = arcade.SpriteList()
+    sprites = [arcade.SpriteSolidColor(width=16, height=16) for _ in range(5)]
+    sl.extend(sprites)
+
+    sl.remove(sprites[1])
+    sl.remove(sprites[3])
+    assert len(sl) == 3
+    assert sprites[1] not in sl
+    # Buffer slots are not reused before the list is compacted
+    assert len(sl._sprite_buffer_free_slots) == 0
+
+    assert list(sl) == [sprites[0], sprites[2], sprites[4]]
+    assert sl._sprite_index_slots == 3
+    assert sl._sprite_index_data[0:3].tolist() == [0, 2, 4]
+    assert sorted(sl._sprite_buffer_free_slots) == [1, 3]
+
+    # Removing and adding the same sprite back puts it last
+    sl.remove(sprites[0])
+    sl.append(sprites[0])
+    assert list(sl) == [sprites[2], sprites[4], sprites[0]]
+    assert sl._sprite_index_data[0:3].tolist() == [2, 4, sl.sprite_slot[sprites[0]]]
+
+
+def test_remove_many():
+    sl = arcade.SpriteList()
+    sprites = [arcade.SpriteSolidColor(width=16, height=16) for _ in range(10)]
+    sl.extend(sprites)
+
+    sl.remove_many(sprites[::2])
+    assert list(sl) == sprites[1::2]
+    assert sl._sprite_index_slots == 5
+    assert all(sprite.sprite_lists == [] for sprite in sprites[::2])
+
+
+def test_kill_where():
+    sl_1 = arcade.SpriteList()
+    sl_2 = arcade.SpriteList()
+    sprites = [arcade.SpriteSolidColor(width=16, height=16, center_x=i) for i in range(10)]
+    sl_1.extend(sprites)
+    sl_2.extend(sprites)
+
+    killed = sl_1.kill_where(lambda sprite: sprite.center_x >= 5)
+    assert killed == sprites[5:]
+    # Killed sprites are removed from all lists
+    assert list(sl_1) == sprites[:5]
+    assert list(sl_2) == sprites[:5]
+    assert sl_1.kill_where(lambda sprite: False) == []
@@ -125,3 +125,54 @@ def test_buffer_sizes(ctx: arcade.ArcadeContext):
 
     # Index buffer
     assert sp._sprite_index_buf.read() == struct.pack('4i', 0, 1, 2, 3)
+
+
+def test_partial_buffer_writes(ctx: arcade.ArcadeContext):
+    """Only the changed slots should be written, and the buffers should still match the arrays"""
+    sp = arcade.SpriteList(capacity=128)
+    sprites = [
+        arcade.SpriteSolidColor(10, 10, center_x=i, center_y=i) for i in range(100)
+    ]
+    sp.extend(sprites)
+    sp.write_sprite_buffers_to_gpu()
+    assert not sp._sprite_pos_dirty
+
+    # A few sprites spread across the list should be written as separate ranges
+    sprites[3].position = 1000, 2000
+    sprites[4].angle = 45
+    sprites[60].color = arcade.color.RED
+    sprites[99].width = 50
+    assert sp._sprite_pos_dirty == {3}
+    assert sp._sprite_angle_dirty == {4}
+    assert sp._sprite_color_dirty == {60}
+    assert sp._sprite_size_dirty == {99}
+
+    sp.write_sprite_buffers_to_gpu()
+    assert not sp._sprite_pos_dirty
+    assert not sp._sprite_angle_dirty
+    assert not sp._sprite_color_dirty
+    assert not sp._sprite_size_dirty
+
+    assert sp._sprite_pos_buf.read() == sp._sprite_pos_data.tobytes()
+    assert sp._sprite_size_buf.read() == sp._sprite_size_data.tobytes()
+    assert sp._sprite_angle_buf.read() == sp._sprite_angle_data.tobytes()
+    assert sp._sprite_color_buf.read() == sp._sprite_color_data.tobytes()
+    assert sp._sprite_texture_buf.read() == sp._sprite_texture_data.tobytes()
+
+    # Moving every sprite falls back to writing the whole buffer
+    for sprite in sprites:
+        sprite.center_x += 1
+    sp.write_sprite_buffers_to_gpu()
+    assert sp._sprite_pos_buf.read() == sp._sprite_pos_data.tobytes()
+
+
+def test_get_dirty_ranges():
+    from arcade.sprite_list.sprite_list import _get_dirty_ranges
+
+    assert _get_dirty_ranges(set(), 100) == []
+    assert _get_dirty_ranges({5}, 100) == [[5, 6]]
+    # Nearby slots are merged into one range
+    assert _get_dirty_ranges({1, 2, 10, 80}, 100) == [[1, 11], [80, 81]]
+    # Too many changes writes everything
+    assert _get_dirty_ranges(set(range(60)), 100) is None
+    assert _get_dirty_ranges(set(range(0, 10000, 100)), 10000) is None
@@ -28,3 +28,60 @@ def mock_draw(*args, **kwargs):
     # Alpha 0 should not be rendered
     sp.alpha = 0
     sp.draw()
+
+
+def test_chunked_culling(window, monkeypatch):
+    """Only the chunks visible to the camera should be drawn"""
+    sp = arcade.SpriteList()
+    for x in range(50):
+        for y in range(50):
+            sp.append(
+                arcade.SpriteSolidColor(
+                    64, 64, center_x=x * 64 + 32, center_y=y * 64 + 32, color=arcade.color.RED
+                )
+            )
+    sp.enable_chunked_culling(256)
+
+    # Build the chunks
+    window.clear()
+    sp.draw()
+    assert len(sp._chunks) == 13 * 13
+    assert arcade.get_pixel(10, 10) == (255, 0, 0)
+
+    drawn = []
+    original_render = Geometry.render
+    def render(self, program, *, first=0, vertices=None, **kwargs):
+        drawn.append((first, vertices))
+        original_render(self, program, first=first, vertices=vertices, **kwargs)
+    monkeypatch.setattr(Geometry, "render", render)
+
+    camera = arcade.Camera2D(position=(1000, 1000))
+    with camera.activate():
+        window.clear()
+        sp.draw()
+        # The center of the screen is still covered
+        assert arcade.get_pixel(400, 300) == (255, 0, 0)
+
+    visible = sum(vertices for _, vertices in drawn)
+    assert 0 < visible < len(sp) / 4
+    # Visible chunks on the same row are drawn together
+    assert len(drawn) <= 5
+
+    # Moving a sprite rebuilds the chunks
+    sp[0].center_x = 10_000
+    drawn.clear()
+    with camera.activate():
+        sp.draw()
+    assert sp._chunks is not None
+    assert sum(vertices for _, vertices in drawn) == visible
+
+    # Camera far away from all sprites draws nothing
+    drawn.clear()
+    with arcade.Camera2D(position=(-5000, -5000)).activate():
+        sp.draw()
+    assert drawn == []
+
+    sp.disable_chunked_culling()
+    drawn.clear()
+    sp.draw()
+    assert drawn == [(0, len(sp))]
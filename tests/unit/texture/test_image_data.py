@@ -1,3 +1,5 @@
+import gc
+import pytest
 from arcade.texture import ImageData
 from PIL import Image
 
@@ -50,3 +52,63 @@ def test_uniqueness():
     assert len({data_1, data_2, data_3}) == 2
     assert len({data_2, data_3}) == 2
     assert len({data_1, data_2}) == 1
+
+
+def test_create_blake2b():
+    ImageData.hash_func = "blake2b"
+    try:
+        data = ImageData(Image.new("RGBA", (10, 20), (0, 0, 0, 0)))
+        assert len(data.hash) == 128
+        assert data == ImageData(Image.new("RGBA", (10, 20), (0, 0, 0, 0)))
+    finally:
+        ImageData.hash_func = "sha256"
+
+
+def test_create_xxhash():
+    pytest.importorskip("xxhash")
+    ImageData.hash_func = "xxh3_64"
+    try:
+        data = ImageData(Image.new("RGBA", (10, 20), (0, 0, 0, 0)))
+        assert len(data.hash) == 16
+        assert data == ImageData(Image.new("RGBA", (10, 20), (0, 0, 0, 0)))
+    finally:
+        ImageData.hash_func = "sha256"
+
+
+def test_sampled():
+    ImageData.hash_func = "sampled"
+    try:
+        # Large images where only a few bytes are part of the sample
+        img_1 = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
+        img_2 = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
+        img_3 = img_1.copy()
+        img_3.putpixel((0, 0), (0, 0, 1, 0))
+        data_1 = ImageData(img_1)
+        data_2 = ImageData(img_2)
+        data_3 = ImageData(img_3)
+
+        # Same pixels give the same hash, a different pixel a different one
+        assert data_1.hash.startswith("RGBA|256x256|")
+        assert data_1 == data_2
+        assert data_1 != data_3
+        assert data_3.hash.startswith(data_1.hash)
+        # Different sizes never share a hash
+        assert ImageData(Image.new("RGBA", (128, 512), (0, 0, 0, 0))) != data_1
+    finally:
+        ImageData.hash_func = "sha256"
+
+
+def test_sampled_first_image_gone():
+    """The sample hash is not reused for other pixels after the first image is gone"""
+    ImageData.hash_func = "sampled"
+    try:
+        img_1 = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
+        img_2 = img_1.copy()
+        img_2.putpixel((0, 0), (0, 0, 1, 0))
+        key = ImageData.calculate_hash(img_1)
+        del img_1
+        gc.collect()
+
+        assert ImageData.calculate_hash(img_2).startswith(f"{key}|")
+    finally:
+        ImageData.hash_func = "sha256"
@@ -62,3 +62,44 @@ def test_load_or_get_texture():
     manager.flush()
     assert len(manager.texture_cache._file_entries) == 0
     assert len(manager.texture_cache._entries) == 0
+
+
+def test_load_textures():
+    """Load several textures in parallel and test caching"""
+    manager = arcade.texture.TextureCacheManager()
+    paths = [TEST_TEXTURE, SPRITESHEET_PATH, TEST_TEXTURE]
+    textures = manager.load_textures(paths, workers=2)
+    assert len(textures) == 3
+    assert textures[0] is textures[2]
+    assert textures[0].file_path == arcade.resources.resolve(TEST_TEXTURE)
+    assert len(manager.image_data_cache) == 2
+    assert len(manager.texture_cache._entries) == 2
+    assert len(manager.hit_box_cache) == 2
+    assert manager.hit_box_cache.get(textures[1]) == tuple(textures[1].hit_box_points)
+
+    # The same textures are returned by the other loading methods
+    assert manager.load_or_get_texture(SPRITESHEET_PATH) is textures[1]
+    assert manager.load_textures([SPRITESHEET_PATH]) == [textures[1]]
+
+
+def test_cache_path(tmp_path):
+    """Image hashes and hit boxes are reused from the persistent cache"""
+    manager = arcade.texture.TextureCacheManager(cache_path=tmp_path)
+    assert manager.cache_path == tmp_path
+    texture = manager.load_or_get_texture(TEST_TEXTURE)
+    assert len(manager.disk_cache) == 1
+
+    # A new manager using the same directory finds the stored hash and hit box
+    manager = arcade.texture.TextureCacheManager(cache_path=tmp_path)
+    path = arcade.resources.resolve(TEST_TEXTURE)
+    info = manager.disk_cache.get_image_info(path, arcade.texture.ImageData.hash_func)
+    assert info == (texture.image_data.hash, texture.width, texture.height)
+    assert manager.disk_cache.get_hit_box(texture.cache_name) == tuple(
+        tuple(float(value) for value in point) for point in texture.hit_box_points
+    )
+    assert manager.load_textures([TEST_TEXTURE])[0].image_data.hash == texture.image_data.hash
+
+    manager.flush(disk=True)
+    assert len(manager.disk_cache) == 0
+    manager.cache_path = None
+    assert manager.disk_cache is None
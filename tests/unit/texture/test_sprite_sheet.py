@@ -132,3 +132,33 @@ def test_get_texture_grid(sprite_sheet):
         assert texture.image.size == (8, 16)
     
     assert textures[36].image.tobytes() == get_dollar_sign(sprite_sheet).tobytes()
+
+
+def test_get_texture_grid_hashes(sprite_sheet):
+    """Cells are hashed by content unless hashing by position"""
+    kwargs = dict(size=(8, 16), margin=(0, 1, 0, 0), columns=32, count=64)
+    textures = sprite_sheet.get_texture_grid(**kwargs)
+    for texture in textures:
+        assert texture.image_data.hash == arcade.texture.ImageData.calculate_hash(texture.image)
+    # Cells with the same pixels share a hash
+    assert len({texture.image_data.hash for texture in textures}) < 64
+
+    textures = sprite_sheet.get_texture_grid(**kwargs, hash_by_position=True)
+    assert len({texture.image_data.hash for texture in textures}) == 64
+    assert textures[33].image_data.hash.endswith("|9,16,8,16")
+
+
+@pytest.mark.parametrize(
+    "algorithm", [arcade.hitbox.algo_simple, arcade.hitbox.algo_bounding_box]
+)
+def test_get_texture_grid_hit_boxes(sprite_sheet, algorithm):
+    """Hit boxes calculated for the whole grid match the ones for each texture."""
+    textures = sprite_sheet.get_texture_grid(
+        size=(8, 16),
+        margin=(0, 1, 0, 0),
+        columns=32,
+        count=64,
+        hit_box_algorithm=algorithm,
+    )
+    for texture in textures:
+        assert texture.hit_box_points == algorithm.calculate(texture.image)
@@ -110,7 +110,11 @@
         "use_declarations_in": [
             "arcade.sprite_list",
             "arcade.sprite_list.sprite_list",
+            "arcade.sprite_list.sprite_pool",
+            "arcade.sprite_list.sprite_store",
+            "arcade.sprite_list.broad_phase",
             "arcade.sprite_list.spatial_hash",
+            "arcade.sprite_list.aabb_tree",
             "arcade.sprite_list.collision"
         ]
     },
@@ -361,6 +365,7 @@
             "arcade.cache.hit_box",
             "arcade.cache.texture",
             "arcade.cache.image_data",
+            "arcade.cache.disk",
         ],
     },
     "future.rst": {